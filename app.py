@@ -6,6 +6,7 @@ from app import create_app
 config_name = os.environ.get('FLASK_ENV', 'development')
 app = create_app(config_name)
 
+# 개발 서버 (운영은 gunicorn wsgi:app)
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5005))
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=port, debug=app.config['DEBUG'])
\ No newline at end of file
@@ -3,11 +3,9 @@ import os
 from flask import Flask, session, request, g
 from flask_login import LoginManager, current_user
 from flask_migrate import Migrate
-from app.extensions import db, migrate, login_manager
-from sqlalchemy import text
+from app.extensions import db, migrate, login_manager, notification_broker, notification_dispatcher
 import uuid
 import logging
-import pymysql
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -19,6 +17,8 @@ def create_app(config_name='development'):
     # 설정 로드
     if config_name == 'production':
         app.config.from_object('config.ProductionConfig')
+    elif config_name == 'testing':
+        app.config.from_object('config.TestingConfig')
     else:
         app.config.from_object('config.DevelopmentConfig')
     
@@ -31,14 +31,33 @@ def create_app(config_name='development'):
     migrate.init_app(app, db)
     login_manager.init_app(app)
     login_manager.login_view = 'auth.auth_page'
+    notification_broker.init_app(app)
+    notification_dispatcher.init_app(app)
     
-    # 유저 로더 설정
-    from app.models import User
+    # fork 이후 연결 풀 재생성
+    from app import database
+    database.init_app(app)
+    
+    # 읽기 복제본 라우팅 (쓰기 후 primary에서 읽기)
+    from app import routing
+    routing.init_app(app, db)
+    
+    # 상태 확인(/health, /ready) 및 운영 지표(/metrics)
+    from app import metrics
+    metrics.init_app(app)
+    
+    # 요청 프로파일링 및 느린 요청 기록
+    from app import profiling
+    profiling.init_app(app)
+    
+    # 유저 로더 설정 (사용자 캐시 사용)
+    from app import identity
+    identity.init_app(app)
     
     @login_manager.user_loader
     def load_user(user_id):
         try:
-            return User.query.get(int(user_id))
+            return identity.load_user(int(user_id))
         except Exception as e:
             logger.error(f"사용자 로딩 중 오류: {e}")
             return None
@@ -67,52 +86,31 @@ def create_app(config_name='development'):
         logger.error(f"500 오류 발생: {error}")
         return "서버 내부 오류가 발생했습니다.", 500
     
-    # 블루프린트 등록
-    with app.app_context():
-        # 블루프린트 불러오기
-        from app.auth import auth as auth_blueprint
-        from app.main import main as main_blueprint
-        from app.social import social as social_blueprint
-        from app.api import api as api_blueprint
-        
-        # 블루프린트 등록
-        app.register_blueprint(auth_blueprint, url_prefix='/auth')
-        app.register_blueprint(main_blueprint)
-        app.register_blueprint(social_blueprint, url_prefix='/social')
-        app.register_blueprint(api_blueprint, url_prefix='/api')
-        
-        logger.info("모든 블루프린트가 성공적으로 등록되었습니다")
-    
-        # 데이터베이스 초기화 (MySQL 전용)
-        try:
-            # 데이터베이스 연결 테스트
-            with db.engine.connect() as conn:
-                result = conn.execute(text('SELECT 1'))
-                result.fetchone()
-            logger.info("MySQL 데이터베이스 연결 성공")
-            
-            # 테이블 생성
-            engine = db.engine
-            inspector = db.inspect(engine)
-            existing_tables = inspector.get_table_names()
-            
-            if 'user' not in existing_tables:
-                logger.info("데이터베이스 테이블 생성 시작...")
-                db.create_all()
-                logger.info("데이터베이스 테이블이 성공적으로 생성되었습니다")
-                
-                # 기본 사용자 생성
-                from app.utils import create_default_user
-                try:
-                    create_default_user()
-                except Exception as e:
-                    logger.error(f"기본 사용자 생성 중 오류: {e}")
-            else:
-                logger.info("데이터베이스 테이블이 이미 존재합니다.")
-                
-        except Exception as e:
-            logger.error(f"MySQL 데이터베이스 연결 실패: {e}")
-            logger.error("애플리케이션을 시작할 수 없습니다. MySQL 연결을 확인해주세요.")
-            raise e  # SQLite 폴백 대신 오류 발생시켜 문제 해결 강제
+    # 블루프린트 등록 (앱 생성 시 DB에 접속하지 않음, 스키마 생성은 flask init-db)
+    from app.auth import auth as auth_blueprint
+    from app.main import main as main_blueprint
+    from app.social import social as social_blueprint
+    from app.api import api as api_blueprint
+    
+    app.register_blueprint(auth_blueprint, url_prefix='/auth')
+    app.register_blueprint(main_blueprint)
+    app.register_blueprint(social_blueprint, url_prefix='/social')
+    app.register_blueprint(api_blueprint, url_prefix='/api')
+    
+    # CLI 명령 등록
+    from app.database import init_db_command
+    from app.timeline import rebuild_timeline_command
+    from app.sync import compact_tombstones_command
+    from app.stats import rebuild_todo_stats_command
+    from app.follows import reconcile_follow_counts_command
+    from app.recommendations import refresh_recommendations_command
+    from app.search import rebuild_search_index_command
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(rebuild_timeline_command)
+    app.cli.add_command(compact_tombstones_command)
+    app.cli.add_command(rebuild_todo_stats_command)
+    app.cli.add_command(reconcile_follow_counts_command)
+    app.cli.add_command(refresh_recommendations_command)
+    app.cli.add_command(rebuild_search_index_command)
     
     return app
\ No newline at end of file
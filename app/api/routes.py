@@ -1,36 +1,48 @@
 # app/api/routes.py
-from flask import jsonify, request, session
+from flask import jsonify, request, session, current_app, Response
 from flask_login import current_user, login_required
+from sqlalchemy import or_, and_, select
 from app import db
+from app.extensions import notification_broker, notification_dispatcher
 from app.models import Todo, Category, Notification, User
 from app.api import api
+from app.utils import parse_page_size, encode_cursor, decode_cursor, parse_notification_ids, set_notifications_read, \
+    notification_page, parse_notification_page_args, split_notification_page
+from app import timeline, sync, versions, stats, identity, recommendations, search, serializers, categories
+from app.routing import read_replica
 import datetime
+import json
+from collections import defaultdict
+import time
 import logging
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
-# 세션에서 사용자 정보 가져오기
+# 세션에서 사용자 정보 가져오기 (요청당 한 번만 확인)
 def get_user_info():
-    user_id = session.get('user_id')
-    anonymous_id = session.get('anonymous_id')
-    
-    print(f"세션 정보: {session}")
-    
-    if current_user.is_authenticated:
-        print(f"인증된 사용자: {current_user.id}")
-        return current_user.id, None, current_user
-    
-    if user_id:
-        user = User.query.get(user_id)
-        if user:
-            print(f"인증된 사용자: {user.id}")
-            return user_id, None, user
-        else:
-            print(f"세션의 사용자 ID가 유효하지 않음: {user_id}")
-    
-    print(f"비인증 사용자 - anonymous_id: {anonymous_id}, user_id: {user_id}")
-    return user_id, anonymous_id, None
+    return identity.resolve()
+
+# 프로필 응답 필드 (id 제외)
+PROFILE_FIELDS = ('username', 'nickname', 'email', 'bio', 'profile_image', 'followers_count', 'following_count')
+
+def _profile_row(user_id):
+    """프로필 버전과 프로필 딕셔너리를 SELECT 한 번으로 조회 (사용자가 없으면 (0, None))
+
+    팔로워/팔로잉 수 등은 다른 워커에서 바뀔 수 있으므로 워커별 사용자 캐시가 아닌 DB 값을 사용.
+    """
+    table = User.__table__
+    row = db.session.execute(
+        select(versions.version_column(user_id, versions.SCOPE_PROFILE),
+               *[table.c[field] for field in PROFILE_FIELDS])
+            .where(table.c.id == user_id)
+    ).one_or_none()
+    if row is None:
+        return 0, None
+
+    profile_data = dict(zip(PROFILE_FIELDS, row[1:]), id=user_id)
+    profile_data['nickname'] = profile_data['nickname'] or profile_data['username']
+    return row[0], profile_data
 
 # 사용자 프로필 API 엔드포인트
 @api.route('/user/profile', methods=['GET'])
@@ -42,22 +54,17 @@ def get_user_profile():
         if not user_id or not user:
             return jsonify({'error': '로그인이 필요합니다.'}), 401
         
-        # 팔로워/팔로잉 수 계산
-        followers_count = user.followers.count() if hasattr(user, 'followers') else 0
-        following_count = user.followed.count() if hasattr(user, 'followed') else 0
-        
-        profile_data = {
-            'id': user.id,
-            'username': user.username,
-            'nickname': user.nickname or user.username,
-            'email': user.email,
-            'bio': user.bio,
-            'profile_image': user.profile_image,
-            'followers_count': followers_count,
-            'following_count': following_count
-        }
+        # 버전과 프로필을 같은 문에서 읽어 ETag와 본문이 항상 일치
+        version, profile_data = _profile_row(user.id)
+        if profile_data is None:
+            return jsonify({'error': '로그인이 필요합니다.'}), 401
         
-        return jsonify(profile_data)
+        # 변경이 없으면 304
+        etag, not_modified = versions.request_etag(user.id, versions.SCOPE_PROFILE, version)
+        if not_modified:
+            return versions.not_modified(etag)
+        
+        return versions.with_etag(jsonify(profile_data), etag)
     except Exception as e:
         logger.error(f"프로필 조회 중 오류: {str(e)}")
         return jsonify({'error': '사용자 정보를 가져오는 중 오류가 발생했습니다.'}), 500
@@ -79,23 +86,13 @@ def update_user_profile():
         if 'bio' in data:
             user.bio = data['bio']
         
+        versions.bump(user.id, versions.SCOPE_PROFILE)
         db.session.commit()
+        identity.invalidate(user.id)
         logger.info(f"프로필 업데이트 성공: {user.username}")
         
         # 업데이트된 프로필 데이터 반환
-        followers_count = user.followers.count() if hasattr(user, 'followers') else 0
-        following_count = user.followed.count() if hasattr(user, 'followed') else 0
-        
-        profile_data = {
-            'id': user.id,
-            'username': user.username,
-            'nickname': user.nickname or user.username,
-            'email': user.email,
-            'bio': user.bio,
-            'profile_image': user.profile_image,
-            'followers_count': followers_count,
-            'following_count': following_count
-        }
+        version, profile_data = _profile_row(user.id)
         
         return jsonify(profile_data)
     except Exception as e:
@@ -105,22 +102,244 @@ def update_user_profile():
 
 # Todo API 엔드포인트
 @api.route('/todos', methods=['GET'])
+@read_replica
 def get_todos():
-    """사용자의 할 일 목록 가져오기"""
+    """사용자의 할 일 목록 가져오기
+    
+    쿼리 파라미터 (모두 선택):
+    - from / to: 날짜 범위 (YYYY-MM-DD, 양 끝 포함)
+    - limit / cursor: (date, id) 키셋 페이지네이션, 다음 커서는 X-Next-Cursor 헤더로 반환
+    - fields: 반환할 필드 목록 (쉼표 구분, 예: id,title,date)
+    """
     try:
         user_id, anonymous_id, user = get_user_info()
         
-        if user_id:
-            todos = Todo.query.filter_by(user_id=user_id).all()
-            print(f"조회된 할 일 수: {len(todos)}")
-            return jsonify([todo.to_dict() for todo in todos])
-        
-        return jsonify([])
+        if not user_id:
+            return jsonify([])
+        
+        # 변경이 없으면 304 (ETag는 쿼리 문자열별로 다름)
+        etag, not_modified = versions.request_etag(user_id, versions.SCOPE_TODOS)
+        if not_modified:
+            return versions.not_modified(etag)
+        
+        try:
+            date_from = _parse_query_date(request.args.get('from'))
+            date_to = _parse_query_date(request.args.get('to'))
+            limit = parse_page_size(request.args.get('limit'), None,
+                                    current_app.config['TODOS_MAX_PAGE_SIZE'])
+            cursor = request.args.get('cursor')
+            after = decode_cursor(cursor) if cursor else None
+            fields = _parse_todo_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # 커서만 주어진 경우에도 기본 페이지 크기 적용
+        if after and not limit:
+            limit = current_app.config['TODOS_PAGE_SIZE']
+        
+        # 응답 필드와 커서 생성에 필요한 date, id만 조회 (ORM 객체를 만들지 않음)
+        statement, fields = serializers.todo_select(fields, extra=('id', 'date'))
+        statement = statement.where(Todo.user_id == user_id)
+        if date_from:
+            statement = statement.where(Todo.date >= date_from)
+        if date_to:
+            statement = statement.where(Todo.date < date_to + datetime.timedelta(days=1))
+        if after:
+            after_date, after_id = after
+            statement = statement.where(or_(
+                Todo.date > after_date,
+                and_(Todo.date == after_date, Todo.id > after_id)
+            ))
+        
+        statement = statement.order_by(Todo.date, Todo.id)
+        if not limit and current_app.config['STREAM_RESPONSES']:
+            # 전체 목록은 서버 측 커서로 묶음씩 읽어 나눠 전송 (큰 계정도 워커 메모리가 묶음 크기로 제한됨)
+            batch_size = current_app.config['STREAM_BATCH_SIZE']
+            result = db.session.execute(statement.execution_options(stream_results=True,
+                                                                    max_row_buffer=batch_size))
+            response = serializers.rows_response(result, lambda rows: serializers.todo_dicts(rows, fields), batch_size)
+            return versions.with_etag(response, etag)
+        if limit:
+            statement = statement.limit(limit + 1)
+        rows = db.session.execute(statement).all()
+        logger.debug(f"조회된 할 일 수: {len(rows)}")
+        
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].date, rows[-1].id)
+        
+        response = serializers.json_response(serializers.todo_dicts(rows, fields))
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return versions.with_etag(response, etag)
     except Exception as e:
         logger.error(f"할 일 조회 중 오류 발생: {str(e)}")
         db.session.rollback()
         return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
 
+@api.route('/todos/search', methods=['GET'])
+@read_replica
+def search_todos():
+    """할 일 전문 검색 (제목, 설명)
+    
+    쿼리 파라미터:
+    - q: 검색어 (필수, 공백으로 나눈 모든 단어를 포함하는 할 일을 관련도 순으로)
+    - from / to: 날짜 범위 (YYYY-MM-DD, 양 끝 포함)
+    - category_id: 카테고리 ID (none이면 카테고리 없는 할 일)
+    - completed: true/false
+    - limit / offset: 페이지네이션, 다음 페이지의 offset은 X-Next-Offset 헤더로 반환
+    """
+    try:
+        user_id, anonymous_id, user = get_user_info()
+        
+        if not user_id:
+            return jsonify([])
+        
+        etag, not_modified = versions.request_etag(user_id, versions.SCOPE_TODOS)
+        if not_modified:
+            return versions.not_modified(etag)
+        
+        config = current_app.config
+        q = (request.args.get('q') or '').strip()
+        if not q:
+            return jsonify({'error': '검색어를 입력해주세요.'}), 400
+        if len(q) > config['TODOS_SEARCH_MAX_QUERY_LENGTH']:
+            return jsonify({'error': f"검색어는 {config['TODOS_SEARCH_MAX_QUERY_LENGTH']}자 이하여야 합니다."}), 400
+        
+        try:
+            date_from = _parse_query_date(request.args.get('from'))
+            date_to = _parse_query_date(request.args.get('to'))
+            limit = parse_page_size(request.args.get('limit'),
+                                    config['TODOS_SEARCH_PAGE_SIZE'],
+                                    config['TODOS_SEARCH_MAX_PAGE_SIZE'])
+            offset = _parse_query_int(request.args.get('offset') or 0, 'offset은 정수여야 합니다.')
+            if offset < 0 or offset > config['TODOS_SEARCH_MAX_OFFSET']:
+                raise ValueError(f"offset은 0 이상 {config['TODOS_SEARCH_MAX_OFFSET']} 이하여야 합니다.")
+            category_id = request.args.get('category_id')
+            if category_id and category_id != 'none':
+                category_id = _parse_query_int(category_id, '잘못된 카테고리 ID입니다.')
+            completed = request.args.get('completed')
+            if completed is not None and completed not in ('true', 'false'):
+                raise ValueError('completed는 true 또는 false여야 합니다.')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        query = search.search_query(user_id, search.split_terms(q))
+        if date_from:
+            query = query.filter(Todo.date >= date_from)
+        if date_to:
+            query = query.filter(Todo.date < date_to + datetime.timedelta(days=1))
+        if category_id == 'none':
+            query = query.filter(Todo.category_id == None)
+        elif category_id:
+            query = query.filter(Todo.category_id == category_id)
+        if completed is not None:
+            query = query.filter(Todo.completed == (completed == 'true'))
+        
+        columns, fields = serializers.todo_select()
+        rows = query.with_entities(*columns.selected_columns).offset(offset).limit(limit + 1).all()
+        
+        next_offset = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_offset = offset + limit
+        
+        response = serializers.json_response(serializers.todo_dicts(rows, fields))
+        if next_offset is not None and next_offset <= config['TODOS_SEARCH_MAX_OFFSET']:
+            response.headers['X-Next-Offset'] = str(next_offset)
+        return versions.with_etag(response, etag)
+    except Exception as e:
+        logger.error(f"할 일 검색 중 오류 발생: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
+
+def _parse_query_date(value):
+    """YYYY-MM-DD 형식의 쿼리 파라미터를 datetime으로 변환"""
+    if not value:
+        return None
+    try:
+        return datetime.datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError('날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식이어야 합니다.')
+
+def _parse_query_int(value, message):
+    """정수 쿼리 파라미터 변환, 정수가 아니면 message로 ValueError"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(message)
+
+def _parse_todo_fields(value):
+    """fields 파라미터를 검증하고 필드 목록으로 변환"""
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in Todo.SERIALIZABLE_FIELDS]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+    return fields or None
+
+# 할 일 생성/수정 요청에서 변경 가능한 필드
+TODO_UPDATABLE_FIELDS = ('title', 'description', 'date', 'category_id', 'pinned', 'completed', 'is_public')
+
+def _parse_todo_date(value):
+    """요청 본문의 날짜 값 변환 (YYYY-MM-DD 문자열), 잘못된 형식은 ValueError"""
+    if isinstance(value, str):
+        try:
+            return datetime.datetime.strptime(value, '%Y-%m-%d')
+        except ValueError:
+            raise ValueError('날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식이어야 합니다.')
+    return value
+
+# true/false만 허용하는 필드
+TODO_BOOLEAN_FIELDS = ('pinned', 'completed', 'is_public')
+
+def _check_todo_value(field, value):
+    """할 일 필드 값 검증 후 컬럼 값 반환, 잘못된 값은 ValueError"""
+    if field == 'title':
+        if not isinstance(value, str) or not value:
+            raise ValueError('제목은 필수입니다.')
+    elif field == 'description':
+        if value is not None and not isinstance(value, str):
+            raise ValueError('설명은 문자열이어야 합니다.')
+    elif field == 'date':
+        if not isinstance(value, str):
+            raise ValueError('날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식이어야 합니다.')
+        return _parse_todo_date(value)
+    elif field == 'category_id':
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+            raise ValueError('잘못된 카테고리 ID입니다.')
+    elif field in TODO_BOOLEAN_FIELDS:
+        if not isinstance(value, bool):
+            raise ValueError(f'{field} 값은 true 또는 false여야 합니다.')
+    return value
+
+def _todo_create_values(data):
+    """할 일 생성 요청 검증 후 컬럼 값 반환, 잘못된 요청은 ValueError"""
+    if not isinstance(data, dict):
+        raise ValueError('잘못된 요청 형식입니다.')
+    # 필수 필드 검증
+    if not data.get('title'):
+        raise ValueError('제목은 필수입니다.')
+    
+    values = {
+        'title': data.get('title'),
+        'description': data.get('description', ''),
+        'date': data.get('date', datetime.date.today().isoformat()),
+        'category_id': data.get('category_id'),
+        'pinned': data.get('pinned', False),
+        'completed': data.get('completed', False),
+        'is_public': data.get('is_public', False)
+    }
+    return {field: _check_todo_value(field, value) for field, value in values.items()}
+
+def _todo_update_values(data):
+    """할 일 수정 요청 검증 후 변경할 컬럼 값 반환, 잘못된 요청은 ValueError"""
+    if not isinstance(data, dict):
+        raise ValueError('잘못된 요청 형식입니다.')
+    return {field: _check_todo_value(field, data[field]) for field in TODO_UPDATABLE_FIELDS if field in data}
+
 @api.route('/todos', methods=['POST'])
 def create_todo():
     """새로운 할 일 생성"""
@@ -128,33 +347,21 @@ def create_todo():
         data = request.json
         user_id, anonymous_id, user = get_user_info()
         
-        # 필수 필드 검증
-        if not data.get('title'):
-            return jsonify({'error': '제목은 필수입니다.'}), 400
-        
-        # 날짜 처리
-        date_str = data.get('date', datetime.date.today().isoformat())
-        if isinstance(date_str, str):
-            try:
-                date = datetime.datetime.strptime(date_str, '%Y-%m-%d')
-            except ValueError:
-                return jsonify({'error': '날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식이어야 합니다.'}), 400
-        else:
-            date = date_str
+        try:
+            values = _todo_create_values(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         # Todo 객체 생성
-        todo = Todo(
-            title=data.get('title'),
-            description=data.get('description', ''),
-            date=date,
-            category_id=data.get('category_id'),
-            pinned=data.get('pinned', False),
-            completed=data.get('completed', False),
-            is_public=data.get('is_public', False),
-            user_id=user_id
-        )
+        todo = Todo(user_id=user_id, **values)
         
         db.session.add(todo)
+        db.session.flush()
+        
+        # 공개 할 일은 팔로워 타임라인에 기록
+        timeline.fan_out_todo(todo)
+        stats.apply(user_id, stats.add_todo({}, todo))
+        versions.bump(user_id, versions.SCOPE_TODOS)
         db.session.commit()
         
         return jsonify(todo.to_dict()), 201
@@ -176,28 +383,25 @@ def update_todo(todo_id):
         if not todo:
             return jsonify({'error': '할 일을 찾을 수 없습니다.'}), 404
         
-        # 데이터 업데이트
-        if 'title' in data:
-            todo.title = data['title']
-        if 'description' in data:
-            todo.description = data['description']
-        if 'date' in data:
-            if isinstance(data['date'], str):
-                try:
-                    todo.date = datetime.datetime.strptime(data['date'], '%Y-%m-%d')
-                except ValueError:
-                    return jsonify({'error': '날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식이어야 합니다.'}), 400
-            else:
-                todo.date = data['date']
-        if 'category_id' in data:
-            todo.category_id = data['category_id']
-        if 'pinned' in data:
-            todo.pinned = data['pinned']
-        if 'completed' in data:
-            todo.completed = data['completed']
-        if 'is_public' in data:
-            todo.is_public = data['is_public']
+        try:
+            values = _todo_update_values(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
+        # 데이터 업데이트
+        was_public = todo.is_public
+        stats_delta = stats.add_todo({}, todo, -1)
+        for field, value in values.items():
+            setattr(todo, field, value)
+        stats.apply(user_id, stats.add_todo(stats_delta, todo))
+        
+        # 공개 상태가 바뀌면 팔로워 타임라인 갱신
+        if todo.is_public and not was_public:
+            timeline.fan_out_todo(todo)
+        elif was_public and not todo.is_public:
+            timeline.remove_todo(todo.id)
+        
+        versions.bump(user_id, versions.SCOPE_TODOS)
         db.session.commit()
         
         return jsonify(todo.to_dict())
@@ -218,6 +422,11 @@ def delete_todo(todo_id):
         if not todo:
             return jsonify({'error': '할 일을 찾을 수 없습니다.'}), 404
         
+        if todo.is_public:
+            timeline.remove_todo(todo.id)
+        sync.record_deletions(user_id, sync.ENTITY_TODO, [todo.id])
+        stats.apply(user_id, stats.add_todo({}, todo, -1))
+        versions.bump(user_id, versions.SCOPE_TODOS)
         db.session.delete(todo)
         db.session.commit()
         
@@ -241,6 +450,7 @@ def toggle_pin(todo_id):
         
         # 핀 상태 토글
         todo.pinned = not todo.pinned
+        versions.bump(user_id, versions.SCOPE_TODOS)
         db.session.commit()
         
         return jsonify(todo.to_dict())
@@ -249,19 +459,228 @@ def toggle_pin(todo_id):
         db.session.rollback()
         return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
 
+def _insert_todos(user_id, rows, now):
+    """할 일 여러 개를 INSERT 한 번으로 생성 후 요청 순서대로 to_dict() 형식 목록 반환
+
+    여러 행 INSERT는 생성된 ID를 돌려주지 않으므로 기록 전 최대 ID 이후의 이 사용자 할 일 중
+    created_at이 now인 행을 다시 조회해 순서대로 대응시킴 (같은 초에 다른 요청이 만든 할 일은 값으로 구분).
+    """
+    if not rows:
+        return []
+
+    table = Todo.__table__
+    watermark = db.session.query(db.func.max(Todo.id)).scalar() or 0
+    db.session.execute(table.insert().values([
+        dict(values, user_id=user_id, created_at=now, updated_at=now) for values in rows
+    ]))
+
+    statement, fields = serializers.todo_select()
+    inserted = db.session.execute(
+        statement.where(table.c.user_id == user_id, table.c.id > watermark, table.c.created_at == now)
+                 .order_by(table.c.id)
+    ).all()
+
+    # ID 순서는 INSERT 행 순서와 같음, 다른 요청의 행은 건너뜀
+    matched, remaining = [], iter(inserted)
+    for values in rows:
+        for row in remaining:
+            if all(getattr(row, field) == value for field, value in values.items()):
+                matched.append(row)
+                break
+        else:
+            raise RuntimeError('생성한 할 일을 다시 조회하지 못했습니다.')
+    return serializers.todo_dicts(matched, fields)
+
+@api.route('/todos/batch', methods=['POST'])
+def batch_todos():
+    """여러 할 일 작업을 하나의 트랜잭션으로 처리
+    
+    요청 본문:
+    {"operations": [{"op": "create", "data": {...}},
+                    {"op": "update", "id": 1, "data": {...}},
+                    {"op": "delete", "id": 2},
+                    {"op": "toggle_pin", "id": 3}]}
+    
+    같은 값으로 바뀌는 수정은 UPDATE 한 번, 삭제는 DELETE 한 번, 생성은 INSERT 한 번으로 묶어서 실행.
+    하나라도 잘못된 작업이 있으면 아무것도 적용하지 않고 400과 작업별 오류를 반환.
+    """
+    try:
+        data = request.json or {}
+        user_id, anonymous_id, user = get_user_info()
+        
+        operations = data.get('operations')
+        if not isinstance(operations, list) or not operations:
+            return jsonify({'error': '작업 목록이 필요합니다.'}), 400
+        
+        max_operations = current_app.config['TODOS_BATCH_MAX_OPERATIONS']
+        if len(operations) > max_operations:
+            return jsonify({'error': f'한 번에 최대 {max_operations}개의 작업만 처리할 수 있습니다.'}), 400
+        
+        # 1. 작업 검증
+        creates = []   # (index, values)
+        targets = []   # (index, op, todo_id, values)
+        errors = []
+        target_ids = set()
+        for index, operation in enumerate(operations):
+            try:
+                if not isinstance(operation, dict):
+                    raise ValueError('잘못된 작업 형식입니다.')
+                
+                op = operation.get('op')
+                if op == 'create':
+                    creates.append((index, _todo_create_values(operation.get('data') or {})))
+                    continue
+                if op not in ('update', 'delete', 'toggle_pin'):
+                    raise ValueError(f'알 수 없는 작업입니다: {op}')
+                
+                todo_id = operation.get('id')
+                if not isinstance(todo_id, int):
+                    raise ValueError('할 일 ID가 필요합니다.')
+                if todo_id in target_ids:
+                    raise ValueError('같은 할 일에 대한 작업은 한 번만 요청할 수 있습니다.')
+                target_ids.add(todo_id)
+                
+                values = _todo_update_values(operation.get('data') or {}) if op == 'update' else None
+                targets.append((index, op, todo_id, values))
+            except ValueError as e:
+                errors.append({'index': index, 'status': 400, 'error': str(e)})
+        
+        # 대상 할 일 한 번에 조회
+        todos = {}
+        if target_ids:
+            todos = {todo.id: todo for todo in
+                     Todo.query.filter(Todo.id.in_(target_ids), Todo.user_id == user_id).all()}
+        for index, op, todo_id, values in targets:
+            if todo_id not in todos:
+                errors.append({'index': index, 'status': 404, 'error': '할 일을 찾을 수 없습니다.'})
+        
+        if errors:
+            return jsonify({
+                'error': '잘못된 작업이 있어 아무것도 적용되지 않았습니다.',
+                'results': sorted(errors, key=lambda result: result['index'])
+            }), 400
+        
+        # 2. 수정/핀 토글 - 같은 값으로 바뀌는 할 일끼리 묶어 UPDATE
+        now = datetime.datetime.utcnow().replace(microsecond=0)
+        was_public = {todo_id: todo.is_public for todo_id, todo in todos.items()}
+        stats_delta = {}
+        for todo in todos.values():
+            stats.add_todo(stats_delta, todo, -1)
+        update_groups = defaultdict(list)
+        delete_ids = []
+        for index, op, todo_id, values in targets:
+            if op == 'delete':
+                delete_ids.append(todo_id)
+                continue
+            if op == 'toggle_pin':
+                values = {'pinned': not todos[todo_id].pinned}
+            if values:
+                update_groups[tuple(sorted(values.items()))].append(todo_id)
+        
+        for values, todo_ids in update_groups.items():
+            Todo.query.filter(Todo.id.in_(todo_ids))\
+                      .update(dict(values, updated_at=now), synchronize_session='evaluate')
+        
+        # 3. 삭제 - DELETE 한 번
+        if delete_ids:
+            public_ids = [todo_id for todo_id in delete_ids if was_public[todo_id]]
+            if public_ids:
+                timeline.remove_todos(public_ids)
+            sync.record_deletions(user_id, sync.ENTITY_TODO, delete_ids)
+            Todo.query.filter(Todo.id.in_(delete_ids)).delete(synchronize_session='evaluate')
+        
+        # 4. 생성 - 여러 행 INSERT 한 번 후 생성된 행을 한 번에 다시 조회
+        created = _insert_todos(user_id, [values for index, values in creates], now)
+        
+        # 공개 상태가 바뀐 할 일은 팔로워 타임라인 갱신 (추가는 INSERT ... SELECT 한 번)
+        fan_out_ids, unpublished_ids = [], []
+        for todo_id, todo in todos.items():
+            if todo_id in delete_ids:
+                continue
+            stats.add_todo(stats_delta, todo)
+            if todo.is_public and not was_public[todo_id]:
+                fan_out_ids.append(todo_id)
+            elif was_public[todo_id] and not todo.is_public:
+                unpublished_ids.append(todo_id)
+        for todo in created:
+            stats.add(stats_delta, todo['category_id'], todo['completed'])
+            if todo['is_public']:
+                fan_out_ids.append(todo['id'])
+        timeline.fan_out_todos(fan_out_ids)
+        if unpublished_ids:
+            timeline.remove_todos(unpublished_ids)
+        
+        stats.apply(user_id, stats_delta)
+        versions.bump(user_id, versions.SCOPE_TODOS)
+        
+        # 작업 순서대로 결과 생성 (커밋 후에는 객체가 만료되어 할 일마다 다시 조회하므로 커밋 전에 직렬화)
+        results = [{'index': index, 'status': 201, 'todo': todo} for (index, values), todo in zip(creates, created)]
+        for index, op, todo_id, values in targets:
+            if op == 'delete':
+                results.append({'index': index, 'status': 200, 'id': todo_id})
+            else:
+                results.append({'index': index, 'status': 200, 'todo': todos[todo_id].to_dict()})
+        
+        db.session.commit()
+        
+        return jsonify({'results': sorted(results, key=lambda result: result['index'])})
+    except Exception as e:
+        logger.error(f"할 일 일괄 처리 중 오류 발생: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
+
+# 증분 동기화 API 엔드포인트
+@api.route('/sync', methods=['GET'])
+def sync_changes():
+    """since 토큰 이후 변경된 할 일/카테고리와 삭제된 ID 목록 반환
+    
+    since가 없거나, 다른 사용자의 토큰이거나, 삭제 기록 보관 기간이 지난 토큰이면
+    전체 데이터를 반환 (full: true, 클라이언트는 캐시를 교체).
+    응답의 sync_token을 다음 요청의 since로 사용.
+    """
+    try:
+        user_id, anonymous_id, user = get_user_info()
+        
+        if not user_id:
+            return jsonify({'error': '로그인이 필요합니다.'}), 401
+        
+        since = None
+        token = request.args.get('since')
+        if token:
+            try:
+                since, token_user_id = decode_cursor(token)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            if token_user_id != user_id or since < sync.tombstone_horizon():
+                since = None
+        
+        return jsonify(sync.changes_since(user_id, since))
+    except Exception as e:
+        logger.error(f"동기화 조회 중 오류 발생: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
+
 # 카테고리(Topic) API 엔드포인트
 @api.route('/topics', methods=['GET'])
+@read_replica
 def get_categories():
     """사용자의 카테고리 목록 가져오기"""
     try:
         user_id, anonymous_id, user = get_user_info()
         
-        categories = []
-        if user_id:
-            categories = Category.query.filter_by(user_id=user_id).all()
-            print(f"조회된 카테고리 수: {len(categories)}")
+        if not user_id:
+            return jsonify([])
+        
+        # 변경이 없으면 304
+        etag, not_modified = versions.request_etag(user_id, versions.SCOPE_CATEGORIES)
+        if not_modified:
+            return versions.not_modified(etag)
+        
+        rows = db.session.execute(serializers.category_select().where(Category.user_id == user_id)).all()
+        logger.debug(f"조회된 카테고리 수: {len(rows)}")
             
-        return jsonify([category.to_dict() for category in categories])
+        return versions.with_etag(serializers.json_response(serializers.category_dicts(rows)), etag)
     except Exception as e:
         logger.error(f"카테고리 조회 중 오류 발생: {str(e)}")
         db.session.rollback()
@@ -285,6 +704,7 @@ def create_category():
         )
         
         db.session.add(category)
+        versions.bump(user_id, versions.SCOPE_CATEGORIES)
         db.session.commit()
         
         return jsonify(category.to_dict()), 201
@@ -312,6 +732,7 @@ def update_category(category_id):
         if 'color' in data:
             category.color = data['color']
         
+        versions.bump(user_id, versions.SCOPE_CATEGORIES)
         db.session.commit()
         
         return jsonify(category.to_dict())
@@ -322,58 +743,282 @@ def update_category(category_id):
 
 @api.route('/topics/<int:category_id>', methods=['DELETE'])
 def delete_category(category_id):
-    """카테고리 삭제"""
+    """카테고리 삭제
+    
+    쿼리 파라미터 (선택):
+    - reassign_to: 할 일을 옮길 카테고리 ID (없으면 카테고리 없음으로 설정)
+    """
     try:
         user_id, anonymous_id, user = get_user_info()
         
-        # 카테고리 찾기
-        category = Category.query.filter_by(id=category_id, user_id=user_id).first()
+        reassign_to = request.args.get('reassign_to')
+        if reassign_to:
+            try:
+                reassign_to = int(reassign_to)
+            except ValueError:
+                return jsonify({'error': '잘못된 카테고리 ID입니다.'}), 400
+        else:
+            reassign_to = None
+        if reassign_to == category_id:
+            return jsonify({'error': '삭제할 카테고리로 옮길 수 없습니다.'}), 400
         
-        if not category:
+        # 카테고리 찾기 (옮길 카테고리도 함께)
+        category_ids = [category_id] + ([reassign_to] if reassign_to else [])
+        found = {row_id for row_id, in db.session.query(Category.id)
+                                                 .filter(Category.id.in_(category_ids), Category.user_id == user_id)}
+        
+        if category_id not in found:
             return jsonify({'error': '카테고리를 찾을 수 없습니다.'}), 404
+        if reassign_to and reassign_to not in found:
+            return jsonify({'error': '옮길 카테고리를 찾을 수 없습니다.'}), 404
+        
+        # 관련 할 일은 UPDATE 한 번으로 옮긴 뒤 카테고리 삭제
+        moved = categories.delete_category(user_id, category_id, reassign_to)
+        db.session.commit()
+        
+        return jsonify({'success': True, 'moved': moved})
+    except Exception as e:
+        logger.error(f"카테고리 삭제 중 오류 발생: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
+
+@api.route('/topics/<int:category_id>/merge', methods=['POST'])
+def merge_category(category_id):
+    """카테고리를 다른 카테고리에 병합 (할 일을 옮기고 이 카테고리는 삭제)
+    
+    요청 본문: {"into": 병합 대상 카테고리 ID}
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        user_id, anonymous_id, user = get_user_info()
         
-        # 관련 할 일의 카테고리 ID 제거 (카테고리 없음으로 설정)
-        todos = Todo.query.filter_by(category_id=category_id, user_id=user_id).all()
+        target_id = data.get('into')
+        if not isinstance(target_id, int) or isinstance(target_id, bool):
+            return jsonify({'error': '병합 대상 카테고리 ID가 필요합니다.'}), 400
+        if target_id == category_id:
+            return jsonify({'error': '같은 카테고리로 병합할 수 없습니다.'}), 400
         
-        for todo in todos:
-            todo.category_id = None
+        found = {category.id: category for category in
+                 Category.query.filter(Category.id.in_([category_id, target_id]), Category.user_id == user_id)}
+        if len(found) < 2:
+            return jsonify({'error': '카테고리를 찾을 수 없습니다.'}), 404
         
-        # 카테고리 삭제
-        db.session.delete(category)
+        moved = categories.merge_categories(user_id, category_id, target_id)
         db.session.commit()
         
-        return jsonify({'success': True})
+        return jsonify({'success': True, 'moved': moved, 'category': found[target_id].to_dict()})
     except Exception as e:
-        logger.error(f"카테고리 삭제 중 오류 발생: {str(e)}")
+        logger.error(f"카테고리 병합 중 오류 발생: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
+
+@api.route('/todos/recategorize', methods=['POST'])
+def recategorize_todos():
+    """선택한 할 일들의 카테고리 일괄 변경
+    
+    요청 본문: {"ids": [할 일 ID, ...], "category_id": 카테고리 ID 또는 null(카테고리 없음)}
+    다른 사용자의 할 일과 이미 해당 카테고리인 할 일은 건너뛰고, 바뀐 개수를 반환
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        user_id, anonymous_id, user = get_user_info()
+        
+        todo_ids = data.get('ids')
+        if not isinstance(todo_ids, list) or not todo_ids \
+                or not all(isinstance(todo_id, int) and not isinstance(todo_id, bool) for todo_id in todo_ids):
+            return jsonify({'error': '할 일 ID 목록이 필요합니다.'}), 400
+        
+        max_ids = current_app.config['TODOS_RECATEGORIZE_MAX_IDS']
+        if len(todo_ids) > max_ids:
+            return jsonify({'error': f'한 번에 최대 {max_ids}개의 할 일만 변경할 수 있습니다.'}), 400
+        
+        if 'category_id' not in data:
+            return jsonify({'error': '카테고리 ID가 필요합니다.'}), 400
+        category_id = data['category_id']
+        if category_id is not None:
+            if not isinstance(category_id, int) or isinstance(category_id, bool):
+                return jsonify({'error': '잘못된 카테고리 ID입니다.'}), 400
+            if not db.session.query(Category.id).filter_by(id=category_id, user_id=user_id).first():
+                return jsonify({'error': '카테고리를 찾을 수 없습니다.'}), 404
+        
+        updated = categories.recategorize(user_id, sorted(set(todo_ids)), category_id)
+        db.session.commit()
+        
+        return jsonify({'success': True, 'updated': updated})
+    except Exception as e:
+        logger.error(f"할 일 카테고리 일괄 변경 중 오류 발생: {str(e)}")
         db.session.rollback()
         return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
 
 # 알림 API 엔드포인트
 @api.route('/notifications', methods=['GET'])
 @login_required
+@read_replica
 def get_notifications():
-    """사용자의 알림 목록 가져오기"""
+    """사용자의 알림 목록 가져오기 (최신순)
+    
+    쿼리 파라미터 (모두 선택):
+    - limit / before: (created_at, id) 키셋 페이지네이션, 다음 커서는 X-Next-Cursor 헤더로 반환
+    - unread_only: 1 또는 true면 읽지 않은 알림만
+    """
     try:
-        notifications = Notification.query.filter_by(user_id=current_user.id)\
-                                        .order_by(Notification.created_at.desc())\
-                                        .all()
-        return jsonify([notification.to_dict() for notification in notifications])
+        # 변경이 없으면 304 (ETag는 쿼리 문자열별로 다름)
+        etag, not_modified = versions.request_etag(current_user.id, versions.SCOPE_NOTIFICATIONS)
+        if not_modified:
+            return versions.not_modified(etag)
+        
+        try:
+            limit, before, unread_only = parse_notification_page_args(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        rows = notification_page(current_user.id, limit, before, unread_only)
+        rows, next_cursor = split_notification_page(rows, limit)
+        
+        response = serializers.json_response(serializers.notification_dicts(rows))
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return versions.with_etag(response, etag)
     except Exception as e:
         logger.error(f"알림 조회 중 오류 발생: {str(e)}")
         db.session.rollback()
         return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
 
+@api.route('/notifications/stream', methods=['GET'])
+@login_required
+def stream_notifications():
+    """새 알림을 Server-Sent Events로 전송
+    
+    Last-Event-ID 헤더(또는 last_event_id 파라미터)가 있으면 그 이후 알림부터 전송.
+    연결은 NOTIFICATION_STREAM_MAX_DURATION 후 종료되며 브라우저가 자동으로 재접속함.
+    """
+    user_id = current_user.id
+    config = current_app.config
+    
+    try:
+        last_event_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or 0)
+    except ValueError:
+        last_event_id = 0
+    
+    # 누락 알림 조회 전에 구독해야 그 사이 발행된 알림을 놓치지 않음
+    subscription = notification_broker.subscribe(user_id)
+    if subscription is None:
+        # 워커의 스트림 연결 수 초과 (요청 스레드를 지키기 위해 거절, 클라이언트는 주기적 조회로 전환)
+        logger.warning(f"알림 스트림 연결 수 초과로 거절: 사용자 ID={user_id}")
+        response = jsonify({'error': '실시간 알림 연결이 많아 잠시 후 다시 시도해 주세요.'})
+        response.headers['Retry-After'] = str(config['NOTIFICATION_STREAM_RETRY'] // 1000 or 1)
+        return response, 503
+    try:
+        missed = []
+        if last_event_id:
+            missed = Notification.query.filter(Notification.user_id == user_id,
+                                               Notification.id > last_event_id)\
+                                       .order_by(Notification.id)\
+                                       .limit(config['NOTIFICATION_STREAM_BACKLOG'])\
+                                       .all()
+            missed = [{'id': notification.id, 'data': notification.to_dict()} for notification in missed]
+    except Exception as e:
+        notification_broker.unsubscribe(subscription)
+        logger.error(f"누락 알림 조회 중 오류 발생: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
+    
+    keepalive = config['NOTIFICATION_STREAM_KEEPALIVE']
+    max_duration = config['NOTIFICATION_STREAM_MAX_DURATION']
+    retry = config['NOTIFICATION_STREAM_RETRY']
+    
+    def generate():
+        last_sent_id = last_event_id
+        deadline = time.monotonic() + max_duration
+        try:
+            yield f"retry: {retry}\n\n"
+            
+            for event in missed:
+                last_sent_id = event['id']
+                yield _format_sse(event)
+            
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                event = subscription.get(timeout=min(keepalive, remaining))
+                if event is None:
+                    yield ": keep-alive\n\n"
+                elif event['id'] > last_sent_id:
+                    last_sent_id = event['id']
+                    yield _format_sse(event)
+        finally:
+            notification_broker.unsubscribe(subscription)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # 프록시 버퍼링 비활성화
+    })
+
+def _format_sse(event):
+    """알림 이벤트를 SSE 메시지 형식으로 변환"""
+    data = json.dumps(event['data'], ensure_ascii=False)
+    return f"id: {event['id']}\nevent: notification\ndata: {data}\n\n"
+
+@api.route('/notifications/unread-count', methods=['GET'])
+@login_required
+@read_replica
+def get_unread_notification_count():
+    """읽지 않은 알림 수 (알림 뱃지용, 목록을 가져오지 않음)"""
+    try:
+        # 변경이 없으면 304
+        etag, not_modified = versions.request_etag(current_user.id, versions.SCOPE_NOTIFICATIONS)
+        if not_modified:
+            return versions.not_modified(etag)
+        
+        count = db.session.query(db.func.count(Notification.id))\
+                          .filter(Notification.user_id == current_user.id, Notification.is_read == False)\
+                          .scalar()
+        return versions.with_etag(jsonify({'count': count}), etag)
+    except Exception as e:
+        logger.error(f"읽지 않은 알림 수 조회 중 오류 발생: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
+
 @api.route('/notifications/read', methods=['POST'])
 @login_required
 def mark_notifications_read():
-    """모든 알림을 읽음으로 표시"""
+    """알림을 읽음으로 표시 (UPDATE 한 번)
+    
+    요청 본문 (모두 선택):
+    - ids: 읽음 처리할 알림 ID 목록
+    - up_to: 이 ID 이하의 알림만 읽음 처리 (목록을 받은 시점까지 읽음 처리할 때 가장 최근 알림 ID)
+    본문이 없으면 모든 알림을 읽음 처리
+    """
     try:
-        notifications = Notification.query.filter_by(user_id=current_user.id, read=False).all()
-        for notification in notifications:
-            notification.read = True
-        
+        data = request.get_json(silent=True) or {}
+        try:
+            ids = data.get('ids')
+            if ids is not None:
+                ids = parse_notification_ids(ids, current_app.config['NOTIFICATIONS_MARK_READ_MAX_IDS'])
+            up_to = data.get('up_to')
+            if up_to is not None and (not isinstance(up_to, int) or isinstance(up_to, bool)):
+                raise ValueError('up_to는 알림 ID(정수)여야 합니다.')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        updated = set_notifications_read(current_user.id, ids=ids, up_to=up_to)
         db.session.commit()
-        return jsonify({'success': True})
+        return jsonify({'success': True, 'updated': updated})
+    except Exception as e:
+        logger.error(f"알림 읽음 처리 중 오류 발생: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': '서버 오류가 발생했습니다.'}), 500
+
+@api.route('/notifications/<int:notification_id>/read', methods=['POST'])
+@login_required
+def mark_notification_read(notification_id):
+    """알림 하나를 읽음으로 표시"""
+    try:
+        updated = set_notifications_read(current_user.id, ids=[notification_id])
+        db.session.commit()
+        return jsonify({'success': True, 'updated': updated})
     except Exception as e:
         logger.error(f"알림 읽음 처리 중 오류 발생: {str(e)}")
         db.session.rollback()
@@ -385,6 +1030,7 @@ def clear_notifications():
     """모든 알림 삭제"""
     try:
         Notification.query.filter_by(user_id=current_user.id).delete()
+        versions.bump(current_user.id, versions.SCOPE_NOTIFICATIONS)
         db.session.commit()
         
         return jsonify({'success': True})
@@ -395,19 +1041,12 @@ def clear_notifications():
 
 # Explore API 엔드포인트 - explore.js가 기대하는 구조로 수정
 @api.route('/explore/users', methods=['GET'])
+@read_replica
 def get_explore_users():
     """탐색 페이지 사용자 목록 - 팔로우 중인 사용자와 추천 사용자"""
     try:
         # 로그인 확인
-        if current_user.is_authenticated:
-            current_user_id = current_user.id
-        else:
-            current_user_id = session.get('user_id')
-        
-        if not current_user_id:
-            return jsonify({'following': [], 'recommended': []}), 200
-        
-        user = User.query.get(current_user_id)
+        current_user_id, anonymous_id, user = get_user_info()
         if not user:
             return jsonify({'following': [], 'recommended': []}), 200
         
@@ -422,18 +1061,15 @@ def get_explore_users():
                 'profile_image': follow_user.profile_image
             })
         
-        # 추천 사용자 (자신과 이미 팔로우한 사용자 제외)
-        following_ids = [u.id for u in following_users]
-        following_ids.append(current_user_id)
-        recommended_users = User.query.filter(~User.id.in_(following_ids)).limit(10).all()
-        
+        # 추천 사용자 (친구의 친구, 계산 결과가 없으면 팔로우하지 않은 사용자)
         recommended_result = []
-        for rec_user in recommended_users:
+        for rec_user, mutual_count in recommendations.recommended_users(current_user_id, current_app.config['RECOMMENDATION_LIMIT']):
             recommended_result.append({
                 'id': rec_user.id,
                 'username': rec_user.username,
                 'nickname': rec_user.nickname or rec_user.username,
                 'profile_image': rec_user.profile_image,
+                'mutual_count': mutual_count,
                 'is_following': False
             })
         
@@ -447,48 +1083,47 @@ def get_explore_users():
         return jsonify({'following': [], 'recommended': []}), 200
 
 @api.route('/explore/todos', methods=['GET'])
+@read_replica
 def get_explore_todos():
-    """팔로우 중인 사용자의 공개 할 일 목록 - 배열 형태로 반환"""
+    """팔로우 중인 사용자의 공개 할 일 목록 - 배열 형태로 반환
+    
+    팔로워별 타임라인(timeline_entry)에서 할 일, 작성자, 카테고리를 함께 가져옴.
+    before 커서((created_at, id) 기준)와 limit으로 페이지네이션, 다음 커서는 X-Next-Cursor 헤더로 반환
+    """
     try:
         # 로그인 확인
-        if current_user.is_authenticated:
-            current_user_id = current_user.id
-        else:
-            current_user_id = session.get('user_id')
-        
-        if not current_user_id:
-            return jsonify([]), 200
-        
-        user = User.query.get(current_user_id)
+        current_user_id, anonymous_id, user = get_user_info()
         if not user:
             return jsonify([]), 200
         
-        # 팔로우 중인 사용자의 공개 할 일
-        followed_todos = user.followed_todos().all()
+        try:
+            limit = parse_page_size(request.args.get('limit'),
+                                    current_app.config['EXPLORE_PAGE_SIZE'],
+                                    current_app.config['EXPLORE_MAX_PAGE_SIZE'])
+            before = request.args.get('before')
+            before = decode_cursor(before) if before else None
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # 팔로우 중인 사용자의 공개 할 일 + 작성자 + 카테고리 (타임라인 범위 스캔)
+        rows = timeline.timeline_page(user.id, limit, before)
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_todo = rows[-1][0]
+            next_cursor = encode_cursor(last_todo.created_at, last_todo.id)
         
         result = []
-        for todo in followed_todos:
-            todo_user = User.query.get(todo.user_id)
-            if not todo_user:
-                continue
-                
-            category = None
-            category_color = None
-            
-            if todo.category_id:
-                category_obj = Category.query.get(todo.category_id)
-                if category_obj:
-                    category = category_obj.name
-                    category_color = category_obj.color
-            
+        for todo, todo_user, category_obj in rows:
             result.append({
                 'id': todo.id,
                 'title': todo.title,
                 'description': todo.description or '',
                 'date': todo.date.strftime('%Y-%m-%d'),
                 'completed': todo.completed,
-                'category': category,
-                'category_color': category_color,
+                'category': category_obj.name if category_obj else None,
+                'category_color': category_obj.color if category_obj else None,
                 'created_at': todo.created_at.strftime('%Y-%m-%d %H:%M'),
                 'user': {
                     'id': todo_user.id,
@@ -498,7 +1133,10 @@ def get_explore_todos():
                 }
             })
         
-        return jsonify(result)
+        response = jsonify(result)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response
     except Exception as e:
         logger.error(f"탐색 할 일 조회 중 오류 발생: {str(e)}")
         db.session.rollback()
@@ -510,16 +1148,9 @@ def follow_user(user_id):
     """사용자 팔로우"""
     try:
         # 로그인 확인
-        if current_user.is_authenticated:
-            current_user_id = current_user.id
-            current_user_obj = current_user
-        else:
-            current_user_id = session.get('user_id')
-            if not current_user_id:
-                return jsonify({'error': '로그인이 필요합니다.'}), 401
-            current_user_obj = User.query.get(current_user_id)
-            if not current_user_obj:
-                return jsonify({'error': '로그인이 필요합니다.'}), 401
+        current_user_id, anonymous_id, current_user_obj = get_user_info()
+        if not current_user_obj:
+            return jsonify({'error': '로그인이 필요합니다.'}), 401
         
         if current_user_id == user_id:
             return jsonify({'error': '자신을 팔로우할 수 없습니다.'}), 400
@@ -528,13 +1159,21 @@ def follow_user(user_id):
         if not user_to_follow:
             return jsonify({'error': '사용자를 찾을 수 없습니다.'}), 404
         
-        current_user_obj.follow(user_to_follow)
+        if current_user_obj.follow(user_to_follow):
+            # 팔로워 수에 따라 fan-out 모드 갱신 후 타임라인 채우기
+            db.session.flush()
+            timeline.update_fanout_mode(user_to_follow)
+            timeline.backfill_follow(current_user_id, user_to_follow)
+            recommendations.mark_stale(current_user_id, user_id)
+            # 팔로워/팔로잉 수가 바뀌므로 두 사용자의 프로필 버전 증가
+            versions.bump(current_user_id, versions.SCOPE_PROFILE)
+            versions.bump(user_id, versions.SCOPE_PROFILE)
         db.session.commit()
+        identity.invalidate(current_user_id, user_id)
         
-        # 알림 생성
-        from app.utils import create_notification
+        # 알림은 지연 기록 (팔로우 요청은 커밋 한 번)
         message = f"{current_user_obj.nickname or current_user_obj.username}님이 회원님을 팔로우하기 시작했습니다."
-        create_notification(user_id, message, 'follow', current_user_id)
+        notification_dispatcher.notify(user_id, message, 'follow', current_user_id)
         
         return jsonify({'result': 'success'})
     except Exception as e:
@@ -547,23 +1186,21 @@ def unfollow_user(user_id):
     """사용자 언팔로우"""
     try:
         # 로그인 확인
-        if current_user.is_authenticated:
-            current_user_id = current_user.id
-            current_user_obj = current_user
-        else:
-            current_user_id = session.get('user_id')
-            if not current_user_id:
-                return jsonify({'error': '로그인이 필요합니다.'}), 401
-            current_user_obj = User.query.get(current_user_id)
-            if not current_user_obj:
-                return jsonify({'error': '로그인이 필요합니다.'}), 401
+        current_user_id, anonymous_id, current_user_obj = get_user_info()
+        if not current_user_obj:
+            return jsonify({'error': '로그인이 필요합니다.'}), 401
             
         user_to_unfollow = User.query.get(user_id)
         if not user_to_unfollow:
             return jsonify({'error': '사용자를 찾을 수 없습니다.'}), 404
         
-        current_user_obj.unfollow(user_to_unfollow)
+        if current_user_obj.unfollow(user_to_unfollow):
+            timeline.prune_unfollow(current_user_id, user_id)
+            recommendations.mark_stale(current_user_id, user_id)
+            versions.bump(current_user_id, versions.SCOPE_PROFILE)
+            versions.bump(user_id, versions.SCOPE_PROFILE)
         db.session.commit()
+        identity.invalidate(current_user_id, user_id)
         
         return jsonify({'result': 'success'})
     except Exception as e:
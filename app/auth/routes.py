@@ -4,6 +4,7 @@ from flask_login import login_user, logout_user, login_required, current_user
 from app.auth import auth
 from app.models import User, Category
 from app.extensions import db
+from app import versions, identity
 import logging
 
 # 로깅 설정
@@ -151,7 +152,9 @@ def update_user_profile():
         if 'bio' in data:
             current_user.bio = data['bio']
         
+        versions.bump(current_user.id, versions.SCOPE_PROFILE)
         db.session.commit()
+        identity.invalidate(current_user.id)
         logger.info(f"프로필 업데이트 성공: {current_user.username}")
         
         return jsonify(current_user.to_dict())
@@ -0,0 +1,75 @@
+import logging
+from datetime import datetime
+from sqlalchemy import select, func
+from app.extensions import db
+from app.models import Todo, Category
+from app import stats, sync, versions
+
+# 카테고리 일괄 작업 (집합 단위)
+# - 삭제(다른 카테고리로 재배정 가능), 병합, 선택한 할 일의 카테고리 변경
+# - 할 일을 불러오지 않고 UPDATE 한 번으로 옮기므로 카테고리 크기와 관계없이 문 수가 일정
+# - 통계 집계(user_todo_stats)는 집계 행을 그대로 옮기거나 GROUP BY 한 번으로 구한 개수로 증감
+# - 옮긴 할 일은 updated_at을 갱신해 증분 동기화에 포함, 삭제한 카테고리는 삭제 기록을 남김
+# 카테고리 존재/소유 확인은 호출자 담당, 모든 함수는 실행만 하고 커밋은 호출자가 담당
+
+logger = logging.getLogger(__name__)
+
+def _move_todos(user_id, category_ids, target_id):
+    """카테고리들의 할 일을 target_id(None이면 카테고리 없음)로 옮긴 뒤 옮긴 개수 반환"""
+    table = Todo.__table__
+    result = db.session.execute(
+        table.update()
+             .where(table.c.user_id == user_id, table.c.category_id.in_(category_ids))
+             .values(category_id=target_id, updated_at=datetime.utcnow())
+    )
+    stats.move_categories(user_id, category_ids, target_id)
+    return result.rowcount
+
+def _delete_categories(user_id, category_ids):
+    table = Category.__table__
+    sync.record_deletions(user_id, sync.ENTITY_CATEGORY, category_ids)
+    db.session.execute(table.delete().where(table.c.user_id == user_id, table.c.id.in_(category_ids)))
+    versions.bump(user_id, versions.SCOPE_CATEGORIES, versions.SCOPE_TODOS)
+
+def delete_category(user_id, category_id, reassign_to=None):
+    """카테고리 삭제, 속한 할 일은 reassign_to(없으면 카테고리 없음)로 옮기고 옮긴 개수 반환"""
+    moved = _move_todos(user_id, [category_id], reassign_to)
+    _delete_categories(user_id, [category_id])
+    return moved
+
+def merge_categories(user_id, source_id, target_id):
+    """source 카테고리를 target에 병합 (할 일을 옮긴 뒤 source 삭제) 후 옮긴 개수 반환"""
+    return delete_category(user_id, source_id, reassign_to=target_id)
+
+def recategorize(user_id, todo_ids, category_id):
+    """선택한 할 일의 카테고리를 category_id(None이면 카테고리 없음)로 바꾸고 바뀐 개수 반환
+
+    이미 해당 카테고리인 할 일은 건드리지 않음 (updated_at 유지).
+    """
+    if not todo_ids:
+        return 0
+
+    table = Todo.__table__
+    condition = [
+        table.c.user_id == user_id,
+        table.c.id.in_(todo_ids),
+        table.c.category_id.is_distinct_from(category_id)
+    ]
+
+    # 옮길 할 일의 (카테고리, 완료)별 개수로 통계 증감 계산
+    deltas = {}
+    groups = db.session.execute(
+        select(table.c.category_id, table.c.completed, func.count())
+            .where(*condition)
+            .group_by(table.c.category_id, table.c.completed)
+    ).all()
+    for source_id, completed, count in groups:
+        stats.add(deltas, source_id, completed, -count)
+        stats.add(deltas, category_id, completed, count)
+
+    result = db.session.execute(
+        table.update().where(*condition).values(category_id=category_id, updated_at=datetime.utcnow())
+    )
+    stats.apply(user_id, deltas)
+    versions.bump(user_id, versions.SCOPE_TODOS)
+    return result.rowcount
@@ -0,0 +1,84 @@
+import os
+import weakref
+import logging
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import event, exc, text
+from sqlalchemy.pool import Pool
+from app.extensions import db
+
+# DB 초기화와 프로세스 fork 처리
+# - create_app은 DB에 접속하지 않음, 스키마 생성과 기본 데이터는 flask init-db로 실행
+# - gunicorn --preload 등으로 앱을 만든 뒤 fork하면 자식 프로세스에서 엔진의 연결 풀을 새로 만듦
+# - 다른 프로세스에서 만든 연결은 풀에서 꺼낼 때 버림 (fork 이후 소켓 공유 방지)
+
+logger = logging.getLogger(__name__)
+
+@event.listens_for(Pool, 'connect')
+def _remember_pid(dbapi_connection, connection_record):
+    connection_record.info['pid'] = os.getpid()
+
+@event.listens_for(Pool, 'checkout')
+def _check_pid(dbapi_connection, connection_record, connection_proxy):
+    pid = os.getpid()
+    if connection_record.info.get('pid', pid) != pid:
+        # 부모 프로세스의 소켓은 닫지 않고 버린 뒤 새 연결 사용
+        connection_record.dbapi_connection = connection_proxy.dbapi_connection = None
+        raise exc.DisconnectionError(
+            f"다른 프로세스(pid={connection_record.info['pid']})에서 만든 연결을 현재 프로세스(pid={pid})에서 사용하려 함"
+        )
+
+def dispose_engines(app):
+    """앱이 이미 만든 엔진의 연결 풀 정리 (fork 직후 자식 프로세스에서 호출)"""
+    # 아직 만들지 않은 엔진은 새로 만들지 않음
+    state = app.extensions.get('sqlalchemy')
+    if state is None:
+        return
+    for connector in list(state.connectors.values()):
+        engine = connector._engine
+        if engine is not None:
+            engine.dispose()
+
+def init_app(app):
+    # fork된 자식 프로세스는 부모와 연결을 공유하지 않도록 풀을 새로 만듦
+    app_ref = weakref.ref(app)
+
+    def after_fork_in_child():
+        fork_app = app_ref()
+        if fork_app is not None:
+            dispose_engines(fork_app)
+
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=after_fork_in_child)
+
+def init_db(create_default_user=True):
+    """테이블이 없으면 생성하고 마이그레이션을 최신으로 표시, 생성했으면 True 반환"""
+    with db.engine.connect() as conn:
+        conn.execute(text('SELECT 1'))
+
+    if 'user' in db.inspect(db.engine).get_table_names():
+        return False
+
+    db.create_all()
+
+    # create_all로 만든 스키마는 최신 마이그레이션과 같으므로 head로 표시
+    from flask_migrate import stamp
+    try:
+        stamp()
+    except Exception as e:
+        logger.warning(f"마이그레이션 버전 표시 실패 (flask db stamp head로 직접 표시 필요): {e}")
+
+    if create_default_user:
+        from app.utils import create_default_user as create_user
+        create_user()
+    return True
+
+@click.command('init-db')
+@click.option('--no-default-user', is_flag=True, help='기본 사용자를 만들지 않음')
+@with_appcontext
+def init_db_command(no_default_user):
+    """데이터베이스 연결 확인 및 테이블 생성 (배포 시 워커 시작 전에 한 번 실행)"""
+    if init_db(create_default_user=not no_default_user):
+        click.echo("데이터베이스 테이블이 생성되었습니다.")
+    else:
+        click.echo("데이터베이스 테이블이 이미 존재합니다. 스키마 변경은 flask db upgrade로 적용하세요.")
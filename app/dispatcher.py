@@ -0,0 +1,317 @@
+import os
+import re
+import json
+import atexit
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from flask import has_app_context
+
+# 알림 지연 기록 (write-behind)
+# - notify()는 알림을 프로세스 내 큐에 넣고 바로 반환, 요청은 자신의 트랜잭션만 커밋
+# - 워커마다 백그라운드 스레드 하나가 큐를 모아 여러 행 INSERT 한 번과 커밋 한 번으로 기록
+# - 큐가 NOTIFICATION_QUEUE_SIZE만큼 차 있으면 NOTIFICATION_ENQUEUE_TIMEOUT 동안 기다리고,
+#   그래도 자리가 없으면 요청 스레드에서 바로 기록 (알림을 버리지 않음)
+# - 큐에 넣기 전에 워커별 spill 파일(notifications-<pid>.jsonl)에 한 줄씩 기록하고, 커밋 후 기록한 위치를 남김
+#   프로세스가 비정상 종료되면 다른 워커(또는 같은 pid로 재시작한 워커)가 남은 알림을 DB에 기록
+# - 정상 종료 시(atexit) 남은 알림을 모두 기록한 뒤 종료
+
+logger = logging.getLogger(__name__)
+
+# notifications-<pid>.jsonl: 사용 중, .recover: 같은 pid의 이전 실행이 남긴 파일, .recovering-<pid>: 복구 중
+SPILL_FILE_PATTERN = re.compile(r'^notifications-(\d+)\.jsonl(\.recover|\.recovering-(\d+))?$')
+
+class NotificationDispatcher:
+    """알림을 모아서 기록하는 프로세스별 디스패처"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.enabled = False
+        self._events = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pid = None
+        self._seq = 0
+        self._in_flight = 0
+        self._stopping = False
+        self._spill = None
+        self._atexit_registered = False
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        # 같은 프로세스에서 앱을 다시 만든 경우 이전 앱의 알림을 먼저 기록
+        if self.app is not None:
+            self.stop()
+            with self._condition:
+                if self._spill is not None and self._pid == os.getpid():
+                    self._spill.close()
+                self._spill = None
+
+        config = app.config
+        self.app = app
+        self.enabled = config.get('NOTIFICATION_WRITE_BEHIND', True)
+        self.maxsize = config.get('NOTIFICATION_QUEUE_SIZE', 10000)
+        self.batch_size = config.get('NOTIFICATION_BATCH_SIZE', 500)
+        self.flush_interval = config.get('NOTIFICATION_FLUSH_INTERVAL', 0.5)
+        self.enqueue_timeout = config.get('NOTIFICATION_ENQUEUE_TIMEOUT', 0.1)
+        self.spill_dir = config.get('NOTIFICATION_SPILL_DIR') or os.path.join(app.instance_path, 'notifications')
+        self.spill_fsync = config.get('NOTIFICATION_SPILL_FSYNC', False)
+        app.extensions['notification_dispatcher'] = self
+
+    def notify(self, user_id, message, notification_type, sender_id=None):
+        """알림 기록 예약, 바로 기록하거나 큐에 넣었으면 True (요청 커밋 후 호출)"""
+        event = {
+            'user_id': user_id,
+            'message': message,
+            'type': notification_type,
+            'sender_id': sender_id,
+            'created_at': datetime.utcnow().isoformat()
+        }
+        if self.enabled and self._enqueue(event):
+            return True
+
+        # 지연 기록을 사용하지 않거나 큐가 가득 찬 경우 바로 기록
+        try:
+            self._write([event])
+            return True
+        except Exception as e:
+            logger.error(f"알림 기록 중 오류: {str(e)}")
+            return False
+
+    def _enqueue(self, event):
+        with self._condition:
+            try:
+                self._ensure_started()
+            except OSError as e:
+                logger.error(f"알림 spill 파일을 열 수 없음: {str(e)}")
+                return False
+
+            if not self._condition.wait_for(lambda: len(self._events) < self.maxsize,
+                                            timeout=self.enqueue_timeout):
+                logger.warning(f"알림 큐가 가득 참, 요청 스레드에서 바로 기록: 사용자 ID={event['user_id']}")
+                return False
+
+            self._seq += 1
+            event['seq'] = self._seq
+            try:
+                self._append_spill(event)
+            except OSError as e:
+                logger.error(f"알림 spill 파일 기록 중 오류: {str(e)}")
+                return False
+            self._events.append(event)
+            self._condition.notify_all()
+            return True
+
+    def _ensure_started(self):
+        """현재 프로세스의 기록 스레드 시작 (condition 안에서 호출)"""
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+
+        if self._pid != pid:
+            # fork된 자식 프로세스: 부모의 큐와 spill 파일은 부모가 기록함
+            self._events.clear()
+            self._in_flight = 0
+            self._spill = None
+            self._pid = pid
+
+        if self._spill is None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            path = os.path.join(self.spill_dir, f'notifications-{pid}.jsonl')
+            if os.path.exists(path):
+                # 같은 pid를 쓰던 이전 실행의 파일은 복구 대상으로
+                os.replace(path, f'{path}.recover')
+            self._spill = open(path, 'a', encoding='utf-8')
+
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name='notification-dispatcher', daemon=True)
+        self._thread.start()
+
+    def _append_spill(self, record):
+        self._spill.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._spill.flush()
+        if self.spill_fsync:
+            os.fsync(self._spill.fileno())
+
+    def _run(self):
+        self._recover()
+
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._events or self._stopping)
+                if not self._events:
+                    return
+                # 배치가 찰 때까지 잠시 더 모음 (종료 중이면 바로 기록)
+                self._condition.wait_for(lambda: len(self._events) >= self.batch_size or self._stopping,
+                                         timeout=self.flush_interval)
+                batch = [self._events.popleft() for _ in range(min(self.batch_size, len(self._events)))]
+                self._in_flight = len(batch)
+                self._condition.notify_all()
+
+            written = self._write_with_retry(batch)
+
+            with self._condition:
+                self._in_flight = 0
+                if written:
+                    try:
+                        self._checkpoint(batch[-1]['seq'])
+                    except OSError as e:
+                        logger.error(f"알림 spill 파일 정리 중 오류: {str(e)}")
+                self._condition.notify_all()
+                if not written:
+                    # 종료 중 DB 오류: 남은 알림은 spill 파일에서 다음 실행 때 복구
+                    logger.error(f"알림 {len(batch) + len(self._events)}개를 기록하지 못함, spill 파일에 남겨 둠")
+                    self._events.clear()
+                    return
+
+    def _write_with_retry(self, batch):
+        """배치 기록, 실패하면 간격을 늘려 다시 시도 (종료 중 실패하면 False)"""
+        delay = self.flush_interval
+        while True:
+            try:
+                self._write(batch)
+                return True
+            except Exception as e:
+                logger.error(f"알림 {len(batch)}개 기록 중 오류, {delay:.1f}초 후 다시 시도: {str(e)}")
+                if self._stopping:
+                    return False
+                with self._condition:
+                    self._condition.wait_for(lambda: self._stopping, timeout=delay)
+                delay = min(delay * 2, 30)
+
+    def _checkpoint(self, seq):
+        """seq까지 기록 완료 표시, 대기 중인 알림이 없으면 파일을 비움 (condition 안에서 호출)"""
+        if self._events:
+            self._append_spill({'flushed': seq})
+        else:
+            self._spill.seek(0)
+            self._spill.truncate()
+
+    def _recover(self):
+        """종료된 프로세스가 남긴 spill 파일의 미기록 알림을 DB에 기록"""
+        pid = os.getpid()
+        for name in sorted(os.listdir(self.spill_dir)):
+            match = SPILL_FILE_PATTERN.match(name)
+            if not match:
+                continue
+            owner = int(match.group(3) or match.group(1))
+            if not match.group(2) and (owner == pid or _pid_alive(owner)):
+                continue
+            if match.group(3) and owner != pid and _pid_alive(owner):
+                continue
+
+            # 여러 워커가 동시에 복구하지 않도록 이름을 바꿔 차지
+            path = os.path.join(self.spill_dir, name)
+            claimed = os.path.join(self.spill_dir, f'notifications-{match.group(1)}.jsonl.recovering-{pid}')
+            try:
+                os.replace(path, claimed)
+                events = read_spill(claimed)
+                for start in range(0, len(events), self.batch_size):
+                    self._write(events[start:start + self.batch_size])
+                os.remove(claimed)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.error(f"spill 파일 복구 중 오류 ({name}): {str(e)}")
+                continue
+            if events:
+                logger.info(f"spill 파일에서 알림 {len(events)}개 복구: {name}")
+
+    def _write(self, events):
+        """알림 여러 개를 INSERT 한 번으로 기록 후 커밋
+
+        요청 스레드(큐가 가득 찬 경우)에서는 요청의 세션을, 기록 스레드에서는 새 앱 컨텍스트의 세션을 사용.
+        """
+        if has_app_context():
+            return self._insert(events)
+
+        from app.extensions import db
+        with self.app.app_context():
+            try:
+                return self._insert(events)
+            finally:
+                db.session.remove()
+
+    def _insert(self, events):
+        from app.extensions import db, notification_broker
+        from app.models import Notification
+        from app import versions
+
+        rows = [{
+            'user_id': event['user_id'],
+            'message': event['message'],
+            'type': event['type'],
+            'sender_id': event['sender_id'],
+            'is_read': False,
+            'created_at': datetime.fromisoformat(event['created_at'])
+        } for event in events]
+        user_ids = sorted({row['user_id'] for row in rows})
+        # 이 프로세스에서 구독 중인 사용자의 알림만 기록 후 다시 조회해 실시간 전달
+        subscribed = [user_id for user_id in user_ids if notification_broker.has_subscribers(user_id)]
+
+        try:
+            watermark = 0
+            if subscribed:
+                watermark = db.session.query(db.func.max(Notification.id)).scalar() or 0
+            db.session.execute(Notification.__table__.insert().values(rows))
+            for user_id in user_ids:
+                versions.bump(user_id, versions.SCOPE_NOTIFICATIONS)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        if subscribed:
+            created = Notification.query.filter(Notification.user_id.in_(subscribed),
+                                                Notification.id > watermark)\
+                                        .order_by(Notification.id).all()
+            for notification in created:
+                notification_broker.publish(notification)
+
+    def flush(self, timeout=None):
+        """대기 중인 알림이 모두 기록될 때까지 대기, 시간 안에 끝나면 True"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._events and not self._in_flight, timeout=timeout)
+
+    def stop(self, timeout=10):
+        """남은 알림을 기록한 뒤 기록 스레드 종료"""
+        with self._condition:
+            thread = self._thread if self._pid == os.getpid() else None
+            self._stopping = True
+            self._condition.notify_all()
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning(f"알림 {len(self._events)}개를 기록하지 못하고 종료, spill 파일에서 복구됨")
+
+def read_spill(path):
+    """spill 파일에서 기록되지 않은 알림 목록 (마지막 기록 위치 이후)"""
+    events, flushed = [], 0
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 종료 직전에 쓰다 만 줄
+                continue
+            if 'flushed' in record:
+                flushed = max(flushed, record['flushed'])
+            else:
+                events.append(record)
+    return [event for event in events if event['seq'] > flushed]
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
@@ -1,8 +1,12 @@
 # app/extensions.py
-from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_login import LoginManager
+from app.pubsub import NotificationBroker
+from app.dispatcher import NotificationDispatcher
+from app.routing import RoutingSQLAlchemy
 
-db = SQLAlchemy()
+db = RoutingSQLAlchemy()  # 읽기 복제본 라우팅 (app/routing.py)
 migrate = Migrate()
-login_manager = LoginManager()
\ No newline at end of file
+login_manager = LoginManager()
+notification_broker = NotificationBroker()
+notification_dispatcher = NotificationDispatcher()
@@ -0,0 +1,52 @@
+import logging
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import select, func, or_
+from app.extensions import db
+from app.models import User, followers
+
+# 팔로워/팔로잉 수 보정
+# - User.followers_count/following_count는 follow/unfollow에서 증감식으로 갱신
+# - 직접 수정한 데이터나 과거 버그로 어긋난 값은 followers 테이블 기준으로 다시 계산
+# - 사용자 ID 범위별로 나눠 커밋하므로 큰 테이블도 오래 잠그지 않음
+
+logger = logging.getLogger(__name__)
+
+def follow_count_subqueries(user_table):
+    """user_table 행의 실제 (팔로워 수, 팔로잉 수) 상관 서브쿼리"""
+    followers_count = select(func.count()).select_from(followers)\
+        .where(followers.c.followed_id == user_table.c.id).scalar_subquery()
+    following_count = select(func.count()).select_from(followers)\
+        .where(followers.c.follower_id == user_table.c.id).scalar_subquery()
+    return followers_count, following_count
+
+def reconcile_follow_counts(batch_size=None):
+    """저장된 수가 실제와 다른 사용자만 갱신 후 보정된 사용자 수 반환"""
+    batch_size = batch_size or current_app.config['FOLLOW_COUNTS_BATCH_SIZE']
+    table = User.__table__
+    actual_followers, actual_following = follow_count_subqueries(table)
+
+    max_id = db.session.query(func.max(User.id)).scalar() or 0
+    repaired = 0
+    for start in range(0, max_id + 1, batch_size):
+        result = db.session.execute(
+            table.update()
+                 .where(table.c.id >= start, table.c.id < start + batch_size)
+                 .where(or_(table.c.followers_count != actual_followers,
+                            table.c.following_count != actual_following))
+                 .values(followers_count=actual_followers, following_count=actual_following)
+        )
+        db.session.commit()
+        repaired += result.rowcount
+
+    if repaired:
+        logger.warning(f"팔로워/팔로잉 수 보정: {repaired}명")
+    return repaired
+
+@click.command('reconcile-follow-counts')
+@with_appcontext
+def reconcile_follow_counts_command():
+    """팔로워/팔로잉 수를 followers 테이블 기준으로 보정"""
+    repaired = reconcile_follow_counts()
+    click.echo(f"팔로워/팔로잉 수 보정 완료: {repaired}명")
@@ -0,0 +1,112 @@
+import time
+import threading
+import logging
+from collections import OrderedDict
+from flask import current_app, g, session
+from flask_login import current_user
+from sqlalchemy.orm import make_transient_to_detached
+from app.extensions import db
+from app.models import User
+
+# 요청 사용자 확인
+# - resolve(): 요청당 한 번만 계산해 flask.g에 저장 (get_user_info 등이 공유)
+# - load_user(): 사용자 캐시에서 User를 꺼내 현재 세션에 붙임, 없으면 한 번 조회
+# - 캐시는 워커 프로세스별 LRU(USER_CACHE_SIZE)이고 USER_CACHE_TTL이 지나면 다시 조회
+#   프로필/팔로우 변경 시 invalidate()로 해당 워커의 항목을 제거
+#   다른 워커의 항목은 TTL 안에 갱신됨
+#   따라서 ETag(버전)와 함께 보내는 응답은 캐시 값이 아니라 DB에서 읽은 값으로 만들어야 함
+
+logger = logging.getLogger(__name__)
+
+class UserCache:
+    """크기 제한과 만료 시간이 있는 사용자 컬럼 값 캐시 (스레드 안전)"""
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            item = self._items.get(user_id)
+            if item is None:
+                return None
+            expires_at, values = item
+            if expires_at < time.monotonic():
+                del self._items[user_id]
+                return None
+            self._items.move_to_end(user_id)
+            return values
+
+    def set(self, user_id, values):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._items[user_id] = (time.monotonic() + self.ttl, values)
+            self._items.move_to_end(user_id)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def delete(self, user_id):
+        with self._lock:
+            self._items.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+def init_app(app):
+    app.extensions['user_cache'] = UserCache(
+        maxsize=app.config.get('USER_CACHE_SIZE', 1024),
+        ttl=app.config.get('USER_CACHE_TTL', 60)
+    )
+
+def _cache():
+    return current_app.extensions['user_cache']
+
+def load_user(user_id):
+    """현재 DB 세션에 붙은 User 반환 (캐시 적중 시 조회 없음), 없으면 None"""
+    if not user_id:
+        return None
+
+    values = _cache().get(user_id)
+    if values is not None:
+        # 캐시된 값으로 만든 객체를 조회 없이 세션에 연결
+        user = User(**values)
+        make_transient_to_detached(user)
+        return db.session.merge(user, load=False)
+
+    user = User.query.get(user_id)
+    if user:
+        _cache().set(user_id, {column.key: getattr(user, column.key)
+                               for column in User.__table__.columns})
+    return user
+
+def invalidate(*user_ids):
+    """사용자 정보 변경 후 (커밋 뒤) 캐시 항목 제거"""
+    cache = _cache()
+    for user_id in user_ids:
+        cache.delete(user_id)
+
+def resolve():
+    """(user_id, anonymous_id, user) 반환 - 요청당 한 번만 계산"""
+    if 'identity' in g:
+        return g.identity
+
+    user_id = session.get('user_id')
+    anonymous_id = session.get('anonymous_id')
+
+    if current_user.is_authenticated:
+        identity = (current_user.id, None, current_user._get_current_object())
+    else:
+        user = load_user(user_id)
+        if user:
+            identity = (user.id, None, user)
+        else:
+            if user_id:
+                logger.warning(f"세션의 사용자 ID가 유효하지 않음: {user_id}")
+            identity = (user_id, anonymous_id, None)
+
+    g.identity = identity
+    return identity
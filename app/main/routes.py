@@ -2,8 +2,9 @@
 from flask import render_template, redirect, url_for, session, request, flash, jsonify
 from flask_login import login_required, current_user
 from app.main import main
-from app.models import User, Todo, Category
+from app.models import Category
 from app.extensions import db
+from app import versions, stats
 import logging
 
 # 로깅 설정
@@ -34,6 +35,7 @@ def todo():
             )
             
             db.session.add(category)
+            versions.bump(user_id, versions.SCOPE_CATEGORIES)
             db.session.commit()
             
             logger.info(f"카테고리 생성 성공: {category_name}, 사용자 ID: {user_id}")
@@ -61,21 +63,16 @@ def mypage():
         logger.warning(f"세션 사용자 ID({session.get('user_id')})와 현재 사용자 ID({current_user.id})가 일치하지 않음")
         session['user_id'] = current_user.id
     
-    # 모든 할 일 및 완료된 할 일 개수 계산
-    todos = Todo.query.filter_by(user_id=current_user.id).all()
-    completed_todos = sum(1 for todo in todos if todo.completed)
-    
-    # 팔로잉/팔로워 수 계산
-    following_count = current_user.followed.count()
-    followers_count = current_user.followers.count()
+    # 전체 및 완료된 할 일 개수 (집계 테이블)
+    todos_count, completed_todos = stats.user_totals(current_user.id)
     
     active_page = 'mypage'  # 현재 활성 탭
     return render_template('public/mypage.html', 
                           active_page=active_page,
-                          todos_count=len(todos),
+                          todos_count=todos_count,
                           completed_count=completed_todos,
-                          following_count=following_count,
-                          followers_count=followers_count,
+                          following_count=current_user.following_count,
+                          followers_count=current_user.followers_count,
                           user=current_user)
 
 @main.route('/settings')
@@ -92,36 +89,17 @@ def settings():
 def get_todo_stats():
     """사용자의 할 일 통계 정보"""
     try:
-        # 모든 할 일 및 완료된 할 일 개수 계산
-        todos = Todo.query.filter_by(user_id=current_user.id).all()
-        completed_todos = sum(1 for todo in todos if todo.completed)
-        
-        # 카테고리별 할 일 수 계산
-        category_stats = {}
-        for todo in todos:
-            category_id = todo.category_id
-            category_name = '카테고리 없음'
-            
-            if category_id:
-                category = Category.query.get(category_id)
-                if category:
-                    category_name = category.name
-            
-            if category_name not in category_stats:
-                category_stats[category_name] = {'total': 0, 'completed': 0}
-            
-            category_stats[category_name]['total'] += 1
-            if todo.completed:
-                category_stats[category_name]['completed'] += 1
+        # 카테고리별 할 일 수 (집계 테이블)
+        category_stats = stats.category_stats(current_user.id)
+        total_todos = sum(entry['total'] for entry in category_stats.values())
+        completed_todos = sum(entry['completed'] for entry in category_stats.values())
         
-        stats = {
-            'total_todos': len(todos),
+        return jsonify({
+            'total_todos': total_todos,
             'completed_todos': completed_todos,
-            'completion_rate': round(completed_todos / len(todos) * 100, 1) if todos else 0,
+            'completion_rate': round(completed_todos / total_todos * 100, 1) if total_todos else 0,
             'category_stats': category_stats
-        }
-        
-        return jsonify(stats)
+        })
     except Exception as e:
         logger.error(f"통계 조회 중 오류: {str(e)}")
         return jsonify({'error': '통계 조회 중 오류가 발생했습니다.'}), 500
\ No newline at end of file
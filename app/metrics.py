@@ -0,0 +1,356 @@
+import os
+import json
+import time
+import glob
+import logging
+import threading
+from flask import g, request, current_app, has_app_context, has_request_context, jsonify
+from sqlalchemy import event, exc, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from app.extensions import db
+
+# 운영 지표 및 상태 확인
+# - GET /health: 프로세스 생존 여부 (DB 확인 없음, Docker HEALTHCHECK용)
+# - GET /ready: DB에 SELECT 1을 실행해 요청을 받을 수 있는지 확인
+# - GET /metrics: Prometheus 텍스트 형식 지표
+#   라우트별 응답 시간, 요청당 SQL 문 수/실행 시간(엔진 이벤트로 수집), 연결 풀 대기 시간
+#   엔진(bind)별 연결 풀 크기와 사용 중/대기 연결 수 (gauge, 지표를 기록할 때 수집)
+# - 다중 워커(gunicorn): METRICS_MULTIPROC_DIR를 지정하면 워커마다 지표 파일을 기록하고
+#   /metrics는 디렉터리의 모든 파일을 합산 (서버 시작 시 디렉터리를 비워야 함)
+#   gauge는 살아 있는 워커의 파일만 합산
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+# 지표 이름: (종류, 설명, 레이블, 버킷)
+METRICS = {
+    'app_http_request_duration_seconds': (
+        'histogram', '라우트별 요청 처리 시간', ('method', 'route', 'status'), LATENCY_BUCKETS),
+    'app_request_sql_statements': (
+        'histogram', '요청당 실행한 SQL 문 수', ('route',), SQL_COUNT_BUCKETS),
+    'app_sql_statements_total': (
+        'counter', '실행한 SQL 문 수', ('route',), None),
+    'app_sql_duration_seconds_total': (
+        'counter', 'SQL 실행 시간 합계', ('route',), None),
+    'app_db_pool_checkout_wait_seconds': (
+        'histogram', '연결 풀에서 연결을 얻기까지 기다린 시간', (), POOL_WAIT_BUCKETS),
+    'app_db_pool_checkout_timeouts_total': (
+        'counter', 'pool_timeout 안에 연결을 얻지 못한 횟수', (), None),
+    'app_db_pool_size': (
+        'gauge', '연결 풀 크기 (pool_size)', ('bind',), None),
+    'app_db_pool_max_overflow': (
+        'gauge', '풀 크기를 넘어 추가로 열 수 있는 연결 수 (max_overflow)', ('bind',), None),
+    'app_db_pool_checked_out': (
+        'gauge', '사용 중인 연결 수', ('bind',), None),
+    'app_db_pool_idle': (
+        'gauge', '풀에서 대기 중인 연결 수', ('bind',), None),
+}
+
+GAUGES = [name for name, (kind, *_) in METRICS.items() if kind == 'gauge']
+
+# 요청 밖(백그라운드 스레드, CLI)에서 실행한 SQL의 route 레이블
+BACKGROUND_ROUTE = 'background'
+UNMATCHED_ROUTE = 'unmatched'
+
+class MetricsRegistry:
+    """현재 프로세스의 지표 값 (스레드 안전)
+
+    histogram 값은 [버킷별 개수(누적 아님), 합계, 개수], counter/gauge 값은 숫자.
+    collectors는 스냅샷을 만들기 직전에 호출되어 gauge 값을 갱신함.
+    """
+
+    def __init__(self):
+        self._values = {name: {} for name in METRICS}
+        self._lock = threading.Lock()
+        self.collectors = []
+
+    def observe(self, name, value, labels=()):
+        buckets = METRICS[name][3]
+        with self._lock:
+            series = self._values[name].get(labels)
+            if series is None:
+                series = self._values[name][labels] = [[0] * (len(buckets) + 1), 0.0, 0]
+            index = next((i for i, bound in enumerate(buckets) if value <= bound), len(buckets))
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def inc(self, name, value=1, labels=()):
+        with self._lock:
+            self._values[name][labels] = self._values[name].get(labels, 0) + value
+
+    def set(self, name, value, labels=()):
+        with self._lock:
+            self._values[name][labels] = value
+
+    def snapshot(self):
+        """JSON으로 저장할 수 있는 현재 값 (복사본)"""
+        for collect in self.collectors:
+            try:
+                collect(self)
+            except Exception as e:
+                logger.error(f"지표 수집 중 오류: {str(e)}")
+        with self._lock:
+            return {
+                name: [[list(labels), _copy_value(value)] for labels, value in series.items()]
+                for name, series in self._values.items()
+            }
+
+def _copy_value(value):
+    if isinstance(value, list):
+        return [list(value[0]), value[1], value[2]]
+    return value
+
+def merge_snapshots(snapshots):
+    """여러 프로세스의 스냅샷 합산"""
+    merged = {name: {} for name in METRICS}
+    for snapshot in snapshots:
+        for name, series in snapshot.items():
+            if name not in merged:
+                continue
+            for labels, value in series:
+                labels = tuple(labels)
+                current = merged[name].get(labels)
+                if current is None:
+                    merged[name][labels] = _copy_value(value)
+                elif METRICS[name][0] == 'histogram':
+                    current[0] = [a + b for a, b in zip(current[0], value[0])]
+                    current[1] += value[1]
+                    current[2] += value[2]
+                else:
+                    merged[name][labels] = current + value
+    return merged
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+def _format_number(value):
+    if isinstance(value, float) and value.is_integer():
+        return repr(value)
+    return str(value)
+
+def render(merged):
+    """Prometheus 텍스트 형식 (0.0.4)"""
+    lines = []
+    for name, (kind, description, label_names, buckets) in METRICS.items():
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in sorted(merged[name].items()):
+            if kind != 'histogram':
+                lines.append(f'{name}{_format_labels(label_names, labels)} {_format_number(value)}')
+                continue
+
+            counts, total, count = value
+            cumulative = 0
+            for bound, bucket_count in zip(list(buckets) + ['+Inf'], counts):
+                cumulative += bucket_count
+                le = bound if bound == '+Inf' else _format_number(float(bound))
+                lines.append(f'{name}_bucket{_format_labels(label_names, labels, ("le", le))} {cumulative}')
+            lines.append(f'{name}_sum{_format_labels(label_names, labels)} {_format_number(total)}')
+            lines.append(f'{name}_count{_format_labels(label_names, labels)} {count}')
+    return '\n'.join(lines) + '\n'
+
+class MultiprocessWriter:
+    """워커별 지표 파일 기록 (METRICS_MULTIPROC_DIR/metrics_<pid>.json)"""
+
+    def __init__(self, directory, interval):
+        self.directory = directory
+        self.interval = interval
+        self._written_at = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def maybe_write(self, registry, force=False):
+        now = time.monotonic()
+        if not force and now - self._written_at < self.interval:
+            return
+        with self._lock:
+            self._written_at = now
+            path = os.path.join(self.directory, f'metrics_{os.getpid()}.json')
+            temp_path = f'{path}.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(registry.snapshot(), f)
+            os.replace(temp_path, path)
+
+    def collect(self):
+        snapshots = []
+        for path in glob.glob(os.path.join(self.directory, 'metrics_*.json')):
+            try:
+                with open(path) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"지표 파일을 읽을 수 없음: {path} ({e})")
+                continue
+
+            # 종료된 워커(max_requests 재시작 등)의 counter는 유지하고 gauge는 제외
+            pid = os.path.basename(path)[len('metrics_'):-len('.json')]
+            if not _pid_alive(int(pid)):
+                for name in GAUGES:
+                    snapshot.pop(name, None)
+            snapshots.append(snapshot)
+        return snapshots
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+class TimedQueuePool(QueuePool):
+    """연결을 얻기까지 기다린 시간을 기록하는 QueuePool"""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            registry = _registry()
+            if registry is not None:
+                registry.inc('app_db_pool_checkout_timeouts_total')
+            raise
+        finally:
+            registry = _registry()
+            if registry is not None:
+                registry.observe('app_db_pool_checkout_wait_seconds', time.perf_counter() - started_at)
+
+def _registry():
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('metrics')
+
+def collect_pool_gauges(app):
+    """앱이 만든 엔진별 연결 풀 상태를 gauge로 기록하는 수집 함수"""
+    def collect(registry):
+        state = app.extensions.get('sqlalchemy')
+        if state is None:
+            return
+        for bind, connector in list(state.connectors.items()):
+            engine = connector._engine
+            # 크기가 정해진 풀(QueuePool)만 기록, SQLite의 StaticPool/NullPool은 제외
+            if engine is None or not isinstance(engine.pool, QueuePool):
+                continue
+            pool = engine.pool
+            labels = (bind or 'default',)
+            registry.set('app_db_pool_size', pool.size(), labels)
+            registry.set('app_db_pool_max_overflow', pool._max_overflow, labels)
+            registry.set('app_db_pool_checked_out', pool.checkedout(), labels)
+            registry.set('app_db_pool_idle', pool.checkedin(), labels)
+    return collect
+
+def _route():
+    if not has_request_context():
+        return BACKGROUND_ROUTE
+    rule = request.url_rule
+    return rule.rule if rule is not None else UNMATCHED_ROUTE
+
+# SQL 실행 시간 수집 (모든 엔진에 한 번만 등록)
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('metrics_started_at', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get('metrics_started_at')
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+
+    registry = _registry()
+    if registry is None:
+        return
+
+    if has_request_context():
+        g.metrics_sql_count = g.get('metrics_sql_count', 0) + 1
+        g.metrics_sql_time = g.get('metrics_sql_time', 0.0) + elapsed
+    else:
+        registry.inc('app_sql_statements_total', 1, (BACKGROUND_ROUTE,))
+        registry.inc('app_sql_duration_seconds_total', elapsed, (BACKGROUND_ROUTE,))
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(context):
+    # 실패한 문은 after_cursor_execute가 호출되지 않으므로 시작 시각만 제거
+    if context.connection is not None:
+        started = context.connection.info.get('metrics_started_at')
+        if started:
+            started.pop()
+
+def init_app(app):
+    registry = MetricsRegistry()
+    registry.collectors.append(collect_pool_gauges(app))
+    app.extensions['metrics'] = registry
+
+    directory = app.config.get('METRICS_MULTIPROC_DIR')
+    writer = MultiprocessWriter(directory, app.config.get('METRICS_FLUSH_INTERVAL', 5)) if directory else None
+
+    # MySQL 등 QueuePool을 쓰는 DB는 연결 대기 시간을 기록하는 풀 사용
+    if not app.config.get('SQLALCHEMY_DATABASE_URI', '').startswith('sqlite'):
+        options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+        options.setdefault('poolclass', TimedQueuePool)
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+    @app.before_request
+    def start_request_timer():
+        g.metrics_started_at = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        started_at = g.get('metrics_started_at')
+        if started_at is None:
+            return response
+
+        route = _route()
+        sql_count = g.get('metrics_sql_count', 0)
+        registry.observe('app_http_request_duration_seconds', time.perf_counter() - started_at,
+                         (request.method, route, str(response.status_code)))
+        registry.observe('app_request_sql_statements', sql_count, (route,))
+        registry.inc('app_sql_statements_total', sql_count, (route,))
+        registry.inc('app_sql_duration_seconds_total', g.get('metrics_sql_time', 0.0), (route,))
+
+        if writer is not None:
+            try:
+                writer.maybe_write(registry)
+            except OSError as e:
+                logger.error(f"지표 파일 기록 중 오류: {str(e)}")
+        return response
+
+    def health():
+        """생존 확인"""
+        return jsonify({'status': 'ok'})
+
+    def ready():
+        """DB 연결 확인"""
+        try:
+            db.session.execute(text('SELECT 1'))
+            return jsonify({'status': 'ok'})
+        except Exception as e:
+            logger.error(f"준비 상태 확인 중 DB 오류: {str(e)}")
+            db.session.rollback()
+            return jsonify({'status': 'unavailable'}), 503
+
+    def metrics():
+        """Prometheus 지표"""
+        if writer is not None:
+            writer.maybe_write(registry, force=True)
+            merged = merge_snapshots(writer.collect())
+        else:
+            merged = merge_snapshots([registry.snapshot()])
+        return app.response_class(render(merged), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+    app.add_url_rule('/health', 'health', health)
+    app.add_url_rule('/ready', 'ready', ready)
+    app.add_url_rule('/metrics', 'metrics', metrics)
@@ -20,6 +20,16 @@ class User(UserMixin, db.Model):
     profile_image = db.Column(db.String(200), default='default.jpg')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # 팔로워가 많아 타임라인 fan-out 대신 읽기 시 병합하는 사용자
+    fanout_disabled = db.Column(db.Boolean, default=False, server_default=db.false(), nullable=False)
+    
+    # 팔로워/팔로잉 수 (follow/unfollow에서 갱신, flask reconcile-follow-counts로 보정)
+    followers_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    following_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    
+    # 팔로우 관계가 바뀌어 추천을 다시 계산해야 하는 시각 (flask refresh-recommendations에서 처리 후 비움)
+    recommendations_stale_at = db.Column(db.DateTime, nullable=True, index=True)
+    
     # 관계 설정
     todos = db.relationship('Todo', foreign_keys='Todo.user_id', backref='user', lazy='dynamic', cascade='all, delete-orphan')
     categories = db.relationship('Category', foreign_keys='Category.user_id', backref='user', lazy='dynamic', cascade='all, delete-orphan')
@@ -46,11 +56,16 @@ class User(UserMixin, db.Model):
     def follow(self, user):
         if not self.is_following(user):
             self.followed.append(user)
+            # 동시 요청에도 누락되지 않도록 UPDATE ... SET count = count + 1로 반영
+            self.following_count = User.following_count + 1
+            user.followers_count = User.followers_count + 1
             return self
             
     def unfollow(self, user):
         if self.is_following(user):
             self.followed.remove(user)
+            self.following_count = User.following_count - 1
+            user.followers_count = User.followers_count - 1
             return self
             
     def is_following(self, user):
@@ -74,8 +89,8 @@ class User(UserMixin, db.Model):
             'bio': self.bio,
             'profile_image': self.profile_image,
             'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            'followers_count': self.followers.count(),
-            'following_count': self.followed.count()
+            'followers_count': self.followers_count,
+            'following_count': self.following_count
         }
 
 class Todo(db.Model):
@@ -93,21 +108,34 @@ class Todo(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
     category_id = db.Column(db.Integer, db.ForeignKey('category.id'))
     
-    def to_dict(self):
-        """할 일 정보를 딕셔너리로 반환"""
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'date': self.date.strftime('%Y-%m-%d'),
-            'completed': self.completed,
-            'pinned': self.pinned,
-            'category_id': self.category_id,
-            'is_public': self.is_public,
-            'user_id': self.user_id,
-            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            'updated_at': self.updated_at.strftime('%Y-%m-%d %H:%M:%S')
-        }
+    # 사용자별 날짜 범위 조회 및 (date, id) 키셋 페이지네이션용 복합 인덱스
+    # 증분 동기화(/api/sync)의 변경분 조회용 인덱스
+    __table_args__ = (
+        db.Index('ix_todo_user_date_id', 'user_id', 'date', 'id'),
+        db.Index('ix_todo_user_updated', 'user_id', 'updated_at'),
+    )
+    
+    # 직렬화 가능한 필드 (to_dict 출력 순서)
+    SERIALIZABLE_FIELDS = ('id', 'title', 'description', 'date', 'completed', 'pinned',
+                           'category_id', 'is_public', 'user_id', 'created_at', 'updated_at')
+    
+    # 날짜 필드별 출력 형식
+    DATE_FORMATS = {
+        'date': '%Y-%m-%d',
+        'created_at': '%Y-%m-%d %H:%M:%S',
+        'updated_at': '%Y-%m-%d %H:%M:%S'
+    }
+    
+    def to_dict(self, fields=None):
+        """할 일 정보를 딕셔너리로 반환 (fields 지정 시 해당 필드만 반환)"""
+        data = {}
+        for field in fields or self.SERIALIZABLE_FIELDS:
+            value = getattr(self, field)
+            date_format = self.DATE_FORMATS.get(field)
+            if date_format and value is not None:
+                value = value.strftime(date_format)
+            data[field] = value
+        return data
         
     @staticmethod
     def from_dict(data, user_id=None):
@@ -133,6 +161,7 @@ class Category(db.Model):
     name = db.Column(db.String(50), nullable=False)
     color = db.Column(db.String(20), default='#3498db')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # 외래 키
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
@@ -162,6 +191,66 @@ class Category(db.Model):
             
         return category
 
+class TimelineEntry(db.Model):
+    """팔로워별 탐색 타임라인 (공개 할 일 작성 시 fan-out으로 기록)"""
+    __tablename__ = 'timeline_entry'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)  # 타임라인 소유자 (팔로워)
+    todo_id = db.Column(db.Integer, db.ForeignKey('todo.id', ondelete='CASCADE'), primary_key=True)
+    author_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False)  # 할 일 생성 시각 (정렬 키)
+    
+    __table_args__ = (
+        db.Index('ix_timeline_entry_user_created', 'user_id', 'created_at', 'todo_id'),
+        db.Index('ix_timeline_entry_todo', 'todo_id'),
+        db.Index('ix_timeline_entry_user_author', 'user_id', 'author_id'),
+    )
+
+class UserRecommendation(db.Model):
+    """사용자별 추천 사용자 상위 K개 (flask refresh-recommendations로 계산)"""
+    __tablename__ = 'user_recommendation'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)  # 추천을 받는 사용자
+    candidate_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    score = db.Column(db.Float, nullable=False)
+    mutual_count = db.Column(db.Integer, nullable=False)  # 함께 아는 사용자 수 (내가 팔로우하는 사용자 중 후보를 팔로우하는 수)
+    
+    __table_args__ = (
+        db.Index('ix_user_recommendation_user_score', 'user_id', 'score'),
+    )
+
+class SyncTombstone(db.Model):
+    """삭제 기록 - 증분 동기화(/api/sync)에서 클라이언트 캐시에 삭제를 반영하기 위해 사용"""
+    __tablename__ = 'sync_tombstone'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
+    entity = db.Column(db.String(20), nullable=False)  # todo, category
+    entity_id = db.Column(db.Integer, nullable=False)
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    __table_args__ = (
+        db.Index('ix_sync_tombstone_user_deleted', 'user_id', 'deleted_at'),
+        db.Index('ix_sync_tombstone_deleted', 'deleted_at'),
+    )
+
+class UserDataVersion(db.Model):
+    """사용자별 데이터 버전 - 쓰기 경로에서 증가시키고 목록 API의 ETag로 사용"""
+    __tablename__ = 'user_data_version'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    scope = db.Column(db.String(20), primary_key=True)  # todos, categories, notifications, profile
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+class UserTodoStats(db.Model):
+    """사용자/카테고리별 할 일 집계 - 할 일과 카테고리 쓰기 경로에서 함께 갱신"""
+    __tablename__ = 'user_todo_stats'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    category_id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # 0은 카테고리 없음
+    total = db.Column(db.Integer, nullable=False, default=0)
+    completed = db.Column(db.Integer, nullable=False, default=0)
+
 class Notification(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     message = db.Column(db.String(200), nullable=False)
@@ -173,6 +262,13 @@ class Notification(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     sender_id = db.Column(db.Integer, db.ForeignKey('user.id'))
     
+    # 최신순 목록의 (created_at, id) 키셋 페이지네이션용 인덱스 (id는 기본 키로 인덱스에 포함됨)
+    # 읽지 않은 알림 수 조회와 읽음 처리용 인덱스
+    __table_args__ = (
+        db.Index('ix_notification_user_created', 'user_id', 'created_at'),
+        db.Index('ix_notification_user_read', 'user_id', 'is_read'),
+    )
+    
     # 알림 보낸 사용자와의 관계 명시적 설정
     sender = db.relationship('User', foreign_keys=[sender_id], 
                             backref=db.backref('sent_notifications', lazy='dynamic'))
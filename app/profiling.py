@@ -0,0 +1,207 @@
+import io
+import os
+import re
+import hmac
+import json
+import time
+import uuid
+import random
+import pstats
+import cProfile
+import logging
+from datetime import datetime
+from flask import g, request, current_app, has_request_context, jsonify, abort
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 요청 프로파일링
+# - 프로파일 대상: X-Profile 헤더에 PROFILING_TOKEN을 보낸 요청, PROFILING_SAMPLE_RATE 비율의 표본 요청
+#   cProfile 결과(누적 시간 상위 함수)와 실행한 SQL 문/시간을 순서대로 기록
+# - 느린 요청: PROFILING_SLOW_THRESHOLD_MS를 넘은 요청은 SQL 기록과 함께 자동 저장 (cProfile 없음)
+#   기본값 0은 사용 안 함, 환경변수로 설정한 경우에만 요청마다 SQL을 기록
+# - 저장: PROFILING_DIR에 요청마다 JSON 파일 하나, PROFILING_MAX_FILES개를 넘으면 오래된 것부터 삭제
+# - 조회: GET /debug/profiles, GET /debug/profiles/<id> (X-Profile 헤더에 토큰 필요)
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_PATTERN = re.compile(r'^[0-9]+-[0-9a-f]{8}$')
+
+def _authorized():
+    """X-Profile 헤더가 설정된 토큰과 일치하는지 확인"""
+    token = current_app.config.get('PROFILING_TOKEN')
+    supplied = request.headers.get(PROFILE_HEADER)
+    return bool(token and supplied) and hmac.compare_digest(token.encode('utf-8'), supplied.encode('utf-8'))
+
+def _profile_dir():
+    return current_app.config.get('PROFILING_DIR') or os.path.join(current_app.instance_path, 'profiles')
+
+# SQL 문 기록 (요청에서 기록 중일 때만)
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and g.get('profile_sql') is not None:
+        conn.info.setdefault('profile_started_at', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get('profile_started_at')
+    if not started or not has_request_context():
+        return
+    started_at = started.pop()
+    elapsed = time.perf_counter() - started_at
+
+    statements = g.get('profile_sql')
+    if statements is not None and len(statements) < current_app.config['PROFILING_MAX_STATEMENTS']:
+        statements.append({
+            'statement': statement,
+            'duration_ms': round(elapsed * 1000, 3),
+            'offset_ms': round((started_at - g.profile_started_at) * 1000, 3)  # 요청 시작부터 실행 시작까지
+        })
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(context):
+    if context.connection is not None:
+        started = context.connection.info.get('profile_started_at')
+        if started:
+            started.pop()
+
+def save_profile(record):
+    """프로파일 기록 저장 후 보관 개수 초과분 삭제"""
+    directory = _profile_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    path = os.path.join(directory, f"{record['id']}.json")
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(record, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+    # 파일 이름이 시각 순이므로 이름 순 정렬 = 오래된 순
+    files = sorted(name for name in os.listdir(directory) if name.endswith('.json'))
+    for name in files[:max(0, len(files) - current_app.config['PROFILING_MAX_FILES'])]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+
+def list_profiles():
+    """저장된 프로파일 요약 (최신순)"""
+    directory = _profile_dir()
+    if not os.path.isdir(directory):
+        return []
+
+    summaries = []
+    for name in sorted((name for name in os.listdir(directory) if name.endswith('.json')), reverse=True):
+        try:
+            with open(os.path.join(directory, name), encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            continue
+        summaries.append({key: record.get(key) for key in
+                          ('id', 'trigger', 'method', 'path', 'status', 'duration_ms', 'sql_count', 'created_at')})
+    return summaries
+
+def load_profile(profile_id):
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    try:
+        with open(os.path.join(_profile_dir(), f'{profile_id}.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def init_app(app):
+
+    @app.before_request
+    def start_profiling():
+        # 프로파일 조회 요청과 정적 파일은 기록하지 않음
+        if request.endpoint in ('profiles', 'profile_detail', 'static'):
+            return
+
+        config = current_app.config
+        g.profile_started_at = time.perf_counter()
+
+        trigger = None
+        if _authorized():
+            trigger = 'header'
+        elif config['PROFILING_SAMPLE_RATE'] and random.random() < config['PROFILING_SAMPLE_RATE']:
+            trigger = 'sample'
+
+        # 프로파일 대상이거나 느린 요청 기록이 켜져 있으면 SQL 기록
+        if trigger or config['PROFILING_SLOW_THRESHOLD_MS']:
+            g.profile_sql = []
+
+        if trigger:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # 같은 스레드에서 다른 프로파일러가 동작 중
+                return
+            g.profiler = profiler
+            g.profile_trigger = trigger
+
+    @app.after_request
+    def finish_profiling(response):
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+
+        started_at = g.get('profile_started_at')
+        if started_at is None:
+            return response
+        duration_ms = (time.perf_counter() - started_at) * 1000
+
+        trigger = g.get('profile_trigger')
+        threshold = current_app.config['PROFILING_SLOW_THRESHOLD_MS']
+        if trigger is None and threshold and duration_ms >= threshold:
+            trigger = 'slow'
+        if trigger is None:
+            return response
+
+        statements = g.get('profile_sql') or []
+        record = {
+            'id': f"{time.time_ns() // 1000}-{uuid.uuid4().hex[:8]}",  # 마이크로초 시각 (이름 순 = 시간 순)
+            'trigger': trigger,
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'endpoint': request.endpoint,
+            'status': response.status_code,
+            'duration_ms': round(duration_ms, 3),
+            'sql_count': len(statements),
+            'sql_time_ms': round(sum(item['duration_ms'] for item in statements), 3),
+            'sql': statements,
+            'profile': None,
+            'created_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        if profiler is not None:
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats('cumulative')\
+                  .print_stats(current_app.config['PROFILING_TOP_FUNCTIONS'])
+            record['profile'] = stream.getvalue()
+
+        try:
+            save_profile(record)
+            if trigger != 'slow':
+                response.headers['X-Profile-Id'] = record['id']
+        except OSError as e:
+            logger.error(f"프로파일 저장 중 오류: {str(e)}")
+        return response
+
+    def profiles():
+        """저장된 프로파일 목록"""
+        if not _authorized():
+            abort(404)
+        return jsonify(list_profiles())
+
+    def profile_detail(profile_id):
+        """프로파일 상세"""
+        if not _authorized():
+            abort(404)
+        record = load_profile(profile_id)
+        if record is None:
+            abort(404)
+        return jsonify(record)
+
+    app.add_url_rule('/debug/profiles', 'profiles', profiles)
+    app.add_url_rule('/debug/profiles/<profile_id>', 'profile_detail', profile_detail)
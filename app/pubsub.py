@@ -0,0 +1,187 @@
+import queue
+import threading
+import logging
+from collections import defaultdict
+from werkzeug.utils import import_string
+
+# 알림 실시간 전달용 pub/sub
+# - NotificationBroker는 현재 프로세스의 구독자(SSE 연결)를 관리
+# - 백엔드는 새 알림을 구독자에게 전달하는 방식을 결정
+#   memory: create_notification이 같은 프로세스의 구독자에게 직접 전달 (단일 워커)
+#   database: 워커마다 스레드 하나가 새 알림 행을 주기적으로 조회해 전달 (다중 워커)
+# 다른 백엔드는 NOTIFICATION_STREAM_BACKEND에 클래스 경로(예: 'mypkg.RedisBackend')로 지정
+
+logger = logging.getLogger(__name__)
+
+class Subscription:
+    """사용자 알림 구독 - 발행된 이벤트를 큐로 전달받음"""
+
+    def __init__(self, user_id, maxsize):
+        self.user_id = user_id
+        self.queue = queue.Queue(maxsize=maxsize)
+
+    def put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            # 느린 클라이언트의 이벤트는 버림 (재접속 시 Last-Event-ID로 복구)
+            logger.warning(f"알림 구독 큐가 가득 참, 이벤트 버림: 사용자 ID={self.user_id}")
+
+    def get(self, timeout):
+        """다음 이벤트 반환, timeout 동안 없으면 None"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+class MemoryBackend:
+    """프로세스 내 전달 백엔드 (단일 워커용)"""
+
+    def __init__(self, broker, app):
+        self.broker = broker
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def publish(self, notification):
+        # 이 프로세스에 구독자가 없으면 직렬화도 생략
+        if self.broker.has_subscribers(notification.user_id):
+            self.broker.dispatch(notification.user_id, {
+                'id': notification.id,
+                'data': notification.to_dict()
+            })
+
+class DatabaseBackend:
+    """DB 폴링 전달 백엔드 (다중 워커용)
+
+    구독자 수와 관계없이 워커당 조회 스레드 하나가 id 범위 스캔으로 새 알림을 가져옴.
+    """
+
+    def __init__(self, broker, app):
+        self.broker = broker
+        self.app = app
+        self.interval = app.config['NOTIFICATION_STREAM_POLL_INTERVAL']
+        self._thread = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name='notification-poller', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def publish(self, notification):
+        # 커밋된 행은 조회 스레드가 전달
+        pass
+
+    def _run(self):
+        from app.extensions import db
+        from app.models import Notification
+
+        with self.app.app_context():
+            last_id = db.session.query(db.func.max(Notification.id)).scalar() or 0
+            db.session.remove()
+
+        while not self._stopped.wait(self.interval):
+            if not self.broker.has_subscribers():
+                continue
+
+            try:
+                with self.app.app_context():
+                    rows = Notification.query.filter(Notification.id > last_id)\
+                                             .order_by(Notification.id)\
+                                             .limit(500).all()
+                    events = []
+                    for notification in rows:
+                        last_id = notification.id
+                        if self.broker.has_subscribers(notification.user_id):
+                            events.append((notification.user_id, {
+                                'id': notification.id,
+                                'data': notification.to_dict()
+                            }))
+                    db.session.remove()
+
+                for user_id, event in events:
+                    self.broker.dispatch(user_id, event)
+            except Exception as e:
+                logger.error(f"새 알림 조회 중 오류: {str(e)}")
+
+BACKENDS = {
+    'memory': MemoryBackend,
+    'database': DatabaseBackend
+}
+
+class NotificationBroker:
+    """현재 프로세스의 알림 구독자 관리 및 발행"""
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.queue_size = 100
+        self.max_connections = 0
+        self._count = 0
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        backend = app.config.get('NOTIFICATION_STREAM_BACKEND', 'memory')
+        backend_class = BACKENDS.get(backend) or import_string(backend)
+
+        self.backend = backend_class(self, app)
+        self.queue_size = app.config.get('NOTIFICATION_STREAM_QUEUE_SIZE', 100)
+        self.max_connections = app.config.get('NOTIFICATION_STREAM_MAX_CONNECTIONS', 0)
+        app.extensions['notification_broker'] = self
+
+    def subscribe(self, user_id):
+        """구독 추가, 이 프로세스의 연결 수가 max_connections에 도달했으면 None"""
+        subscription = Subscription(user_id, self.queue_size)
+        with self._lock:
+            if self.max_connections and self._count >= self.max_connections:
+                return None
+            self._subscribers[user_id].add(subscription)
+            self._count += 1
+
+        # 백엔드는 첫 구독 시점에 시작 (조회 스레드 등)
+        self.backend.start()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscribers.get(subscription.user_id)
+            if subscriptions and subscription in subscriptions:
+                subscriptions.discard(subscription)
+                self._count -= 1
+                if not subscriptions:
+                    del self._subscribers[subscription.user_id]
+
+    def has_subscribers(self, user_id=None):
+        if user_id is None:
+            return bool(self._subscribers)
+        return user_id in self._subscribers
+
+    def dispatch(self, user_id, event):
+        """이 프로세스에서 사용자를 구독 중인 연결에 이벤트 전달"""
+        with self._lock:
+            subscriptions = list(self._subscribers.get(user_id, ()))
+        for subscription in subscriptions:
+            subscription.put(event)
+
+    def publish(self, notification):
+        """커밋된 알림 발행"""
+        if self.backend is None:
+            return
+        try:
+            self.backend.publish(notification)
+        except Exception as e:
+            logger.error(f"알림 발행 중 오류: {str(e)}")
@@ -0,0 +1,181 @@
+import math
+import heapq
+import logging
+from datetime import datetime, timedelta
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import select, func
+from sqlalchemy.orm import load_only
+from app.extensions import db
+from app.models import User, Todo, UserRecommendation, followers
+
+# 사용자 추천 (친구의 친구)
+# - 후보: 내가 팔로우하는 사용자가 팔로우하는 사용자 (2단계), 자신과 이미 팔로우한 사용자 제외
+# - 점수: 함께 아는 사용자 수 + RECOMMENDATION_ACTIVITY_WEIGHT * log(1 + 최근 공개 할 일 수)
+# - 사용자별 상위 RECOMMENDATION_TOP_K개를 user_recommendation에 저장, 탐색 API는 인덱스 범위 조회 한 번
+# - 팔로우/언팔로우 시 영향을 받는 사용자(팔로우한 사용자와 그 팔로워들)를 갱신 대상으로 표시
+# - flask refresh-recommendations를 주기적으로 실행해 갱신 대상만 다시 계산 (--all은 전체)
+#   예: 5분마다 flask refresh-recommendations, 하루 한 번 flask refresh-recommendations --all
+# 계산 결과가 없는 사용자(신규 등)는 조회 시 기존 방식으로 대체
+
+logger = logging.getLogger(__name__)
+
+def mark_stale(follower_id, followed_id):
+    """팔로우 관계 변경으로 추천이 바뀌는 사용자를 갱신 대상으로 표시
+
+    follower의 2단계 후보가 바뀌고, follower를 팔로우하는 사용자들은 follower를 거쳐 가는 후보가 바뀜.
+    팔로워가 많은 사용자의 팔로워들은 주기적인 전체 계산에서 반영.
+    """
+    table = User.__table__
+    now = datetime.utcnow()
+    db.session.execute(table.update().where(table.c.id == follower_id).values(recommendations_stale_at=now))
+
+    follower_count = db.session.query(User.followers_count).filter(User.id == follower_id).scalar() or 0
+    if follower_count < current_app.config['RECOMMENDATION_PROPAGATE_MAX_FOLLOWERS']:
+        db.session.execute(
+            table.update()
+                 .where(table.c.id.in_(select(followers.c.follower_id).where(followers.c.followed_id == follower_id)))
+                 .values(recommendations_stale_at=now)
+        )
+
+    # 새로 팔로우한 사용자는 다음 계산 전에도 추천에서 바로 제외
+    db.session.execute(
+        UserRecommendation.__table__.delete().where(
+            UserRecommendation.user_id == follower_id,
+            UserRecommendation.candidate_id == followed_id
+        )
+    )
+
+def compute_recommendations(user_ids):
+    """사용자별 추천 상위 K개 계산 - {user_id: [(candidate_id, score, mutual_count), ...]}"""
+    config = current_app.config
+    top_k = config['RECOMMENDATION_TOP_K']
+    weight = config['RECOMMENDATION_ACTIVITY_WEIGHT']
+
+    # 2단계 팔로우 관계를 (사용자, 후보)별로 집계
+    first, second, followed = followers.alias('f1'), followers.alias('f2'), followers.alias('f3')
+    mutual_rows = db.session.execute(
+        select(first.c.follower_id, second.c.followed_id, func.count())
+            .select_from(first.join(second, second.c.follower_id == first.c.followed_id))
+            .where(
+                first.c.follower_id.in_(user_ids),
+                second.c.followed_id != first.c.follower_id,
+                ~select(followed.c.followed_id).where(followed.c.follower_id == first.c.follower_id,
+                                                      followed.c.followed_id == second.c.followed_id).exists()
+            )
+            .group_by(first.c.follower_id, second.c.followed_id)
+    ).all()
+
+    # 후보들의 최근 공개 할 일 수 (user_id, updated_at 인덱스)
+    candidate_ids = {candidate_id for _, candidate_id, _ in mutual_rows}
+    activity = {}
+    if candidate_ids:
+        since = datetime.utcnow() - timedelta(days=config['RECOMMENDATION_ACTIVITY_DAYS'])
+        activity = dict(db.session.execute(
+            select(Todo.user_id, func.count())
+                .where(Todo.user_id.in_(candidate_ids), Todo.updated_at >= since, Todo.is_public == True)
+                .group_by(Todo.user_id)
+        ).all())
+
+    candidates = {user_id: [] for user_id in user_ids}
+    for user_id, candidate_id, mutual_count in mutual_rows:
+        score = mutual_count + weight * math.log1p(activity.get(candidate_id, 0))
+        candidates[user_id].append((candidate_id, score, mutual_count))
+
+    # 점수가 같으면 ID가 작은 후보 먼저
+    return {
+        user_id: heapq.nsmallest(top_k, rows, key=lambda row: (-row[1], row[0]))
+        for user_id, rows in candidates.items()
+    }
+
+def refresh_recommendations(user_ids, stale_before=None):
+    """사용자들의 추천을 다시 계산해 저장 후 커밋
+
+    stale_before 이전에 표시된 갱신 대상만 해제 (계산 중 다시 표시된 사용자는 다음 실행에서 처리).
+    """
+    if not user_ids:
+        return 0
+
+    recommendations = compute_recommendations(user_ids)
+    rows = [
+        {'user_id': user_id, 'candidate_id': candidate_id, 'score': score, 'mutual_count': mutual_count}
+        for user_id, ranked in recommendations.items()
+        for candidate_id, score, mutual_count in ranked
+    ]
+
+    table = UserRecommendation.__table__
+    db.session.execute(table.delete().where(table.c.user_id.in_(user_ids)))
+    if rows:
+        db.session.execute(table.insert().values(rows))
+
+    stale_before = stale_before or datetime.utcnow()
+    db.session.execute(
+        User.__table__.update()
+            .where(User.id.in_(user_ids), User.recommendations_stale_at <= stale_before)
+            .values(recommendations_stale_at=None)
+    )
+    db.session.commit()
+    return len(rows)
+
+def refresh_stale_recommendations(batch_size=None):
+    """갱신 대상으로 표시된 사용자의 추천을 다시 계산 후 처리한 사용자 수 반환"""
+    batch_size = batch_size or current_app.config['RECOMMENDATION_BATCH_SIZE']
+    started_at = datetime.utcnow()
+    refreshed = 0
+    while True:
+        user_ids = [user_id for user_id, in db.session.query(User.id)
+                                              .filter(User.recommendations_stale_at <= started_at)
+                                              .order_by(User.id).limit(batch_size)]
+        if not user_ids:
+            return refreshed
+        refresh_recommendations(user_ids, started_at)
+        refreshed += len(user_ids)
+
+def refresh_all_recommendations(batch_size=None):
+    """모든 사용자의 추천을 사용자 ID 범위별로 다시 계산 후 처리한 사용자 수 반환"""
+    batch_size = batch_size or current_app.config['RECOMMENDATION_BATCH_SIZE']
+    started_at = datetime.utcnow()
+    max_id = db.session.query(func.max(User.id)).scalar() or 0
+    refreshed = 0
+    for start in range(0, max_id + 1, batch_size):
+        user_ids = [user_id for user_id, in db.session.query(User.id)
+                                              .filter(User.id >= start, User.id < start + batch_size)]
+        refresh_recommendations(user_ids, started_at)
+        refreshed += len(user_ids)
+    return refreshed
+
+def recommended_users(user_id, limit):
+    """추천 사용자 목록 [(User, 함께 아는 사용자 수)]
+
+    user_recommendation에서 (user_id, score) 인덱스로 한 번에 조회.
+    저장된 추천이 없으면(신규 사용자 등) 팔로우하지 않은 사용자로 대체.
+    """
+    columns = load_only(User.id, User.username, User.nickname, User.profile_image)
+    following = select(followers.c.followed_id).where(followers.c.follower_id == user_id)
+
+    recommended = db.session.query(User, UserRecommendation.mutual_count)\
+                            .options(columns)\
+                            .join(UserRecommendation, UserRecommendation.candidate_id == User.id)\
+                            .filter(UserRecommendation.user_id == user_id,
+                                    ~UserRecommendation.candidate_id.in_(following))\
+                            .order_by(UserRecommendation.score.desc(), UserRecommendation.candidate_id)\
+                            .limit(limit).all()
+    if recommended:
+        return recommended
+
+    fallback = User.query.options(columns)\
+                         .filter(User.id != user_id, ~User.id.in_(following))\
+                         .limit(limit).all()
+    return [(user, 0) for user in fallback]
+
+@click.command('refresh-recommendations')
+@click.option('--all', 'refresh_all', is_flag=True, help='갱신 대상뿐 아니라 모든 사용자의 추천을 다시 계산')
+@with_appcontext
+def refresh_recommendations_command(refresh_all):
+    """사용자 추천 다시 계산 (기본: 팔로우 관계가 바뀐 사용자만)"""
+    if refresh_all:
+        count = refresh_all_recommendations()
+    else:
+        count = refresh_stale_recommendations()
+    click.echo(f"사용자 추천 갱신 완료: {count}명")
@@ -0,0 +1,60 @@
+import time
+import functools
+from flask import g, session, current_app, has_request_context
+from flask_sqlalchemy import SQLAlchemy, SignallingSession, get_state
+from sqlalchemy import event, orm
+
+# 읽기 복제본 라우팅
+# - SQLALCHEMY_BINDS에 'replica'가 있을 때만 사용 (SQLALCHEMY_REPLICA_URI 환경 변수)
+# - @read_replica를 붙인 읽기 전용 뷰의 SELECT는 복제본으로, 그 외 요청과 모든 쓰기는 기본(primary) DB로
+# - 같은 세션에서 쓰기(flush, UPDATE/INSERT/DELETE 실행)를 한 뒤의 조회는 primary로
+# - 쓰기를 한 클라이언트는 DB_REPLICA_READ_AFTER_WRITE_SECONDS 동안 primary에서 읽음 (세션 쿠키로 표시, 복제 지연 대비)
+
+REPLICA_BIND = 'replica'
+PRIMARY_UNTIL_KEY = '_db_primary_until'
+
+def replica_enabled(app):
+    return REPLICA_BIND in (app.config.get('SQLALCHEMY_BINDS') or {})
+
+class RoutingSession(SignallingSession):
+    """read_replica 뷰에서는 조회를 복제본으로 보내는 세션"""
+
+    def get_bind(self, mapper=None, clause=None):
+        if clause is not None and getattr(clause, 'is_dml', False):
+            self.info['wrote'] = True
+        elif self._use_replica():
+            return get_state(self.app).db.get_engine(self.app, bind=REPLICA_BIND)
+        return super().get_bind(mapper, clause)
+
+    def _use_replica(self):
+        if self._flushing or self.info.get('wrote'):
+            return False
+        return has_request_context() and g.get('db_read_replica', False)
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _mark_written(session, flush_context):
+    session.info['wrote'] = True
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    """RoutingSession을 사용하는 Flask-SQLAlchemy"""
+
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+def read_replica(view):
+    """읽기 전용 뷰의 조회를 복제본에서 실행 (최근에 쓰기를 한 클라이언트는 primary)"""
+    @functools.wraps(view)
+    def decorated(*args, **kwargs):
+        if replica_enabled(current_app) and session.get(PRIMARY_UNTIL_KEY, 0) <= time.time():
+            g.db_read_replica = True
+        return view(*args, **kwargs)
+    return decorated
+
+def init_app(app, db):
+
+    @app.after_request
+    def remember_write(response):
+        # 쓰기를 한 요청 이후 잠시 동안은 이 클라이언트의 조회를 primary에서 실행
+        if replica_enabled(app) and db.session.registry.has() and db.session().info.get('wrote'):
+            session[PRIMARY_UNTIL_KEY] = time.time() + app.config['DB_REPLICA_READ_AFTER_WRITE_SECONDS']
+        return response
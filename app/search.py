@@ -0,0 +1,103 @@
+import logging
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import DDL, event, func, text, table, column, literal_column, or_, and_
+from app.extensions import db
+from app.models import Todo
+
+# 할 일 전문 검색 (GET /api/todos/search)
+# - MySQL: todo(title, description) FULLTEXT 인덱스 (ngram 파서, 한국어는 2글자 단위로 색인)
+# - SQLite(로컬/테스트): FTS5 외부 콘텐츠 테이블 todo_fts (trigram 토크나이저)
+#   todo 테이블 트리거로 색인을 갱신하므로 ORM과 일괄 UPDATE/DELETE 모두 자동으로 반영
+# - 색인 단위(n-gram)보다 짧은 검색어는 색인으로 찾을 수 없어 LIKE로 대체
+# - 검색어를 공백으로 나눈 모든 단어를 포함하는 할 일을 관련도 순으로 반환
+
+logger = logging.getLogger(__name__)
+
+FULLTEXT_INDEX = 'ft_todo_title_description'
+FTS_TABLE = 'todo_fts'
+
+# 방언별 색인 n-gram 크기 (MySQL ngram_token_size 기본값, FTS5 trigram)
+NGRAM_SIZE = {'mysql': 2, 'sqlite': 3}
+
+MYSQL_DDL = [
+    f"ALTER TABLE todo ADD FULLTEXT INDEX {FULLTEXT_INDEX} (title, description) WITH PARSER ngram",
+]
+
+SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"title, description, content='todo', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON todo BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON todo BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) "
+    f"VALUES ('delete', old.id, old.title, old.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE OF title, description ON todo BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) "
+    f"VALUES ('delete', old.id, old.title, old.description); "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+]
+
+# create_all()/drop_all()에서 todo 테이블과 함께 생성/삭제
+for statement in MYSQL_DDL:
+    event.listen(Todo.__table__, 'after_create', DDL(statement).execute_if(dialect='mysql'))
+for statement in SQLITE_DDL:
+    event.listen(Todo.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+event.listen(Todo.__table__, 'before_drop', DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect='sqlite'))
+
+def split_terms(query):
+    """검색어를 단어 목록으로 (중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(query.split()))
+
+def _like(term):
+    pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+    return or_(Todo.title.like(pattern, escape='\\'), Todo.description.like(pattern, escape='\\'))
+
+def search_query(user_id, terms):
+    """사용자의 할 일 중 모든 단어를 포함하는 할 일 조회 쿼리 (관련도 높은 순)"""
+    dialect = db.engine.dialect.name
+    ngram_size = NGRAM_SIZE.get(dialect, 0)
+    indexed = [term for term in terms if ngram_size and len(term) >= ngram_size]
+    short = [term for term in terms if term not in indexed]
+
+    query = Todo.query.filter(Todo.user_id == user_id)
+    if short:
+        query = query.filter(and_(*[_like(term) for term in short]))
+
+    if not indexed:
+        return query.order_by(Todo.date.desc(), Todo.id.desc())
+
+    if dialect == 'mysql':
+        # 불리언 모드: 단어마다 +"단어" (n-gram 구문 일치 필수), 관련도는 MATCH 값
+        expression = ' '.join('+"' + term.replace('"', '') + '"' for term in indexed)
+        score = func.MATCH(Todo.title, Todo.description)\
+                    .op('AGAINST')(text('(:search_expression IN BOOLEAN MODE)')
+                                   .bindparams(search_expression=expression))
+        return query.filter(score > 0).order_by(score.desc(), Todo.id.desc())
+
+    # FTS5: 단어마다 구문 검색 ("를 두 번 써서 이스케이프), bm25는 작을수록 관련도 높음
+    expression = ' '.join('"' + term.replace('"', '""') + '"' for term in indexed)
+    fts = table(FTS_TABLE, column('rowid'))
+    fts_column = literal_column(FTS_TABLE)  # FTS5 테이블 이름과 같은 숨은 열 (MATCH, bm25 대상)
+    return query.join(fts, fts.c.rowid == Todo.id)\
+                .filter(fts_column.op('MATCH')(expression))\
+                .order_by(func.bm25(fts_column), Todo.id.desc())
+
+def rebuild_index():
+    """SQLite FTS5 색인을 todo 테이블 기준으로 다시 생성 (MySQL FULLTEXT는 자동 유지)"""
+    if db.engine.dialect.name != 'sqlite':
+        return False
+    for statement in SQLITE_DDL:
+        db.session.execute(text(statement))
+    db.session.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    db.session.commit()
+    return True
+
+@click.command('rebuild-search-index')
+@with_appcontext
+def rebuild_search_index_command():
+    """할 일 검색 색인 재구성 (SQLite)"""
+    if rebuild_index():
+        click.echo("검색 색인 재구성 완료")
+    else:
+        click.echo("MySQL FULLTEXT 인덱스는 재구성이 필요하지 않습니다.")
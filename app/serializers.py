@@ -0,0 +1,174 @@
+import logging
+import itertools
+from flask import current_app, jsonify, json, stream_with_context
+from sqlalchemy import select
+from app.models import Todo, Category, Notification, User
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 목록 응답 직렬화 (ORM 객체를 만들지 않는 경로)
+# - 필요한 열만 Core select()로 조회해 행 튜플을 그대로 사용 (식별자 맵 등록, 객체 생성 없음)
+# - 열 단위로 처리: 날짜 열은 한 번에 문자열로 바꾸고, 행마다 dict(zip(...))으로 조립
+# - 출력은 to_dict() + jsonify()와 바이트 단위로 같음 (필드, 날짜 형식, 키 정렬, ASCII 이스케이프)
+# - orjson이 설치되어 있으면 같은 출력을 만들 수 있는 경우에 인코딩에 사용 (JSON_SORT_KEYS, JSON_AS_ASCII 반영)
+#   그 외(디버그/들여쓰기 출력 설정, ASCII 출력인데 비ASCII 문자 포함)에는 jsonify()를 그대로 사용
+# - 크기 제한이 없는 목록은 STREAM_BATCH_SIZE개씩 읽고 인코딩해 나눠 전송 (rows_response)
+#   한 묶음 이하면 평소처럼 한 번에 응답, 워커 메모리는 전체 결과가 아니라 한 묶음 크기에 비례
+
+logger = logging.getLogger(__name__)
+
+TODO_COLUMNS = {field: Todo.__table__.c[field] for field in Todo.SERIALIZABLE_FIELDS}
+
+CATEGORY_FIELDS = ('id', 'name', 'color', 'created_at')
+CATEGORY_DATE_FORMATS = {'created_at': '%Y-%m-%d %H:%M:%S'}
+
+NOTIFICATION_FIELDS = ('id', 'message', 'type', 'is_read', 'created_at')
+NOTIFICATION_DATE_FORMATS = {'created_at': '%Y-%m-%d %H:%M'}
+SENDER_FIELDS = ('id', 'username', 'nickname', 'profile_image')
+
+# strftime 형식별 isoformat() 앞부분 길이 (연도가 4자리일 때 같은 문자열)
+ISO_PREFIX_LENGTHS = {
+    '%Y-%m-%d': 10,
+    '%Y-%m-%d %H:%M': 16,
+    '%Y-%m-%d %H:%M:%S': 19,
+}
+
+def format_dates(values, date_format):
+    """날짜 열 전체를 문자열로 변환 (None은 그대로)"""
+    length = ISO_PREFIX_LENGTHS.get(date_format)
+    if length is None:
+        return [value.strftime(date_format) if value is not None else None for value in values]
+    # isoformat()은 strftime()보다 빠름, 1000년 이전은 strftime()과 자릿수가 달라 strftime() 사용
+    return [
+        None if value is None
+        else value.isoformat(' ')[:length] if value.year >= 1000
+        else value.strftime(date_format)
+        for value in values
+    ]
+
+def rows_to_dicts(fields, rows, date_formats):
+    """행 튜플 목록을 필드 이름의 딕셔너리 목록으로 (fields 뒤의 열은 무시)"""
+    if not rows:
+        return []
+    columns = list(zip(*rows))[:len(fields)]
+    for index, field in enumerate(fields):
+        date_format = date_formats.get(field)
+        if date_format:
+            columns[index] = format_dates(columns[index], date_format)
+    return [dict(zip(fields, values)) for values in zip(*columns)]
+
+def todo_select(fields=None, extra=()):
+    """할 일 열 select (fields 순서대로, 그 뒤에 extra 필드 추가)"""
+    fields = tuple(fields or Todo.SERIALIZABLE_FIELDS)
+    extra = tuple(field for field in extra if field not in fields)
+    return select(*[TODO_COLUMNS[field] for field in fields + extra]), fields
+
+def todo_dicts(rows, fields=None):
+    """todo_select() 결과 행을 Todo.to_dict(fields)와 같은 딕셔너리로"""
+    return rows_to_dicts(tuple(fields or Todo.SERIALIZABLE_FIELDS), rows, Todo.DATE_FORMATS)
+
+def category_select():
+    return select(*[Category.__table__.c[field] for field in CATEGORY_FIELDS])
+
+def category_dicts(rows):
+    """category_select() 결과 행을 Category.to_dict()와 같은 딕셔너리로"""
+    return rows_to_dicts(CATEGORY_FIELDS, rows, CATEGORY_DATE_FORMATS)
+
+def notification_select():
+    """알림 열과 보낸 사용자 열 select (보낸 사용자가 없으면 사용자 열은 NULL)"""
+    notification = Notification.__table__
+    sender = User.__table__.alias('sender')
+    columns = [notification.c[field] for field in NOTIFICATION_FIELDS]
+    columns += [sender.c[field].label(f'sender_{field}') for field in SENDER_FIELDS]
+    return select(*columns).select_from(
+        notification.outerjoin(sender, sender.c.id == notification.c.sender_id)
+    )
+
+def notification_dicts(rows):
+    """notification_select() 결과 행을 Notification.to_dict()와 같은 딕셔너리로"""
+    data = rows_to_dicts(NOTIFICATION_FIELDS, rows, NOTIFICATION_DATE_FORMATS)
+    offset = len(NOTIFICATION_FIELDS)
+    for item, row in zip(data, rows):
+        sender = row[offset:offset + len(SENDER_FIELDS)]
+        item['sender'] = dict(zip(SENDER_FIELDS, sender)) if sender[0] is not None else None
+    return data
+
+def encode(data):
+    """jsonify()와 같은 JSON 문자열을 orjson으로 인코딩, 같은 출력을 만들 수 없으면 None
+
+    JSON_AS_ASCII(기본값)에서 비ASCII 문자를 \\uXXXX로 바꾸는 작업은 파이썬에서 하면 json.dumps보다 느리므로
+    결과가 ASCII뿐일 때만 사용하고 그 외에는 기본 인코더(json 모듈의 C 구현)에 맡김.
+    """
+    config = current_app.config
+    if orjson is None or not config['JSON_FAST_ENCODER'] or current_app.debug \
+            or config['JSONIFY_PRETTYPRINT_REGULAR']:
+        return None
+
+    try:
+        body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS if config['JSON_SORT_KEYS'] else 0)
+    except TypeError as e:
+        # orjson이 처리하지 못하는 값 (짝이 없는 서로게이트 문자 등)
+        logger.debug(f"orjson 인코딩 실패, 기본 인코더 사용: {e}")
+        return None
+
+    if config['JSON_AS_ASCII']:
+        if not body.isascii():
+            return None
+        # json.dumps는 DEL 문자도 이스케이프함
+        body = body.replace(b'\x7f', b'\\u007f')
+    return body.decode('utf-8')
+
+def json_response(data):
+    """목록 응답 생성 (jsonify()와 같은 본문과 Content-Type)"""
+    body = encode(data)
+    if body is None:
+        return jsonify(data)
+    return current_app.response_class(f"{body}\n", mimetype=current_app.config['JSONIFY_MIMETYPE'])
+
+def _encode_items(items):
+    """딕셔너리 목록을 JSON 배열의 원소 부분(대괄호 제외)으로 인코딩"""
+    body = encode(items)
+    if body is None:
+        body = json.dumps(items, separators=(',', ':'))
+    return body[1:-1]
+
+def stream_json_array(chunks):
+    """딕셔너리 목록 묶음 이터레이터를 JSON 배열로 나눠 보내는 응답 (jsonify(전체 목록)과 같은 본문)
+
+    묶음은 응답을 보내는 동안 만들어지므로 DB 조회도 이 시점에 진행됨 (요청 컨텍스트 유지).
+    들여쓰기 출력(디버그) 설정에서는 전체 목록을 모아 jsonify()로 응답.
+    """
+    if current_app.debug or current_app.config['JSONIFY_PRETTYPRINT_REGULAR']:
+        return jsonify([item for chunk in chunks for item in chunk])
+
+    def generate():
+        try:
+            yield '['
+            first = True
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                body = _encode_items(chunk)
+                yield body if first else ',' + body
+                first = False
+            yield ']\n'
+        except Exception as e:
+            # 헤더를 이미 보냈으므로 상태 코드를 바꿀 수 없음, 연결을 끊어 클라이언트가 불완전한 응답을 알 수 있게 함
+            logger.error(f"스트리밍 응답 중 오류 발생: {str(e)}")
+            raise
+
+    return current_app.response_class(stream_with_context(generate()),
+                                      mimetype=current_app.config['JSONIFY_MIMETYPE'])
+
+def rows_response(result, to_dicts, batch_size):
+    """조회 결과(stream_results로 실행)를 응답으로 - 한 묶음 이하면 한 번에, 더 많으면 묶음 단위로 나눠 전송"""
+    first = result.fetchmany(batch_size)
+    if len(first) < batch_size:
+        result.close()
+        return json_response(to_dicts(first))
+
+    partitions = itertools.chain([first], result.partitions(batch_size))
+    return stream_json_array(to_dicts(rows) for rows in partitions)
@@ -1,10 +1,12 @@
 # app/social/routes.py
-from flask import render_template, jsonify, request, session
-from flask_login import current_user
+from flask import render_template, jsonify, request, session, current_app
 from app.social import social
-from app.models import User, Todo, Category, Notification
+from app.models import Todo, Category, Notification
 from app.extensions import db
-from app.utils import login_required, create_notification
+from app.utils import login_required, create_notification, parse_notification_ids, set_notifications_read, \
+    notification_page, parse_notification_page_args, split_notification_page
+from app import versions, identity, serializers
+from app.routing import read_replica
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,35 +14,38 @@ logger = logging.getLogger(__name__)
 @social.route('/explore')
 def explore():
     """둘러보기 페이지 (커뮤니티 페이지)"""
-    user = None
-    if current_user.is_authenticated:
-        user = current_user
-    elif session.get('user_id'):
-        try:
-            user = User.query.get(session['user_id'])
-        except Exception as e:
-            logger.error(f"사용자 조회 중 오류: {e}")
-            user = None
+    try:
+        user_id, anonymous_id, user = identity.resolve()
+    except Exception as e:
+        logger.error(f"사용자 조회 중 오류: {e}")
+        user = None
     
     return render_template('public/explore.html', user=user, active_page='explore')
 
 # 알림 API 엔드포인트 (세션 기반)
 @social.route('/api/notifications', methods=['GET'])
 @login_required
+@read_replica
 def get_notifications():
-    """알림 목록 반환"""
+    """알림 목록 반환 (limit, before, unread_only는 /api/notifications와 동일)"""
     try:
         user_id = session.get('user_id')
         if not user_id:
             return jsonify([])
-            
-        notifications = Notification.query.filter_by(user_id=user_id)\
-                                        .order_by(Notification.created_at.desc())\
-                                        .all()
         
-        result = [notification.to_dict() for notification in notifications]
+        try:
+            limit, before, unread_only = parse_notification_page_args(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # 보낸 사용자를 같은 쿼리에서 함께 조회 (알림마다 사용자 조회 방지)
+        rows = notification_page(user_id, limit, before, unread_only)
+        rows, next_cursor = split_notification_page(rows, limit)
         
-        return jsonify(result)
+        response = serializers.json_response(serializers.notification_dicts(rows))
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response
     except Exception as e:
         logger.error(f"알림 조회 중 오류: {e}")
         return jsonify([])
@@ -57,11 +62,13 @@ def mark_notifications_read():
         if not user_id:
             return jsonify({'error': '로그인이 필요합니다.'}), 401
         
-        for notification_id in notification_ids:
-            notification = Notification.query.get(notification_id)
-            if notification and notification.user_id == user_id:
-                notification.is_read = True
+        try:
+            notification_ids = parse_notification_ids(notification_ids, current_app.config['NOTIFICATIONS_MARK_READ_MAX_IDS'])
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
+        # 본인 알림만 UPDATE 한 번으로 처리
+        set_notifications_read(user_id, ids=notification_ids)
         db.session.commit()
         return jsonify({'result': 'success'})
     except Exception as e:
@@ -79,6 +86,7 @@ def clear_notifications():
             return jsonify({'error': '로그인이 필요합니다.'}), 401
             
         Notification.query.filter_by(user_id=user_id).delete()
+        versions.bump(user_id, versions.SCOPE_NOTIFICATIONS)
         db.session.commit()
         return jsonify({'result': 'success'})
     except Exception as e:
@@ -80,13 +80,16 @@ document.addEventListener('DOMContentLoaded', function() {
     async function loadInitialData() {
         try {
             console.log('초기 데이터 로드 시작');
-            // 카테고리와 할일 데이터 로드
-            await Promise.all([fetchTodos(), fetchCategories()]);
-            
-            // 로그인 상태에 따라 로컬 스토리지 처리
             const isLoggedIn = document.body.getAttribute('data-logged-in') === 'true';
             console.log('로그인 상태:', isLoggedIn);
             
+            // 카테고리와 할일 데이터 로드 (로그인 사용자는 변경분만 동기화)
+            if (!isLoggedIn || !(await syncData())) {
+                await Promise.all([fetchTodos(), fetchCategories()]);
+            }
+            
+            // 로그인 상태에 따라 로컬 스토리지 처리
+            
             if (!isLoggedIn) {
                 // 로컬 스토리지에서 비로그인 사용자 데이터 로드
                 loadLocalData();
@@ -103,6 +106,56 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
+    // 로그인 사용자 증분 동기화 - 캐시된 데이터에 서버 변경분만 반영 (실패 시 false)
+    async function syncData() {
+        const cacheKey = `sync_${getDeviceId()}`;
+        let cache = null;
+        try {
+            cache = JSON.parse(localStorage.getItem(cacheKey));
+        } catch (error) {
+            cache = null;
+        }
+        
+        try {
+            const url = cache && cache.token
+                ? `/api/sync?since=${encodeURIComponent(cache.token)}`
+                : '/api/sync';
+            const response = await fetch(url);
+            if (!response.ok) {
+                console.warn('동기화 응답 오류:', response.status, response.statusText);
+                return false;
+            }
+            
+            const result = await response.json();
+            
+            // 전체 동기화면 캐시를 교체, 아니면 ID 기준으로 덮어쓰고 삭제 반영
+            const useCache = cache && !result.full;
+            const todoMap = new Map(useCache ? cache.todos.map(todo => [todo.id, todo]) : []);
+            const categoryMap = new Map(useCache ? cache.categories.map(cat => [cat.id, cat]) : []);
+            
+            result.todos.forEach(todo => todoMap.set(todo.id, todo));
+            result.categories.forEach(cat => categoryMap.set(cat.id, cat));
+            result.deleted.todos.forEach(id => todoMap.delete(id));
+            result.deleted.categories.forEach(id => categoryMap.delete(id));
+            
+            const syncedTodos = [...todoMap.values()];
+            const syncedCategories = [...categoryMap.values()];
+            localStorage.setItem(cacheKey, JSON.stringify({
+                token: result.sync_token,
+                todos: syncedTodos,
+                categories: syncedCategories
+            }));
+            
+            todos = syncedTodos.map(todo => ({ ...todo, date: new Date(todo.date) }));
+            categories = syncedCategories;
+            console.log('동기화 완료:', { full: result.full, todos: result.todos.length, deleted: result.deleted.todos.length });
+            return true;
+        } catch (error) {
+            console.error('동기화 중 오류 발생:', error);
+            return false;
+        }
+    }
+    
     // 비로그인 사용자 데이터 로컬 스토리지에서 로드 (수정됨)
     function loadLocalData() {
         console.log('로컬 데이터 로드 시작');
@@ -21,15 +21,19 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
-    // 공유된 할 일 가져오기
-    async function fetchSharedTodos() {
+    // 공유된 할 일 가져오기 (before 커서가 있으면 다음 페이지를 이어 붙임)
+    async function fetchSharedTodos(before = null) {
         try {
-            const response = await fetch('/api/explore/todos');
+            const url = before
+                ? `/api/explore/todos?before=${encodeURIComponent(before)}`
+                : '/api/explore/todos';
+            const response = await fetch(url);
             if (!response.ok) {
                 throw new Error('할 일 데이터를 가져오는데 실패했습니다.');
             }
             const data = await response.json();
-            renderSharedTodos(data);
+            renderSharedTodos(data, before !== null);
+            renderLoadMoreButton(response.headers.get('X-Next-Cursor'));
         } catch (error) {
             console.error('할 일 데이터 가져오기 오류:', error);
             showErrorState(sharedTodosContainer, '할 일 데이터를 불러올 수 없습니다.');
@@ -71,10 +75,12 @@ document.addEventListener('DOMContentLoaded', function() {
     }
     
     // 공유된 할 일 렌더링
-    function renderSharedTodos(todos) {
-        sharedTodosContainer.innerHTML = '';
+    function renderSharedTodos(todos, append = false) {
+        if (!append) {
+            sharedTodosContainer.innerHTML = '';
+        }
         
-        if (todos.length === 0) {
+        if (todos.length === 0 && !append) {
             sharedTodosContainer.innerHTML = `
                 <div class="empty-state">
                     <i class="fas fa-tasks"></i>
@@ -118,6 +124,28 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
     
+    // 다음 페이지가 있으면 '더 보기' 버튼 표시
+    function renderLoadMoreButton(nextCursor) {
+        const existingButton = sharedTodosContainer.querySelector('.load-more-btn');
+        if (existingButton) {
+            existingButton.remove();
+        }
+        
+        if (!nextCursor) {
+            return;
+        }
+        
+        const loadMoreButton = document.createElement('button');
+        loadMoreButton.classList.add('load-more-btn');
+        loadMoreButton.textContent = '더 보기';
+        loadMoreButton.addEventListener('click', () => {
+            loadMoreButton.disabled = true;
+            fetchSharedTodos(nextCursor);
+        });
+        
+        sharedTodosContainer.appendChild(loadMoreButton);
+    }
+    
     // 추천 사용자 렌더링
     function renderRecommendedUsers(users) {
         recommendedUsersContainer.innerHTML = '';
@@ -142,6 +170,7 @@ document.addEventListener('DOMContentLoaded', function() {
                     <img src="/static/images/${user.profile_image}" alt="${user.nickname}">
                 </div>
                 <div class="recommended-user-name">${user.nickname}</div>
+                ${user.mutual_count ? `<div class="recommended-user-mutual">함께 아는 사용자 ${user.mutual_count}명</div>` : ''}
                 <button class="follow-btn" data-user-id="${user.id}">
                     ${user.is_following ? '팔로잉' : '팔로우'}
                 </button>
@@ -12,6 +12,13 @@ document.addEventListener('DOMContentLoaded', function() {
     // 웹 알림 권한 확인
     let notificationPermission = Notification.permission;
     
+    // 알림 목록 페이지네이션 상태
+    let nextCursor = null;
+    let loadingMore = false;
+    
+    // 서버 기준 읽지 않은 알림 개수 (목록은 일부만 불러오므로 화면의 항목으로 계산하지 않음)
+    let unreadCount = 0;
+    
     // 알림 사이드바 토글
     function toggleSidebar() {
         notificationsSidebar.classList.toggle('open');
@@ -33,7 +40,7 @@ document.addEventListener('DOMContentLoaded', function() {
     function createNotificationItem(notification) {
         // 알림 아이템 생성
         const item = document.createElement('div');
-        item.className = `notification-item ${notification.read ? 'read' : 'unread'}`;
+        item.className = `notification-item ${notification.is_read ? 'read' : 'unread'}`;
         item.dataset.id = notification.id;
         
         // 프로필 이미지 (보낸 사람이 있는 경우)
@@ -80,7 +87,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 <div class="notification-time">${notification.created_at}</div>
             </div>
             <button class="read-btn" data-id="${notification.id}" title="읽음으로 표시">
-                <i class="fas ${notification.read ? 'fa-check-circle' : 'fa-circle'}"></i>
+                <i class="fas ${notification.is_read ? 'fa-check-circle' : 'fa-circle'}"></i>
             </button>
         `;
         
@@ -122,6 +129,8 @@ document.addEventListener('DOMContentLoaded', function() {
                 }
                 
                 const notifications = await response.json();
+                // 다음 페이지 커서 (스크롤이 목록 끝에 닿으면 이어서 조회)
+                nextCursor = response.headers.get('X-Next-Cursor');
                 
                 // 알림 목록 업데이트
                 notificationsList.innerHTML = '';
@@ -173,6 +182,7 @@ document.addEventListener('DOMContentLoaded', function() {
             if (response.ok) {
                 // UI 업데이트
                 const notificationItem = document.querySelector(`.notification-item[data-id="${notificationId}"]`);
+                const wasUnread = notificationItem && notificationItem.classList.contains('unread');
                 if (notificationItem) {
                     notificationItem.classList.remove('unread');
                     notificationItem.classList.add('read');
@@ -184,25 +194,62 @@ document.addEventListener('DOMContentLoaded', function() {
                     }
                 }
                 
-                // 읽지 않은 알림 개수 업데이트
-                updateUnreadCount();
+                // 읽지 않은 알림 개수 업데이트 (이미 읽은 알림이면 그대로)
+                if (wasUnread) {
+                    updateUnreadCount(Math.max(unreadCount - 1, 0));
+                }
             }
         } catch (error) {
             console.warn('알림 읽음 표시 중 오류:', error);
         }
     }
     
+    // 이전 알림 이어서 불러오기
+    async function loadMoreNotifications() {
+        if (!nextCursor || loadingMore) return;
+        loadingMore = true;
+        try {
+            const response = await fetch(`/api/notifications?before=${encodeURIComponent(nextCursor)}`);
+            if (!response.ok) {
+                console.warn(`알림 API 응답 오류: ${response.status} ${response.statusText}`);
+                return;
+            }
+            
+            const notifications = await response.json();
+            nextCursor = response.headers.get('X-Next-Cursor');
+            
+            notifications.forEach(notification => {
+                const item = createNotificationItem(notification);
+                const readBtn = item.querySelector('.read-btn');
+                if (readBtn) {
+                    readBtn.addEventListener('click', (e) => {
+                        e.stopPropagation();
+                        markAsRead(readBtn.dataset.id);
+                    });
+                }
+                notificationsList.appendChild(item);
+            });
+        } catch (error) {
+            console.warn('이전 알림 조회 중 오류:', error);
+        } finally {
+            loadingMore = false;
+        }
+    }
+    
     // 모든 알림 읽음으로 표시
     async function markAllAsRead() {
         try {
             const isLoggedIn = document.body.getAttribute('data-logged-in') === 'true';
             if (!isLoggedIn) return;
             
+            // 화면에 표시된 가장 최근 알림까지만 읽음 처리 (그 뒤에 도착한 알림은 유지)
+            const ids = Array.from(document.querySelectorAll('.notification-item'), item => Number(item.dataset.id));
             const response = await fetch('/api/notifications/read', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
-                }
+                },
+                body: JSON.stringify(ids.length ? { up_to: Math.max(...ids) } : {})
             });
             
             if (response.ok) {
@@ -219,8 +266,8 @@ document.addEventListener('DOMContentLoaded', function() {
                     }
                 });
                 
-                // 읽지 않은 알림 개수 업데이트
-                updateUnreadCount(0);
+                // 읽지 않은 알림 개수 업데이트 (읽음 처리 후 도착한 알림이 있을 수 있으므로 서버에서 조회)
+                fetchUnreadCount();
             }
         } catch (error) {
             console.warn('모든 알림 읽음 표시 중 오류:', error);
@@ -243,6 +290,7 @@ document.addEventListener('DOMContentLoaded', function() {
             
             if (response.ok) {
                 // UI 업데이트
+                nextCursor = null;
                 notificationsList.innerHTML = '';
                 emptyNotifications.style.display = 'block';
                 
@@ -254,16 +302,25 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
+    // 서버에서 읽지 않은 알림 개수만 조회 (목록은 가져오지 않음)
+    async function fetchUnreadCount() {
+        try {
+            const response = await fetch('/api/notifications/unread-count');
+            if (response.ok) {
+                const data = await response.json();
+                updateUnreadCount(data.count);
+            }
+        } catch (error) {
+            console.warn('읽지 않은 알림 개수 조회 중 오류:', error);
+        }
+    }
+    
     // 읽지 않은 알림 개수 업데이트
     function updateUnreadCount(count) {
         // 알림 아이콘에 뱃지 표시
         const notificationBadge = document.querySelector('.notification-badge');
         
-        if (typeof count === 'undefined') {
-            // count가 없는 경우 직접 계산
-            const unreadItems = document.querySelectorAll('.notification-item.unread');
-            count = unreadItems.length;
-        }
+        unreadCount = count;
         
         if (count > 0) {
             // 뱃지가 없으면 생성
@@ -284,6 +341,67 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
+    // 스트림으로 받은 새 알림을 목록 맨 앞에 추가
+    function prependNotification(notification) {
+        if (notificationsList.querySelector(`.notification-item[data-id="${notification.id}"]`)) {
+            return;
+        }
+        
+        emptyNotifications.style.display = 'none';
+        const item = createNotificationItem(notification);
+        item.querySelector('.read-btn').addEventListener('click', (e) => {
+            e.stopPropagation();
+            markAsRead(notification.id);
+        });
+        notificationsList.prepend(item);
+        // 목록을 열지 않았거나 일부만 불러온 경우에도 맞도록 서버에서 개수 조회 (ETag로 변경 시에만 본문 전송)
+        fetchUnreadCount();
+        
+        // 웹 알림 표시
+        if (notificationPermission === 'granted' && document.hidden) {
+            new Notification('투데이 투두', { body: notification.message });
+        }
+    }
+    
+    // 실시간 알림 스트림 연결 (미지원 또는 연결 불가 시 1분 주기 조회로 대체)
+    function connectNotificationStream() {
+        if (!window.EventSource) {
+            startPolling();
+            return;
+        }
+        
+        const source = new EventSource('/api/notifications/stream');
+        
+        source.addEventListener('notification', (e) => {
+            try {
+                prependNotification(JSON.parse(e.data));
+            } catch (error) {
+                console.warn('알림 스트림 데이터 처리 중 오류:', error);
+            }
+        });
+        
+        source.addEventListener('error', () => {
+            // 브라우저가 재접속을 포기한 경우(인증 오류 등)에만 조회 방식으로 전환
+            if (source.readyState === EventSource.CLOSED) {
+                console.warn('알림 스트림 연결 종료, 주기적 조회로 전환');
+                startPolling();
+            }
+        });
+    }
+    
+    let pollingTimer = null;
+    function startPolling() {
+        if (!pollingTimer) {
+            // 1분마다 개수 확인, 사이드바가 열려 있으면 목록도 갱신
+            pollingTimer = setInterval(() => {
+                fetchUnreadCount();
+                if (notificationsSidebar.classList.contains('open')) {
+                    checkNotifications();
+                }
+            }, 60000);
+        }
+    }
+    
     // 웹 알림 권한 요청
     function requestNotificationPermission() {
         if (Notification.permission !== 'granted' && Notification.permission !== 'denied') {
@@ -310,10 +428,21 @@ document.addEventListener('DOMContentLoaded', function() {
         clearAllBtn.addEventListener('click', clearAllNotifications);
     }
     
+    // 사이드바를 끝까지 스크롤하면 이전 알림 조회
+    if (notificationsSidebar) {
+        notificationsSidebar.addEventListener('scroll', () => {
+            const { scrollTop, scrollHeight, clientHeight } = notificationsSidebar;
+            if (scrollTop + clientHeight >= scrollHeight - 100) {
+                loadMoreNotifications();
+            }
+        });
+    }
+    
     // 페이지 로드 시 읽지 않은 알림 개수 확인
     const isLoggedIn = document.body.getAttribute('data-logged-in') === 'true';
     if (isLoggedIn) {
-        setInterval(checkNotifications, 60000); // 1분마다 알림 확인
+        fetchUnreadCount();
+        connectNotificationStream();
     }
     
     // 웹 알림 권한 요청
@@ -0,0 +1,131 @@
+import logging
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import select, func, case, and_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.extensions import db
+from app.models import Todo, Category, UserTodoStats
+
+# 할 일 통계 집계 (user_todo_stats)
+# - (사용자, 카테고리)별 전체/완료 개수를 쓰기 경로에서 증감
+# - 호출자는 변경 전후 할 일 상태를 add()로 모은 뒤 apply()로 한 번에 반영
+# - 통계 화면은 집계 행만 읽으므로 할 일 수와 관계없이 조회 비용이 일정
+# - 어긋난 경우 rebuild-todo-stats 명령으로 GROUP BY 한 번에 다시 계산
+# 모든 함수는 현재 세션에서 실행만 하고 커밋은 호출자가 담당 (rebuild 제외)
+
+logger = logging.getLogger(__name__)
+
+NO_CATEGORY = 0
+NO_CATEGORY_NAME = '카테고리 없음'
+
+def add(deltas, category_id, completed, sign=1):
+    """할 일 sign개의 증감을 deltas에 누적 (추가는 양수, 제거는 음수, 기본은 하나 추가)"""
+    key = category_id or NO_CATEGORY
+    total, done = deltas.get(key, (0, 0))
+    deltas[key] = (total + sign, done + (sign if completed else 0))
+    return deltas
+
+def add_todo(deltas, todo, sign=1):
+    return add(deltas, todo.category_id, todo.completed, sign)
+
+def apply(user_id, deltas):
+    """누적한 증감을 집계 테이블에 반영"""
+    if not user_id:
+        return
+
+    table = UserTodoStats.__table__
+    dialect = db.engine.dialect.name
+
+    for category_id, (total, completed) in deltas.items():
+        if not total and not completed:
+            continue
+
+        values = {'user_id': user_id, 'category_id': category_id, 'total': total, 'completed': completed}
+        if dialect == 'mysql':
+            statement = mysql_insert(table).values(**values)
+            statement = statement.on_duplicate_key_update(
+                total=table.c.total + statement.inserted.total,
+                completed=table.c.completed + statement.inserted.completed
+            )
+        elif dialect == 'sqlite':
+            statement = sqlite_insert(table).values(**values)
+            statement = statement.on_conflict_do_update(
+                index_elements=['user_id', 'category_id'],
+                set_={'total': table.c.total + statement.excluded.total,
+                      'completed': table.c.completed + statement.excluded.completed}
+            )
+        else:
+            updated = db.session.execute(
+                table.update()
+                     .where(table.c.user_id == user_id, table.c.category_id == category_id)
+                     .values(total=table.c.total + total, completed=table.c.completed + completed)
+            )
+            if updated.rowcount:
+                continue
+            statement = table.insert().values(**values)
+
+        db.session.execute(statement)
+
+def move_categories(user_id, category_ids, target_id=None):
+    """카테고리 삭제/병합 시 해당 집계를 target_id(없으면 카테고리 없음)로 옮김"""
+    table = UserTodoStats.__table__
+    source = and_(table.c.user_id == user_id, table.c.category_id.in_(category_ids))
+    total, completed = db.session.execute(
+        select(func.coalesce(func.sum(table.c.total), 0), func.coalesce(func.sum(table.c.completed), 0))
+            .where(source)
+    ).one()
+
+    db.session.execute(table.delete().where(source))
+    if total or completed:
+        apply(user_id, {target_id or NO_CATEGORY: (int(total), int(completed))})
+
+def user_totals(user_id):
+    """(전체, 완료) 할 일 수"""
+    total, completed = db.session.query(
+        func.coalesce(func.sum(UserTodoStats.total), 0),
+        func.coalesce(func.sum(UserTodoStats.completed), 0)
+    ).filter(UserTodoStats.user_id == user_id).one()
+    return int(total), int(completed)
+
+def category_stats(user_id):
+    """카테고리 이름별 {'total', 'completed'} 반환 (할 일이 없는 항목 제외)"""
+    rows = db.session.query(Category.name, UserTodoStats.total, UserTodoStats.completed)\
+                     .select_from(UserTodoStats)\
+                     .outerjoin(Category, Category.id == UserTodoStats.category_id)\
+                     .filter(UserTodoStats.user_id == user_id, UserTodoStats.total > 0)\
+                     .order_by(UserTodoStats.category_id)
+
+    result = {}
+    for name, total, completed in rows:
+        # 이름이 같은 카테고리는 합산 (기존 응답과 동일)
+        entry = result.setdefault(name or NO_CATEGORY_NAME, {'total': 0, 'completed': 0})
+        entry['total'] += total
+        entry['completed'] += completed
+    return result
+
+def rebuild():
+    """할 일 테이블에서 전체 집계를 다시 계산"""
+    category_key = func.coalesce(Todo.category_id, NO_CATEGORY)
+    rows = select(
+        Todo.user_id,
+        category_key,
+        func.count(),
+        func.sum(case((Todo.completed == True, 1), else_=0))
+    ).where(
+        Todo.user_id.isnot(None)
+    ).group_by(Todo.user_id, category_key)
+
+    table = UserTodoStats.__table__
+    db.session.execute(table.delete())
+    db.session.execute(table.insert().from_select(['user_id', 'category_id', 'total', 'completed'], rows))
+    db.session.commit()
+
+    return db.session.query(func.count()).select_from(UserTodoStats).scalar()
+
+@click.command('rebuild-todo-stats')
+@with_appcontext
+def rebuild_todo_stats_command():
+    """할 일 통계 집계 전체 재계산"""
+    count = rebuild()
+    click.echo(f"할 일 통계 재계산 완료: {count}건")
@@ -0,0 +1,81 @@
+import logging
+from datetime import datetime, timedelta
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from app.extensions import db
+from app.models import Todo, Category, SyncTombstone
+from app.utils import encode_cursor
+
+# 증분 동기화 (GET /api/sync)
+# - 변경: Todo/Category의 updated_at이 토큰 시각 이후인 행
+# - 삭제: 삭제 시 sync_tombstone에 남긴 기록
+# - 토큰: (기준 시각, 사용자 ID)를 커서 형식으로 인코딩
+#   커밋 지연을 고려해 SYNC_TOKEN_SAFETY_SECONDS만큼 앞당긴 시각을 기준으로 삼으므로
+#   경계 부근의 항목은 다음 동기화에서 한 번 더 전달될 수 있음 (클라이언트는 ID 기준으로 덮어씀)
+# - 삭제 기록 보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS)보다 오래된 토큰은 전체 동기화로 처리
+
+logger = logging.getLogger(__name__)
+
+ENTITY_TODO = 'todo'
+ENTITY_CATEGORY = 'category'
+
+def record_deletions(user_id, entity, entity_ids):
+    """삭제 기록 추가 (커밋은 호출자 담당)"""
+    if not user_id or not entity_ids:
+        return
+
+    now = datetime.utcnow()
+    db.session.execute(SyncTombstone.__table__.insert(), [
+        {'user_id': user_id, 'entity': entity, 'entity_id': entity_id, 'deleted_at': now}
+        for entity_id in entity_ids
+    ])
+
+def tombstone_horizon():
+    """이 시각 이전의 삭제 기록은 압축되었을 수 있음"""
+    return datetime.utcnow() - timedelta(days=current_app.config['SYNC_TOMBSTONE_RETENTION_DAYS'])
+
+def changes_since(user_id, since=None):
+    """since 이후 변경분 반환, since가 없으면 전체 데이터"""
+    started_at = datetime.utcnow()
+
+    todos = Todo.query.filter(Todo.user_id == user_id)
+    categories = Category.query.filter(Category.user_id == user_id)
+    deleted = {ENTITY_TODO: [], ENTITY_CATEGORY: []}
+
+    if since:
+        todos = todos.filter(Todo.updated_at >= since)
+        categories = categories.filter(Category.updated_at >= since)
+
+        tombstones = db.session.query(SyncTombstone.entity, SyncTombstone.entity_id)\
+                               .filter(SyncTombstone.user_id == user_id,
+                                       SyncTombstone.deleted_at >= since)
+        for entity, entity_id in tombstones:
+            deleted.setdefault(entity, []).append(entity_id)
+
+    sync_time = started_at - timedelta(seconds=current_app.config['SYNC_TOKEN_SAFETY_SECONDS'])
+
+    return {
+        'full': since is None,
+        'todos': [todo.to_dict() for todo in todos.all()],
+        'categories': [category.to_dict() for category in categories.all()],
+        'deleted': {
+            'todos': deleted[ENTITY_TODO],
+            'categories': deleted[ENTITY_CATEGORY]
+        },
+        'sync_token': encode_cursor(sync_time, user_id)
+    }
+
+def compact_tombstones():
+    """보관 기간이 지난 삭제 기록 삭제 후 삭제 건수 반환"""
+    deleted = SyncTombstone.query.filter(SyncTombstone.deleted_at < tombstone_horizon())\
+                                 .delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
+
+@click.command('compact-tombstones')
+@with_appcontext
+def compact_tombstones_command():
+    """보관 기간이 지난 동기화 삭제 기록 정리"""
+    deleted = compact_tombstones()
+    click.echo(f"삭제 기록 정리 완료: {deleted}건")
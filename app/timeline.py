@@ -0,0 +1,192 @@
+import logging
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import select, literal, or_, and_, func
+from app.extensions import db
+from app.models import User, Todo, Category, TimelineEntry, followers
+
+# 탐색 타임라인 (fan-out-on-write)
+# - 공개 할 일이 생성되거나 공개로 전환되면 작성자 팔로워들의 timeline_entry에 기록
+# - 비공개 전환/삭제 시 제거, 팔로우/언팔로우 시 채우기/정리
+# - 팔로워가 TIMELINE_FANOUT_MAX_FOLLOWERS 이상인 작성자는 fan-out 하지 않고 읽기 시 병합
+# 모든 함수는 현재 세션에서 실행만 하고 커밋은 호출자가 담당
+
+logger = logging.getLogger(__name__)
+
+ENTRY_COLUMNS = ['user_id', 'todo_id', 'author_id', 'created_at']
+
+def fan_out_todo(todo):
+    """공개 할 일을 작성자 팔로워들의 타임라인에 기록 (flush된 할 일 필요)"""
+    if not todo.is_public or not todo.user_id:
+        return
+
+    author = User.query.get(todo.user_id)
+    if not author or author.fanout_disabled:
+        return
+
+    entries = select(
+        followers.c.follower_id,
+        literal(todo.id),
+        literal(todo.user_id),
+        literal(todo.created_at, db.DateTime)
+    ).where(followers.c.followed_id == todo.user_id)
+
+    db.session.execute(TimelineEntry.__table__.insert().from_select(ENTRY_COLUMNS, entries))
+
+def fan_out_todos(todo_ids):
+    """여러 할 일 중 공개 할 일을 작성자 팔로워들의 타임라인에 INSERT ... SELECT 한 번으로 기록"""
+    if not todo_ids:
+        return
+
+    entries = select(
+        followers.c.follower_id,
+        Todo.id,
+        Todo.user_id,
+        Todo.created_at
+    ).select_from(
+        Todo.__table__
+            .join(followers, followers.c.followed_id == Todo.user_id)
+            .join(User.__table__, User.id == Todo.user_id)
+    ).where(
+        Todo.id.in_(todo_ids),
+        Todo.is_public == True,
+        User.fanout_disabled == False
+    )
+
+    db.session.execute(TimelineEntry.__table__.insert().from_select(ENTRY_COLUMNS, entries))
+
+def remove_todo(todo_id):
+    """모든 타임라인에서 할 일 제거"""
+    remove_todos([todo_id])
+
+def remove_todos(todo_ids):
+    """모든 타임라인에서 여러 할 일 제거"""
+    db.session.execute(
+        TimelineEntry.__table__.delete().where(TimelineEntry.todo_id.in_(todo_ids))
+    )
+
+def update_fanout_mode(user):
+    """팔로워 수가 임계값 이상이 되면 fan-out을 중단하고 읽기 시 병합으로 전환"""
+    if user.fanout_disabled:
+        return
+
+    if user.followers_count >= current_app.config['TIMELINE_FANOUT_MAX_FOLLOWERS']:
+        user.fanout_disabled = True
+        logger.info(f"타임라인 fan-out 중단 (팔로워 수 임계값 초과): 사용자 ID={user.id}")
+
+def backfill_follow(follower_id, followed):
+    """새로 팔로우한 사용자의 최근 공개 할 일을 팔로워 타임라인에 채움"""
+    if followed.fanout_disabled:
+        return
+
+    recent = select(
+        literal(follower_id),
+        Todo.id,
+        Todo.user_id,
+        Todo.created_at
+    ).where(
+        Todo.user_id == followed.id,
+        Todo.is_public == True
+    ).order_by(
+        Todo.created_at.desc(), Todo.id.desc()
+    ).limit(current_app.config['TIMELINE_BACKFILL_LIMIT'])
+
+    db.session.execute(TimelineEntry.__table__.insert().from_select(ENTRY_COLUMNS, recent))
+
+def prune_unfollow(follower_id, followed_id):
+    """언팔로우한 사용자의 할 일을 팔로워 타임라인에서 제거"""
+    db.session.execute(
+        TimelineEntry.__table__.delete().where(
+            TimelineEntry.user_id == follower_id,
+            TimelineEntry.author_id == followed_id
+        )
+    )
+
+def timeline_page(user_id, limit, before=None):
+    """타임라인 한 페이지 조회
+
+    (Todo, 작성자 User, Category) 튜플을 (created_at, id) 내림차순으로 최대 limit + 1개 반환.
+    before는 (created_at, id) 커서.
+    """
+    fetch_size = limit + 1
+
+    # 1. 타임라인 테이블 범위 스캔 (user_id, created_at, todo_id 인덱스)
+    entries = db.session.query(Todo, User, Category)\
+                        .select_from(TimelineEntry)\
+                        .join(Todo, Todo.id == TimelineEntry.todo_id)\
+                        .join(User, User.id == TimelineEntry.author_id)\
+                        .outerjoin(Category, Category.id == Todo.category_id)\
+                        .filter(TimelineEntry.user_id == user_id, Todo.is_public == True)
+    if before:
+        before_created_at, before_id = before
+        entries = entries.filter(or_(
+            TimelineEntry.created_at < before_created_at,
+            and_(TimelineEntry.created_at == before_created_at, TimelineEntry.todo_id < before_id)
+        ))
+    entries = entries.order_by(TimelineEntry.created_at.desc(), TimelineEntry.todo_id.desc())\
+                     .limit(fetch_size).all()
+
+    # 2. fan-out 하지 않는 작성자의 공개 할 일 (읽기 시 병합)
+    merged = db.session.query(Todo, User, Category)\
+                       .join(followers, followers.c.followed_id == Todo.user_id)\
+                       .join(User, User.id == Todo.user_id)\
+                       .outerjoin(Category, Category.id == Todo.category_id)\
+                       .filter(followers.c.follower_id == user_id,
+                               User.fanout_disabled == True,
+                               Todo.is_public == True)
+    if before:
+        before_created_at, before_id = before
+        merged = merged.filter(or_(
+            Todo.created_at < before_created_at,
+            and_(Todo.created_at == before_created_at, Todo.id < before_id)
+        ))
+    merged = merged.order_by(Todo.created_at.desc(), Todo.id.desc())\
+                   .limit(fetch_size).all()
+
+    if not merged:
+        return entries
+
+    # fan-out 중단 이전에 기록된 항목과 중복될 수 있으므로 할 일 ID로 병합
+    rows = {row[0].id: row for row in entries + merged}
+    ordered = sorted(rows.values(), key=lambda row: (row[0].created_at, row[0].id), reverse=True)
+    return ordered[:fetch_size]
+
+def rebuild_timeline():
+    """전체 타임라인 재구성 - fan-out 모드를 다시 계산하고 단일 INSERT ... SELECT로 채움"""
+    threshold = current_app.config['TIMELINE_FANOUT_MAX_FOLLOWERS']
+
+    # fan-out 모드 재계산
+    heavy_users = select(followers.c.followed_id)\
+        .group_by(followers.c.followed_id)\
+        .having(func.count() >= threshold)
+    db.session.execute(User.__table__.update().values(fanout_disabled=False))
+    db.session.execute(
+        User.__table__.update().where(User.id.in_(heavy_users)).values(fanout_disabled=True)
+    )
+
+    # 타임라인 다시 채우기
+    db.session.execute(TimelineEntry.__table__.delete())
+    entries = select(
+        followers.c.follower_id,
+        Todo.id,
+        Todo.user_id,
+        Todo.created_at
+    ).select_from(
+        followers.join(Todo, Todo.user_id == followers.c.followed_id)
+                 .join(User, User.id == Todo.user_id)
+    ).where(
+        Todo.is_public == True,
+        User.fanout_disabled == False
+    )
+    db.session.execute(TimelineEntry.__table__.insert().from_select(ENTRY_COLUMNS, entries))
+    db.session.commit()
+
+    return db.session.query(func.count()).select_from(TimelineEntry).scalar()
+
+@click.command('rebuild-timeline')
+@with_appcontext
+def rebuild_timeline_command():
+    """탐색 타임라인 전체 재구성"""
+    count = rebuild_timeline()
+    click.echo(f"타임라인 재구성 완료: {count}건")
@@ -1,5 +1,7 @@
 # app/utils.py
 import os
+import json
+import base64
 from datetime import datetime
 from werkzeug.utils import secure_filename
 from flask import current_app, session
@@ -92,6 +94,7 @@ def create_notification(user_id, message, notification_type, sender_id=None):
     """알림 생성 유틸리티 함수"""
     from app.models import Notification
     from app.extensions import db
+    from app import versions
     
     try:
         notification = Notification(
@@ -102,10 +105,112 @@ def create_notification(user_id, message, notification_type, sender_id=None):
         )
         
         db.session.add(notification)
+        versions.bump(user_id, versions.SCOPE_NOTIFICATIONS)
         db.session.commit()
         
+        # 알림 스트림(SSE) 구독자에게 전달
+        from app.extensions import notification_broker
+        notification_broker.publish(notification)
+        
         return notification
     except Exception as e:
         logger.error(f"알림 생성 중 오류: {str(e)}")
         db.session.rollback()
-        return None
\ No newline at end of file
+        return None
+
+def set_notifications_read(user_id, ids=None, up_to=None):
+    """사용자의 읽지 않은 알림을 UPDATE 한 번으로 읽음 처리 후 변경된 수 반환 (커밋은 호출자 담당)
+
+    ids가 있으면 해당 알림만, up_to가 있으면 id가 up_to 이하인 알림만, 둘 다 없으면 모든 알림.
+    """
+    from app.models import Notification
+    from app import versions
+    
+    query = Notification.query.filter(Notification.user_id == user_id, Notification.is_read == False)
+    if ids is not None:
+        if not ids:
+            return 0
+        query = query.filter(Notification.id.in_(ids))
+    if up_to is not None:
+        query = query.filter(Notification.id <= up_to)
+    
+    updated = query.update({'is_read': True}, synchronize_session=False)
+    if updated:
+        versions.bump(user_id, versions.SCOPE_NOTIFICATIONS)
+    return updated
+
+def notification_page(user_id, limit, before=None, unread_only=False):
+    """알림 한 페이지 조회
+
+    (created_at, id) 내림차순으로 최대 limit + 1개의 행 반환 (user_id, created_at 인덱스 범위 스캔).
+    before는 (created_at, id) 커서, 보낸 사용자는 응답에 쓰는 열만 같은 쿼리에서 함께 조회.
+    행은 serializers.notification_dicts()로 직렬화.
+    """
+    from sqlalchemy import or_, and_
+    from app.extensions import db
+    from app.models import Notification
+    from app.serializers import notification_select
+    
+    statement = notification_select().where(Notification.user_id == user_id)
+    if unread_only:
+        statement = statement.where(Notification.is_read == False)
+    if before:
+        before_created_at, before_id = before
+        statement = statement.where(or_(
+            Notification.created_at < before_created_at,
+            and_(Notification.created_at == before_created_at, Notification.id < before_id)
+        ))
+    statement = statement.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(limit + 1)
+    return db.session.execute(statement).all()
+
+def parse_notification_page_args(args):
+    """알림 목록 쿼리 파라미터 (limit, before 커서, unread_only), 잘못된 값은 ValueError"""
+    limit = parse_page_size(args.get('limit'),
+                            current_app.config['NOTIFICATIONS_PAGE_SIZE'],
+                            current_app.config['NOTIFICATIONS_MAX_PAGE_SIZE'])
+    before = args.get('before')
+    before = decode_cursor(before) if before else None
+    unread_only = args.get('unread_only', '').lower() in ('1', 'true')
+    return limit, before, unread_only
+
+def split_notification_page(rows, limit):
+    """notification_page()의 limit + 1개 조회 결과를 한 페이지와 다음 커서로 분리"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+def parse_notification_ids(value, maximum):
+    """알림 ID 목록 검증 (정수 목록, 최대 maximum개), 잘못된 값은 ValueError"""
+    if not isinstance(value, list) or not all(isinstance(item, int) and not isinstance(item, bool) for item in value):
+        raise ValueError('알림 ID 목록은 정수 배열이어야 합니다.')
+    if len(value) > maximum:
+        raise ValueError(f'알림 ID는 한 번에 {maximum}개까지 처리할 수 있습니다.')
+    return value
+
+def parse_page_size(value, default, maximum):
+    """페이지 크기 파라미터 파싱 (1 ~ maximum 범위로 제한)"""
+    if value is None or value == '':
+        return default
+    
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('페이지 크기는 정수여야 합니다.')
+    if size < 1:
+        raise ValueError('페이지 크기는 1 이상이어야 합니다.')
+    return min(size, maximum)
+
+def encode_cursor(timestamp, row_id):
+    """키셋 페이지네이션 커서 생성 - (날짜/시각, id) 쌍을 불투명 문자열로 인코딩"""
+    raw = json.dumps([timestamp.strftime('%Y-%m-%dT%H:%M:%S.%f'), row_id])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """커서 문자열을 (datetime, id) 쌍으로 디코딩, 잘못된 커서는 ValueError"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%S.%f'), int(row_id)
+    except Exception:
+        raise ValueError(f'잘못된 커서입니다: {cursor}')
@@ -0,0 +1,85 @@
+import hashlib
+import logging
+from flask import request, current_app
+from sqlalchemy import select, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.extensions import db
+from app.models import UserDataVersion
+
+# 사용자별 데이터 버전
+# - 쓰기 경로가 같은 트랜잭션 안에서 해당 범위(scope)의 버전을 1 증가
+# - 목록 API는 버전으로 ETag를 만들고, If-None-Match가 일치하면 본 테이블 조회 없이 304 응답
+# - 버전은 단조 증가하므로 사용자 데이터 캐시 키로도 사용 가능 (get_version)
+
+logger = logging.getLogger(__name__)
+
+SCOPE_TODOS = 'todos'
+SCOPE_CATEGORIES = 'categories'
+SCOPE_NOTIFICATIONS = 'notifications'
+SCOPE_PROFILE = 'profile'
+
+def bump(user_id, *scopes):
+    """사용자 데이터 버전 증가 (커밋은 호출자 담당)"""
+    if not user_id:
+        return
+
+    table = UserDataVersion.__table__
+    dialect = db.engine.dialect.name
+
+    for scope in scopes:
+        values = {'user_id': user_id, 'scope': scope, 'version': 1}
+        if dialect == 'mysql':
+            statement = mysql_insert(table).values(**values)\
+                .on_duplicate_key_update(version=table.c.version + 1)
+        elif dialect == 'sqlite':
+            statement = sqlite_insert(table).values(**values)\
+                .on_conflict_do_update(index_elements=['user_id', 'scope'],
+                                       set_={'version': table.c.version + 1})
+        else:
+            updated = db.session.execute(
+                table.update()
+                     .where(table.c.user_id == user_id, table.c.scope == scope)
+                     .values(version=table.c.version + 1)
+            )
+            if updated.rowcount:
+                continue
+            statement = table.insert().values(**values)
+
+        db.session.execute(statement)
+
+def get_version(user_id, scope):
+    """사용자 데이터 버전 조회 (기록이 없으면 0)"""
+    version = db.session.query(UserDataVersion.version)\
+                        .filter_by(user_id=user_id, scope=scope)\
+                        .scalar()
+    return version or 0
+
+def version_column(user_id, scope):
+    """사용자 데이터 버전 스칼라 서브쿼리 (데이터와 같은 SELECT 문에서 함께 읽을 때 사용)"""
+    version = select(UserDataVersion.version)\
+        .where(UserDataVersion.user_id == user_id, UserDataVersion.scope == scope)\
+        .scalar_subquery()
+    return func.coalesce(version, 0)
+
+def request_etag(user_id, scope, version=None):
+    """현재 요청에 대한 ETag와 클라이언트 캐시 유효 여부 반환
+
+    데이터보다 버전을 먼저 읽어야 ETag가 실제 응답보다 최신인 경우가 생기지 않음.
+    데이터와 함께 읽은 버전(version_column)이 있으면 그 값을 사용.
+    """
+    if version is None:
+        version = get_version(user_id, scope)
+    raw = f"{user_id}:{scope}:{version}:{request.query_string.decode('utf-8')}"
+    etag = hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    return etag, request.if_none_match.contains(etag)
+
+def not_modified(etag):
+    """304 Not Modified 응답"""
+    return with_etag(current_app.response_class(status=304), etag)
+
+def with_etag(response, etag):
+    """응답에 ETag 설정, 브라우저는 매번 재검증"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
@@ -0,0 +1,365 @@
+# benchmarks/api_benchmark.py
+"""API 성능 측정
+
+create_app('testing')으로 만든 앱(SQLite 인메모리)에 고정 시드의 데이터를 채우고
+실제 사용 패턴을 섞은 시나리오를 실행해 엔드포인트별 처리량과 p50/p95/p99를 JSON으로 출력.
+
+    python -m benchmarks.api_benchmark run --output result.json
+    python -m benchmarks.api_benchmark compare result.json
+    python -m benchmarks.api_benchmark run --update-baseline
+
+compare는 기준값(benchmarks/baseline.json)보다 p50 또는 p95가 허용 범위 이상 느려진
+엔드포인트가 있으면 종료 코드 1을 반환. 기준값은 같은 장비에서 만든 것과 비교해야 의미가 있음.
+"""
+import os
+import sys
+import contextlib
+import json
+import time
+import random
+import logging
+import platform
+import datetime
+from collections import defaultdict
+import click
+
+from app import create_app
+from app.extensions import db
+from app.models import User, Todo, Category, Notification, followers
+from app.timeline import rebuild_timeline
+from app.follows import follow_count_subqueries
+from app.stats import rebuild as rebuild_todo_stats
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# 데이터 규모 (scale 배수 적용)
+USERS = 40
+FOLLOWS_PER_USER = 15
+TODOS_PER_USER = 150
+CATEGORIES_PER_USER = 4
+NOTIFICATIONS_PER_USER = 60
+PUBLIC_RATIO = 0.3
+
+# 시나리오별 실행 비중
+SCENARIO_WEIGHTS = {
+    'calendar_load': 4,
+    'todo_crud_burst': 2,
+    'explore_feed': 3,
+    'notification_poll': 5,
+}
+
+# ---------------------------------------------------------------------------
+# 데이터 준비
+# ---------------------------------------------------------------------------
+
+def seed(app, scale, rng):
+    """사용자, 카테고리, 할 일, 팔로우, 알림 생성 후 사용자 ID 목록 반환"""
+    user_count = max(2, int(USERS * scale))
+    base = datetime.datetime(2026, 1, 1)
+
+    with app.app_context():
+        db.create_all()
+
+        users = [{'username': f'bench{i}', 'email': f'bench{i}@example.com',
+                  'nickname': f'벤치{i}', 'password_hash': 'x', 'created_at': base}
+                 for i in range(user_count)]
+        db.session.execute(User.__table__.insert(), users)
+        user_ids = [user_id for user_id, in db.session.query(User.id)
+                                                   .filter(User.username.like('bench%'))
+                                                   .order_by(User.id)]
+
+        categories = [{'name': f'카테고리{j}', 'color': '#3498db', 'user_id': user_id,
+                       'created_at': base, 'updated_at': base}
+                      for user_id in user_ids for j in range(CATEGORIES_PER_USER)]
+        db.session.execute(Category.__table__.insert(), categories)
+        category_ids = defaultdict(list)
+        for category_id, user_id in db.session.query(Category.id, Category.user_id):
+            category_ids[user_id].append(category_id)
+
+        todos = []
+        for user_id in user_ids:
+            for j in range(int(TODOS_PER_USER * scale) or 1):
+                created_at = base + datetime.timedelta(minutes=rng.randrange(90 * 24 * 60))
+                todos.append({
+                    'title': f'할 일 {user_id}-{j}',
+                    'description': '벤치마크 데이터' if j % 3 == 0 else None,
+                    'date': created_at.replace(hour=0, minute=0, second=0),
+                    'completed': rng.random() < 0.4,
+                    'pinned': rng.random() < 0.05,
+                    'is_public': rng.random() < PUBLIC_RATIO,
+                    'user_id': user_id,
+                    'category_id': rng.choice(category_ids[user_id] + [None]),
+                    'created_at': created_at,
+                    'updated_at': created_at,
+                })
+        db.session.execute(Todo.__table__.insert(), todos)
+
+        follows = set()
+        for user_id in user_ids:
+            for followed_id in rng.sample(user_ids, min(FOLLOWS_PER_USER, len(user_ids) - 1) + 1):
+                if followed_id != user_id:
+                    follows.add((user_id, followed_id))
+        db.session.execute(followers.insert(),
+                           [{'follower_id': a, 'followed_id': b} for a, b in sorted(follows)])
+        followers_count, following_count = follow_count_subqueries(User.__table__)
+        db.session.execute(User.__table__.update().values(followers_count=followers_count,
+                                                          following_count=following_count))
+
+        notifications = [{'message': f'알림 {user_id}-{j}', 'type': 'follow', 'is_read': j % 2 == 0,
+                          'user_id': user_id, 'sender_id': rng.choice(user_ids),
+                          'created_at': base + datetime.timedelta(minutes=j)}
+                         for user_id in user_ids for j in range(int(NOTIFICATIONS_PER_USER * scale) or 1)]
+        db.session.execute(Notification.__table__.insert(), notifications)
+        db.session.commit()
+
+        rebuild_timeline()
+        rebuild_todo_stats()
+
+    return user_ids
+
+# ---------------------------------------------------------------------------
+# 시나리오
+# ---------------------------------------------------------------------------
+
+class Recorder:
+    """엔드포인트별 응답 시간 기록"""
+
+    def __init__(self, client):
+        self.client = client
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.enabled = True
+
+    def request(self, label, method, url, expected=(200,), **kwargs):
+        started_at = time.perf_counter()
+        response = self.client.open(url, method=method, **kwargs)
+        elapsed = time.perf_counter() - started_at
+
+        if self.enabled:
+            self.samples[label].append(elapsed)
+            if response.status_code not in expected:
+                self.errors[label] += 1
+        return response
+
+def login(client, user_id):
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+        sess['user_id'] = user_id
+
+def calendar_load(recorder, state, rng):
+    """캘린더 첫 화면: 카테고리, 월 단위 할 일, 프로필"""
+    month = rng.randrange(1, 4)
+    start = datetime.date(2026, month, 1)
+    end = (start + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1)
+    recorder.request('GET /api/topics', 'GET', '/api/topics')
+    recorder.request('GET /api/todos?from&to', 'GET', f'/api/todos?from={start}&to={end}')
+    recorder.request('GET /api/user/profile', 'GET', '/api/user/profile')
+
+def todo_crud_burst(recorder, state, rng):
+    """할 일 여러 개를 연속으로 생성/수정/핀 고정/삭제"""
+    created = []
+    for i in range(5):
+        response = recorder.request('POST /api/todos', 'POST', '/api/todos', expected=(201,), json={
+            'title': f'새 할 일 {i}',
+            'date': f'2026-0{rng.randrange(1, 4)}-{rng.randrange(1, 29):02d}',
+            'is_public': rng.random() < PUBLIC_RATIO
+        })
+        if response.status_code == 201:
+            created.append(response.get_json()['id'])
+
+    for todo_id in created:
+        recorder.request('PUT /api/todos/<id>', 'PUT', f'/api/todos/{todo_id}',
+                         json={'completed': True, 'description': '수정됨'})
+    if created:
+        recorder.request('POST /api/todos/<id>/toggle-pin', 'POST', f'/api/todos/{created[0]}/toggle-pin')
+    for todo_id in created:
+        recorder.request('DELETE /api/todos/<id>', 'DELETE', f'/api/todos/{todo_id}')
+
+def explore_feed(recorder, state, rng):
+    """탐색 피드 첫 페이지와 다음 페이지"""
+    response = recorder.request('GET /api/explore/todos', 'GET', '/api/explore/todos?limit=50')
+    cursor = response.headers.get('X-Next-Cursor')
+    if cursor:
+        recorder.request('GET /api/explore/todos?before', 'GET', '/api/explore/todos',
+                         query_string={'limit': 50, 'before': cursor})
+    recorder.request('GET /api/explore/users', 'GET', '/api/explore/users')
+
+def notification_poll(recorder, state, rng):
+    """알림 폴링: 대부분 변경 없음(If-None-Match), 가끔 전체 조회"""
+    etag = state.get('notifications_etag')
+    if etag and rng.random() < 0.8:
+        recorder.request('GET /api/notifications (304)', 'GET', '/api/notifications',
+                         expected=(304,), headers={'If-None-Match': f'"{etag}"'})
+        return
+
+    response = recorder.request('GET /api/notifications', 'GET', '/api/notifications')
+    etag, weak = response.get_etag()
+    state['notifications_etag'] = etag
+
+SCENARIOS = {
+    'calendar_load': calendar_load,
+    'todo_crud_burst': todo_crud_burst,
+    'explore_feed': explore_feed,
+    'notification_poll': notification_poll,
+}
+
+# ---------------------------------------------------------------------------
+# 실행 및 집계
+# ---------------------------------------------------------------------------
+
+def percentile(sorted_values, percent):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(percent / 100.0 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def summarize(samples, errors):
+    endpoints = {}
+    for label, values in sorted(samples.items()):
+        values = sorted(values)
+        total = sum(values)
+        endpoints[label] = {
+            'count': len(values),
+            'errors': errors.get(label, 0),
+            'mean_ms': round(total / len(values) * 1000, 3),
+            'p50_ms': round(percentile(values, 50) * 1000, 3),
+            'p95_ms': round(percentile(values, 95) * 1000, 3),
+            'p99_ms': round(percentile(values, 99) * 1000, 3),
+            'throughput_rps': round(len(values) / total, 1) if total else 0.0,
+        }
+    return endpoints
+
+def run_benchmark(iterations=300, warmup=30, scale=1.0, seed_value=42):
+    """시나리오를 iterations번 실행하고 결과 딕셔너리 반환"""
+    rng = random.Random(seed_value)
+    app = create_app('testing')
+    user_ids = seed(app, scale, rng)
+
+    # 사용자마다 클라이언트(세션) 하나
+    clients = {}
+    for user_id in user_ids:
+        client = app.test_client()
+        login(client, user_id)
+        clients[user_id] = (Recorder(client), {})
+
+    names = list(SCENARIO_WEIGHTS)
+    weights = [SCENARIO_WEIGHTS[name] for name in names]
+
+    def run_once():
+        user_id = rng.choice(user_ids)
+        recorder, state = clients[user_id]
+        SCENARIOS[rng.choices(names, weights)[0]](recorder, state, rng)
+
+    for recorder, state in clients.values():
+        recorder.enabled = False
+    for _ in range(warmup):
+        run_once()
+    for recorder, state in clients.values():
+        recorder.enabled = True
+
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        run_once()
+    elapsed = time.perf_counter() - started_at
+
+    samples = defaultdict(list)
+    errors = defaultdict(int)
+    for recorder, state in clients.values():
+        for label, values in recorder.samples.items():
+            samples[label].extend(values)
+        for label, count in recorder.errors.items():
+            errors[label] += count
+
+    request_count = sum(len(values) for values in samples.values())
+    return {
+        'meta': {
+            'iterations': iterations,
+            'warmup': warmup,
+            'scale': scale,
+            'seed': seed_value,
+            'users': len(user_ids),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'database': 'sqlite (memory)',
+        },
+        'total': {
+            'requests': request_count,
+            'errors': sum(errors.values()),
+            'elapsed_s': round(elapsed, 3),
+            'throughput_rps': round(request_count / elapsed, 1) if elapsed else 0.0,
+        },
+        'endpoints': summarize(samples, errors),
+    }
+
+def compare_results(baseline, current, tolerance=0.25, min_delta_ms=1.0):
+    """기준값보다 느려진 항목 목록 반환
+
+    p50/p95가 (1 + tolerance)배를 넘고 차이가 min_delta_ms 이상이면 회귀로 판단
+    (아주 빠른 엔드포인트의 측정 잡음 제외).
+    """
+    regressions = []
+    for label, base in baseline['endpoints'].items():
+        result = current['endpoints'].get(label)
+        if result is None:
+            regressions.append(f'{label}: 결과 없음')
+            continue
+        for key in ('p50_ms', 'p95_ms'):
+            limit = base[key] * (1 + tolerance)
+            if result[key] > limit and result[key] - base[key] >= min_delta_ms:
+                regressions.append(f'{label}: {key} {base[key]} -> {result[key]} (허용 {limit:.3f})')
+        if result['errors'] > base.get('errors', 0):
+            regressions.append(f'{label}: 오류 {base.get("errors", 0)} -> {result["errors"]}')
+    return regressions
+
+@click.group()
+def cli():
+    """API 성능 측정"""
+
+@cli.command('run')
+@click.option('--iterations', default=300, show_default=True, help='측정할 시나리오 실행 횟수')
+@click.option('--warmup', default=30, show_default=True, help='측정 전에 실행할 횟수')
+@click.option('--scale', default=1.0, show_default=True, help='데이터 규모 배수')
+@click.option('--seed', 'seed_value', default=42, show_default=True)
+@click.option('--output', type=click.Path(dir_okay=False), help='결과 JSON 파일 (없으면 표준 출력)')
+@click.option('--update-baseline', is_flag=True, help='결과를 기준값으로 저장')
+def run_command(iterations, warmup, scale, seed_value, output, update_baseline):
+    """시나리오 실행 후 결과 JSON 출력"""
+    logging.disable(logging.INFO)
+    # 애플리케이션이 표준 출력에 쓰는 내용이 JSON에 섞이지 않도록 분리
+    with contextlib.redirect_stdout(sys.stderr):
+        result = run_benchmark(iterations, warmup, scale, seed_value)
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    if update_baseline:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        click.echo(f'기준값 저장: {BASELINE_PATH}', err=True)
+    if not output and not update_baseline:
+        click.echo(text)
+
+@cli.command('compare')
+@click.argument('result', type=click.Path(exists=True, dir_okay=False))
+@click.option('--baseline', default=BASELINE_PATH, show_default=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--tolerance', default=0.25, show_default=True, help='허용하는 지연 증가 비율')
+@click.option('--min-delta-ms', default=1.0, show_default=True, help='이보다 작은 차이는 무시')
+def compare_command(result, baseline, tolerance, min_delta_ms):
+    """결과를 기준값과 비교, 회귀가 있으면 종료 코드 1"""
+    with open(baseline, encoding='utf-8') as f:
+        baseline_data = json.load(f)
+    with open(result, encoding='utf-8') as f:
+        result_data = json.load(f)
+
+    regressions = compare_results(baseline_data, result_data, tolerance, min_delta_ms)
+    if regressions:
+        for line in regressions:
+            click.echo(f'회귀: {line}', err=True)
+        sys.exit(1)
+    click.echo('회귀 없음')
+
+if __name__ == '__main__':
+    cli()
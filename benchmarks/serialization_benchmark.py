@@ -0,0 +1,120 @@
+# benchmarks/serialization_benchmark.py
+"""목록 직렬화 마이크로 벤치마크
+
+SQLite 인메모리 DB에 할 일/알림을 채운 뒤 목록 응답 본문을 만드는 시간을 경로별로 측정해 JSON으로 출력.
+HTTP 처리 없이 조회 + 직렬화 + 인코딩만 측정.
+
+- orm: ORM 조회 + to_dict() + jsonify() (이전 방식)
+- columnar: Core select() + 열 단위 직렬화 + json.dumps (orjson 사용 안 함)
+- columnar_orjson: Core select() + 열 단위 직렬화 + orjson (설치된 경우)
+
+    python -m benchmarks.serialization_benchmark --rows 5000 --repeat 20
+"""
+import json
+import time
+import datetime
+import statistics
+import click
+from flask import jsonify
+
+from app import create_app, serializers
+from app.extensions import db
+from app.models import User, Todo, Notification
+
+def seed(app, rows):
+    """사용자 두 명과 rows개씩의 할 일/알림 생성 후 사용자 ID 반환"""
+    base = datetime.datetime(2026, 1, 1)
+    with app.app_context():
+        db.create_all()
+        db.session.execute(User.__table__.insert(), [
+            {'username': name, 'email': f'{name}@example.com', 'nickname': f'{name} 닉네임', 'password_hash': 'x'}
+            for name in ('owner', 'sender')
+        ])
+        owner_id, sender_id = [user_id for user_id, in db.session.query(User.id).order_by(User.id)]
+        db.session.execute(Todo.__table__.insert(), [
+            {'title': f'할 일 {i}', 'description': f'설명 {i}' if i % 3 else None,
+             'date': base + datetime.timedelta(days=i % 365), 'completed': i % 2 == 0, 'pinned': False,
+             'is_public': i % 4 == 0, 'user_id': owner_id,
+             'created_at': base + datetime.timedelta(seconds=i), 'updated_at': base + datetime.timedelta(seconds=i)}
+            for i in range(rows)
+        ])
+        db.session.execute(Notification.__table__.insert(), [
+            {'message': f'알림 {i}', 'type': 'follow', 'is_read': i % 2 == 0, 'user_id': owner_id,
+             'sender_id': sender_id if i % 5 else None, 'created_at': base + datetime.timedelta(seconds=i)}
+            for i in range(rows)
+        ])
+        db.session.commit()
+        return owner_id
+
+def orm_todos(user_id):
+    todos = Todo.query.filter(Todo.user_id == user_id).order_by(Todo.date, Todo.id).all()
+    return jsonify([todo.to_dict() for todo in todos]).get_data()
+
+def columnar_todos(user_id):
+    statement, fields = serializers.todo_select()
+    rows = db.session.execute(statement.where(Todo.user_id == user_id).order_by(Todo.date, Todo.id)).all()
+    return serializers.json_response(serializers.todo_dicts(rows, fields)).get_data()
+
+def orm_notifications(user_id):
+    notifications = Notification.query.filter(Notification.user_id == user_id)\
+                                      .order_by(Notification.created_at.desc(), Notification.id.desc()).all()
+    return jsonify([notification.to_dict() for notification in notifications]).get_data()
+
+def columnar_notifications(user_id):
+    statement = serializers.notification_select().where(Notification.user_id == user_id)\
+        .order_by(Notification.created_at.desc(), Notification.id.desc())
+    rows = db.session.execute(statement).all()
+    return serializers.json_response(serializers.notification_dicts(rows)).get_data()
+
+CASES = {
+    'todos': (orm_todos, columnar_todos),
+    'notifications': (orm_notifications, columnar_notifications),
+}
+
+def measure(app, func, user_id, repeat):
+    """repeat번 실행한 시간(ms) 중앙값과 마지막 본문"""
+    samples = []
+    for _ in range(repeat):
+        with app.test_request_context():
+            started_at = time.perf_counter()
+            body = func(user_id)
+            samples.append((time.perf_counter() - started_at) * 1000)
+            # 요청마다 세션을 비워 식별자 맵에 남은 객체가 다음 측정에 영향을 주지 않도록
+            db.session.remove()
+    return round(statistics.median(samples), 3), body
+
+def run_benchmark(rows=2000, repeat=10):
+    app = create_app('testing')
+    user_id = seed(app, rows)
+    fast_available = serializers.orjson is not None
+
+    result = {'rows': rows, 'repeat': repeat, 'orjson': fast_available, 'cases': {}}
+    for name, (orm_func, columnar_func) in CASES.items():
+        case = {}
+        case['orm_ms'], expected = measure(app, orm_func, user_id, repeat)
+
+        app.config['JSON_FAST_ENCODER'] = False
+        case['columnar_ms'], body = measure(app, columnar_func, user_id, repeat)
+        identical = body == expected
+
+        if fast_available:
+            app.config['JSON_FAST_ENCODER'] = True
+            case['columnar_orjson_ms'], body = measure(app, columnar_func, user_id, repeat)
+            identical = identical and body == expected
+
+        fastest = min(case['columnar_ms'], case.get('columnar_orjson_ms', case['columnar_ms']))
+        case['speedup'] = round(case['orm_ms'] / fastest, 2) if fastest else None
+        case['identical'] = identical
+        result['cases'][name] = case
+    return result
+
+@click.command()
+@click.option('--rows', default=2000, show_default=True, help='목록 행 수')
+@click.option('--repeat', default=10, show_default=True, help='경로별 반복 횟수 (중앙값 사용)')
+def main(rows, repeat):
+    """목록 직렬화 경로별 시간 측정 후 결과 JSON 출력"""
+    result = run_benchmark(rows, repeat)
+    click.echo(json.dumps(result, ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/startup_benchmark.py
+"""앱 시작 시간 측정
+
+새 파이썬 프로세스에서 app 패키지 import와 create_app()에 걸린 시간을 반복 측정해 JSON으로 출력.
+create_app이 DB에 접속하지 않으므로 DB 없이도 운영 설정(production)으로 측정할 수 있음.
+
+    python -m benchmarks.startup_benchmark --runs 10
+    python -m benchmarks.startup_benchmark --config production --max-ms 1500
+"""
+import os
+import sys
+import json
+import subprocess
+import click
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 프로세스에서 실행할 코드: import/생성 시간과 생성 중 DB 연결 수 출력
+PROBE = """
+import json, sys, time
+started_at = time.perf_counter()
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+connections = []
+event.listen(Pool, 'connect', lambda *args: connections.append(1))
+import logging
+logging.disable(logging.INFO)
+from app import create_app
+imported_at = time.perf_counter()
+create_app(sys.argv[1])
+created_at = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported_at - started_at) * 1000,
+    'create_app_ms': (created_at - imported_at) * 1000,
+    'total_ms': (created_at - started_at) * 1000,
+    'db_connections': len(connections)
+}))
+"""
+
+def percentile(sorted_values, percent):
+    """nearest-rank 백분위수"""
+    rank = max(1, int(round(percent / 100.0 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def measure(config_name, runs):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', PROBE, config_name], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    result = {'config': config_name, 'runs': runs,
+              'db_connections': max(sample['db_connections'] for sample in samples)}
+    for key in ('import_ms', 'create_app_ms', 'total_ms'):
+        values = sorted(sample[key] for sample in samples)
+        result[key] = {
+            'p50': round(percentile(values, 50), 2),
+            'p95': round(percentile(values, 95), 2),
+            'max': round(values[-1], 2),
+        }
+    return result
+
+@click.command()
+@click.option('--config', 'config_name', default='production', show_default=True,
+              type=click.Choice(['production', 'development', 'testing']))
+@click.option('--runs', default=10, show_default=True, help='측정 횟수 (매번 새 프로세스)')
+@click.option('--max-ms', type=float, help='전체 시작 시간 p50이 이 값을 넘으면 종료 코드 1')
+def main(config_name, runs, max_ms):
+    """앱 시작 시간 측정 후 결과 JSON 출력"""
+    result = measure(config_name, runs)
+    click.echo(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if result['db_connections']:
+        click.echo('앱 생성 중 DB 연결이 발생했습니다.', err=True)
+        sys.exit(1)
+    if max_ms is not None and result['total_ms']['p50'] > max_ms:
+        click.echo(f"시작 시간 p50 {result['total_ms']['p50']}ms가 상한 {max_ms}ms를 넘었습니다.", err=True)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
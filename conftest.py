@@ -0,0 +1,39 @@
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models import User
+
+
+def create_test_app():
+    """테스트용 앱 (SQLite 인메모리) 생성 후 테이블 생성"""
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+@pytest.fixture
+def app():
+    app = create_test_app()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def login(client, user_id):
+    """세션에 로그인 정보 설정"""
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+        sess['user_id'] = user_id
+
+
+def create_user(username):
+    """사용자 생성 후 ID 반환 (앱 컨텍스트 안에서 호출)"""
+    user = User(username=username, email=f'{username}@example.com')
+    user.set_password('password')
+    db.session.add(user)
+    db.session.commit()
+    return user.id
@@ -0,0 +1,103 @@
+# gunicorn.conf.py
+import os
+import shutil
+import logging
+import multiprocessing
+
+# 운영 WSGI 서버 설정 (gunicorn wsgi:app, 현재 디렉터리의 이 파일을 자동으로 읽음)
+# - 워커 수: CPU 수 기준 (2 * CPU + 1), DB_MAX_CONNECTIONS가 있으면 전체 연결 수가 넘지 않도록 제한
+#   워커 하나의 연결 풀도 들어가지 않거나 GUNICORN_WORKERS가 한도를 넘으면 시작하지 않음
+# - 워커당 스레드 수: DB 연결 풀 크기 (요청 스레드마다 연결 하나, 초과분은 백그라운드 스레드용)
+#   gthread는 여기에 알림 스트림(SSE)용 스레드 NOTIFICATION_STREAM_MAX_CONNECTIONS개를 더함
+# - 워커 종류: gthread(기본) 또는 gevent (GUNICORN_WORKER_CLASS=gevent, 알림 SSE 연결이 많을 때)
+#   SSE 연결은 gthread에서 스레드 하나를 NOTIFICATION_STREAM_MAX_DURATION 동안 점유하지만 DB 연결은 쓰지 않음
+#   한도를 넘은 스트림은 앱이 503으로 거절하므로 열린 탭이 많아도 요청 스레드는 남아 있음
+# - preload: 마스터에서 앱을 한 번 만든 뒤 fork (연결 풀은 app/database.py에서 fork 후 새로 만듦)
+# 모든 값은 GUNICORN_* 환경 변수로 바꿀 수 있음
+
+logger = logging.getLogger('gunicorn.error')
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+def _app_config():
+    from config import config as app_config
+    return app_config.get(os.environ.get('FLASK_ENV', 'production'), app_config['default'])
+
+def _pool_settings():
+    """앱 설정의 워커당 연결 풀 크기와 추가 연결 수"""
+    options = _app_config().SQLALCHEMY_ENGINE_OPTIONS
+    # 지정하지 않으면 SQLAlchemy QueuePool 기본값
+    return options.get('pool_size', 5), options.get('max_overflow', 10)
+
+def check_connection_limit(workers, pool_size, max_overflow, db_max_connections=None):
+    """워커 전체의 최대 연결 수가 DB 최대 연결 수를 넘으면 ValueError (서버 시작 실패)"""
+    total = workers * (pool_size + max_overflow)
+    if db_max_connections and total > db_max_connections:
+        raise ValueError(
+            f"워커 {workers}개 x 연결 풀 {pool_size}+{max_overflow} = 최대 {total}개 연결이 "
+            f"DB_MAX_CONNECTIONS({db_max_connections})를 넘습니다. "
+            f"DB_POOL_SIZE/DB_MAX_OVERFLOW 또는 GUNICORN_WORKERS를 줄이세요."
+        )
+    return workers
+
+def worker_count(cpu_count, pool_size, max_overflow, db_max_connections=None):
+    """CPU 수로 정한 워커 수, DB 최대 연결 수를 넘지 않도록 제한
+
+    워커 하나의 연결 풀만으로도 DB 최대 연결 수를 넘으면 ValueError.
+    """
+    workers = 2 * cpu_count + 1
+    if db_max_connections:
+        workers = min(workers, db_max_connections // (pool_size + max_overflow))
+    return check_connection_limit(max(1, workers), pool_size, max_overflow, db_max_connections)
+
+def thread_count(pool_size, max_overflow, requested=None, stream_threads=0):
+    """워커당 스레드 수 - 요청 스레드(기본은 연결 풀 크기, 풀 전체 크기를 넘을 수 없음) + 알림 스트림용 스레드"""
+    return max(1, min(requested or pool_size, pool_size + max_overflow)) + stream_threads
+
+def _worker_class(requested):
+    if requested != 'gevent':
+        return 'gthread'
+    try:
+        import gevent  # noqa: F401
+    except ImportError:
+        logger.warning("gevent가 설치되어 있지 않아 gthread 워커를 사용합니다.")
+        return 'gthread'
+    return 'gevent'
+
+_pool_size, _max_overflow = _pool_settings()
+
+bind = os.environ.get('GUNICORN_BIND') or f"0.0.0.0:{os.environ.get('PORT', 5005)}"
+worker_class = _worker_class(os.environ.get('GUNICORN_WORKER_CLASS', 'gthread'))
+_db_max_connections = _env_int('DB_MAX_CONNECTIONS', 0)
+workers = check_connection_limit(_env_int('GUNICORN_WORKERS', 0), _pool_size, _max_overflow, _db_max_connections) \
+    or worker_count(multiprocessing.cpu_count(), _pool_size, _max_overflow, _db_max_connections)
+# 알림 스트림은 요청 스레드와 별도의 스레드를 사용 (gevent는 연결마다 greenlet이므로 필요 없음)
+_stream_threads = _app_config().NOTIFICATION_STREAM_MAX_CONNECTIONS if worker_class == 'gthread' else 0
+threads = thread_count(_pool_size, _max_overflow, _env_int('GUNICORN_THREADS', 0), _stream_threads)
+worker_connections = _env_int('GUNICORN_WORKER_CONNECTIONS', 1000)  # gevent 워커당 동시 연결 수
+
+# gevent는 fork 후 워커에서 monkey patch하므로 패치 전에 앱을 불러오지 않음
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'false' if worker_class == 'gevent' else 'true').lower() == 'true'
+
+# 메모리 누수/단편화 대비 워커 재시작 (여러 워커가 동시에 재시작하지 않도록 jitter)
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+timeout = _env_int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)  # 종료 시 SSE 연결은 끊기고 클라이언트가 재접속
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)  # 프록시(nginx 등)의 keepalive보다 짧게
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+def on_starting(server):
+    # 이전 실행의 워커 지표 파일이 합산되지 않도록 서버 시작 시 비움 (app/metrics.py)
+    directory = os.environ.get('METRICS_MULTIPROC_DIR')
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+    server.log.info(f"워커 {workers}개 x 스레드 {threads}개 ({worker_class}, 알림 스트림용 {_stream_threads}개 포함), "
+                    f"워커당 DB 연결 풀 {_pool_size}+{_max_overflow}")
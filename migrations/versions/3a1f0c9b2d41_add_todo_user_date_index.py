@@ -0,0 +1,31 @@
+"""todo (user_id, date, id) 복합 인덱스 추가
+
+Revision ID: 3a1f0c9b2d41
+Revises: 
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a1f0c9b2d41'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _index_names(table):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade():
+    # create_all()로 생성된 DB에는 이미 인덱스가 있으므로 건너뜀
+    if 'ix_todo_user_date_id' not in _index_names('todo'):
+        op.create_index('ix_todo_user_date_id', 'todo', ['user_id', 'date', 'id'], unique=False)
+
+
+def downgrade():
+    if 'ix_todo_user_date_id' in _index_names('todo'):
+        op.drop_index('ix_todo_user_date_id', table_name='todo')
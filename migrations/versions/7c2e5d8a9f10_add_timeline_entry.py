@@ -0,0 +1,57 @@
+"""탐색 타임라인 테이블 및 fan-out 모드 컬럼 추가
+
+Revision ID: 7c2e5d8a9f10
+Revises: 3a1f0c9b2d41
+Create Date: 2026-10-18 11:00:00.000000
+
+업그레이드 후 `flask rebuild-timeline`으로 기존 팔로우 관계의 타임라인을 채워야 함.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c2e5d8a9f10'
+down_revision = '3a1f0c9b2d41'
+branch_labels = None
+depends_on = None
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def upgrade():
+    inspector = _inspector()
+
+    if 'fanout_disabled' not in {column['name'] for column in inspector.get_columns('user')}:
+        op.add_column('user', sa.Column('fanout_disabled', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    # create_all()로 생성된 DB에는 이미 테이블이 있으므로 건너뜀
+    if 'timeline_entry' not in inspector.get_table_names():
+        op.create_table(
+            'timeline_entry',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('todo_id', sa.Integer(), nullable=False),
+            sa.Column('author_id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['todo_id'], ['todo.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['author_id'], ['user.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('user_id', 'todo_id')
+        )
+        op.create_index('ix_timeline_entry_user_created', 'timeline_entry', ['user_id', 'created_at', 'todo_id'], unique=False)
+        op.create_index('ix_timeline_entry_todo', 'timeline_entry', ['todo_id'], unique=False)
+        op.create_index('ix_timeline_entry_user_author', 'timeline_entry', ['user_id', 'author_id'], unique=False)
+
+
+def downgrade():
+    inspector = _inspector()
+
+    if 'timeline_entry' in inspector.get_table_names():
+        op.drop_table('timeline_entry')
+
+    if 'fanout_disabled' in {column['name'] for column in inspector.get_columns('user')}:
+        with op.batch_alter_table('user') as batch_op:
+            batch_op.drop_column('fanout_disabled')
@@ -0,0 +1,60 @@
+"""증분 동기화용 삭제 기록 테이블, category.updated_at, todo (user_id, updated_at) 인덱스 추가
+
+Revision ID: 9d4b1e6f2a37
+Revises: 7c2e5d8a9f10
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4b1e6f2a37'
+down_revision = '7c2e5d8a9f10'
+branch_labels = None
+depends_on = None
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def upgrade():
+    inspector = _inspector()
+
+    if 'updated_at' not in {column['name'] for column in inspector.get_columns('category')}:
+        op.add_column('category', sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute('UPDATE category SET updated_at = created_at')
+
+    if 'ix_todo_user_updated' not in {index['name'] for index in inspector.get_indexes('todo')}:
+        op.create_index('ix_todo_user_updated', 'todo', ['user_id', 'updated_at'], unique=False)
+
+    # create_all()로 생성된 DB에는 이미 테이블이 있으므로 건너뜀
+    if 'sync_tombstone' not in inspector.get_table_names():
+        op.create_table(
+            'sync_tombstone',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('entity', sa.String(length=20), nullable=False),
+            sa.Column('entity_id', sa.Integer(), nullable=False),
+            sa.Column('deleted_at', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_sync_tombstone_user_deleted', 'sync_tombstone', ['user_id', 'deleted_at'], unique=False)
+        op.create_index('ix_sync_tombstone_deleted', 'sync_tombstone', ['deleted_at'], unique=False)
+
+
+def downgrade():
+    inspector = _inspector()
+
+    if 'sync_tombstone' in inspector.get_table_names():
+        op.drop_table('sync_tombstone')
+
+    if 'ix_todo_user_updated' in {index['name'] for index in inspector.get_indexes('todo')}:
+        op.drop_index('ix_todo_user_updated', table_name='todo')
+
+    if 'updated_at' in {column['name'] for column in inspector.get_columns('category')}:
+        with op.batch_alter_table('category') as batch_op:
+            batch_op.drop_column('updated_at')
@@ -0,0 +1,57 @@
+"""사용자 추천 테이블 및 추천 갱신 대상 컬럼 추가
+
+Revision ID: a8d3f5c2e914
+Revises: f1b9d4e6a372
+Create Date: 2026-10-18 18:00:00.000000
+
+업그레이드 후 `flask refresh-recommendations --all`로 기존 사용자의 추천을 채워야 함.
+그 전까지는 탐색 API가 기존 방식(팔로우하지 않은 사용자)으로 추천함.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d3f5c2e914'
+down_revision = 'f1b9d4e6a372'
+branch_labels = None
+depends_on = None
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def upgrade():
+    inspector = _inspector()
+
+    # create_all()로 생성된 DB에는 이미 컬럼과 테이블이 있으므로 건너뜀
+    if 'recommendations_stale_at' not in {column['name'] for column in inspector.get_columns('user')}:
+        op.add_column('user', sa.Column('recommendations_stale_at', sa.DateTime(), nullable=True))
+        op.create_index('ix_user_recommendations_stale_at', 'user', ['recommendations_stale_at'], unique=False)
+
+    if 'user_recommendation' not in inspector.get_table_names():
+        op.create_table(
+            'user_recommendation',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('candidate_id', sa.Integer(), nullable=False),
+            sa.Column('score', sa.Float(), nullable=False),
+            sa.Column('mutual_count', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['candidate_id'], ['user.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('user_id', 'candidate_id')
+        )
+        op.create_index('ix_user_recommendation_user_score', 'user_recommendation', ['user_id', 'score'], unique=False)
+
+
+def downgrade():
+    inspector = _inspector()
+
+    if 'user_recommendation' in inspector.get_table_names():
+        op.drop_table('user_recommendation')
+
+    if 'recommendations_stale_at' in {column['name'] for column in inspector.get_columns('user')}:
+        op.drop_index('ix_user_recommendations_stale_at', table_name='user')
+        with op.batch_alter_table('user') as batch_op:
+            batch_op.drop_column('recommendations_stale_at')
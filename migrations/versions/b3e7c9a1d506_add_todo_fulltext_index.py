@@ -0,0 +1,66 @@
+"""할 일 전문 검색 색인 추가 (MySQL FULLTEXT ngram, SQLite FTS5)
+
+Revision ID: b3e7c9a1d506
+Revises: a8d3f5c2e914
+Create Date: 2026-10-18 19:00:00.000000
+
+MySQL은 기존 행을 색인하는 동안 todo 테이블 쓰기가 느려질 수 있음 (InnoDB FULLTEXT 생성).
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e7c9a1d506'
+down_revision = 'a8d3f5c2e914'
+branch_labels = None
+depends_on = None
+
+FULLTEXT_INDEX = 'ft_todo_title_description'
+FTS_TABLE = 'todo_fts'
+
+SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"title, description, content='todo', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON todo BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON todo BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) "
+    f"VALUES ('delete', old.id, old.title, old.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE OF title, description ON todo BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description) "
+    f"VALUES ('delete', old.id, old.title, old.description); "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+]
+
+
+def _index_names(table):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    # create_all()로 생성된 DB에는 이미 색인이 있으므로 건너뜀
+    if dialect == 'mysql':
+        if FULLTEXT_INDEX not in _index_names('todo'):
+            op.execute(f"ALTER TABLE todo ADD FULLTEXT INDEX {FULLTEXT_INDEX} (title, description) WITH PARSER ngram")
+    elif dialect == 'sqlite':
+        if FTS_TABLE not in sa.inspect(op.get_bind()).get_table_names():
+            for statement in SQLITE_DDL:
+                op.execute(statement)
+            # 기존 할 일 색인
+            op.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'mysql':
+        if FULLTEXT_INDEX in _index_names('todo'):
+            op.drop_index(FULLTEXT_INDEX, table_name='todo')
+    elif dialect == 'sqlite':
+        for trigger in ('insert', 'delete', 'update'):
+            op.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{trigger}")
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
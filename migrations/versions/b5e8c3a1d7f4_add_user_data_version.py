@@ -0,0 +1,34 @@
+"""사용자별 데이터 버전 테이블 추가 (목록 API ETag)
+
+Revision ID: b5e8c3a1d7f4
+Revises: 9d4b1e6f2a37
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e8c3a1d7f4'
+down_revision = '9d4b1e6f2a37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_all()로 생성된 DB에는 이미 테이블이 있으므로 건너뜀
+    if 'user_data_version' not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            'user_data_version',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('scope', sa.String(length=20), nullable=False),
+            sa.Column('version', sa.BigInteger(), nullable=False),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('user_id', 'scope')
+        )
+
+
+def downgrade():
+    if 'user_data_version' in sa.inspect(op.get_bind()).get_table_names():
+        op.drop_table('user_data_version')
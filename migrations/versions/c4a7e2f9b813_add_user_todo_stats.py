@@ -0,0 +1,46 @@
+"""사용자/카테고리별 할 일 집계 테이블 추가 및 기존 데이터 집계
+
+Revision ID: c4a7e2f9b813
+Revises: b5e8c3a1d7f4
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a7e2f9b813'
+down_revision = 'b5e8c3a1d7f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_all()로 생성된 DB에는 이미 테이블이 있으므로 건너뜀
+    if 'user_todo_stats' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        'user_todo_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('completed', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'category_id')
+    )
+
+    # 기존 할 일 집계 (flask rebuild-todo-stats와 동일)
+    op.execute(
+        'INSERT INTO user_todo_stats (user_id, category_id, total, completed) '
+        'SELECT user_id, COALESCE(category_id, 0), COUNT(*), '
+        'SUM(CASE WHEN completed THEN 1 ELSE 0 END) '
+        'FROM todo WHERE user_id IS NOT NULL '
+        'GROUP BY user_id, COALESCE(category_id, 0)'
+    )
+
+
+def downgrade():
+    if 'user_todo_stats' in sa.inspect(op.get_bind()).get_table_names():
+        op.drop_table('user_todo_stats')
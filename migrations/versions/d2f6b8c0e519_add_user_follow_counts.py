@@ -0,0 +1,78 @@
+"""user.followers_count/following_count 추가 및 범위별 채우기
+
+Revision ID: d2f6b8c0e519
+Revises: c4a7e2f9b813
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f6b8c0e519'
+down_revision = 'c4a7e2f9b813'
+branch_labels = None
+depends_on = None
+
+# 한 번에 채울 사용자 ID 범위 (범위마다 커밋해 테이블 잠금 시간을 짧게 유지)
+BATCH_SIZE = 1000
+
+user = sa.table(
+    'user',
+    sa.column('id', sa.Integer),
+    sa.column('followers_count', sa.Integer),
+    sa.column('following_count', sa.Integer)
+)
+
+followers = sa.table(
+    'followers',
+    sa.column('follower_id', sa.Integer),
+    sa.column('followed_id', sa.Integer)
+)
+
+
+def _user_columns():
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns('user')}
+
+
+def upgrade():
+    columns = _user_columns()
+    added = False
+
+    # create_all()로 생성된 DB에는 이미 컬럼이 있으므로 건너뜀
+    if 'followers_count' not in columns:
+        op.add_column('user', sa.Column('followers_count', sa.Integer(), server_default='0', nullable=False))
+        added = True
+    if 'following_count' not in columns:
+        op.add_column('user', sa.Column('following_count', sa.Integer(), server_default='0', nullable=False))
+        added = True
+
+    if not added:
+        return
+
+    followers_count = sa.select(sa.func.count()).select_from(followers)\
+        .where(followers.c.followed_id == user.c.id).scalar_subquery()
+    following_count = sa.select(sa.func.count()).select_from(followers)\
+        .where(followers.c.follower_id == user.c.id).scalar_subquery()
+
+    max_id = op.get_bind().execute(sa.select(sa.func.max(user.c.id))).scalar() or 0
+
+    # ID 범위별로 나눠 각각 커밋
+    with op.get_context().autocommit_block():
+        for start in range(0, max_id + 1, BATCH_SIZE):
+            op.execute(
+                user.update()
+                    .where(user.c.id >= start, user.c.id < start + BATCH_SIZE)
+                    .values(followers_count=followers_count, following_count=following_count)
+            )
+
+
+def downgrade():
+    columns = _user_columns()
+
+    with op.batch_alter_table('user') as batch_op:
+        if 'following_count' in columns:
+            batch_op.drop_column('following_count')
+        if 'followers_count' in columns:
+            batch_op.drop_column('followers_count')
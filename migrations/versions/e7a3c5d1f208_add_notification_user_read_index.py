@@ -0,0 +1,31 @@
+"""notification (user_id, is_read) 복합 인덱스 추가
+
+Revision ID: e7a3c5d1f208
+Revises: d2f6b8c0e519
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a3c5d1f208'
+down_revision = 'd2f6b8c0e519'
+branch_labels = None
+depends_on = None
+
+
+def _index_names(table):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade():
+    # create_all()로 생성된 DB에는 이미 인덱스가 있으므로 건너뜀
+    if 'ix_notification_user_read' not in _index_names('notification'):
+        op.create_index('ix_notification_user_read', 'notification', ['user_id', 'is_read'], unique=False)
+
+
+def downgrade():
+    if 'ix_notification_user_read' in _index_names('notification'):
+        op.drop_index('ix_notification_user_read', table_name='notification')
@@ -0,0 +1,28 @@
+import copy
+
+from benchmarks.api_benchmark import run_benchmark, compare_results
+
+
+def test_benchmark_runs_all_scenarios_without_errors():
+    result = run_benchmark(iterations=40, warmup=2, scale=0.1)
+
+    assert result['total']['errors'] == 0
+    assert result['total']['requests'] > 40
+    for label in ('GET /api/todos?from&to', 'GET /api/explore/todos', 'POST /api/todos'):
+        stats = result['endpoints'][label]
+        assert stats['p50_ms'] <= stats['p95_ms'] <= stats['p99_ms']
+
+    # 자기 자신과 비교하면 회귀 없음, 지연이 늘면 회귀
+    assert compare_results(result, result) == []
+    slower = copy.deepcopy(result)
+    slower['endpoints']['POST /api/todos']['p95_ms'] = result['endpoints']['POST /api/todos']['p95_ms'] * 2 + 5
+    assert len(compare_results(result, slower)) == 1
+
+
+def test_serialization_benchmark_paths_produce_identical_output():
+    from benchmarks.serialization_benchmark import run_benchmark as run_serialization_benchmark
+
+    result = run_serialization_benchmark(rows=50, repeat=2)
+    for name, case in result['cases'].items():
+        assert case['identical'], name
+        assert case['orm_ms'] > 0 and case['columnar_ms'] > 0
@@ -0,0 +1,291 @@
+import datetime
+import re
+
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import User, Todo, Category
+from app import versions
+from app.timeline import rebuild_timeline
+from app.follows import reconcile_follow_counts
+from app.recommendations import refresh_stale_recommendations, refresh_all_recommendations
+from conftest import login, create_user, create_test_app
+
+
+def seed_feed(app, followed_count, todos_per_user=3):
+    """팔로우 관계와 공개 할 일 생성 후 팔로워 ID 반환"""
+    with app.app_context():
+        viewer = User(username='viewer', email='viewer@example.com', nickname='뷰어')
+        viewer.set_password('password')
+        db.session.add(viewer)
+        db.session.flush()
+
+        base = datetime.datetime(2026, 1, 1)
+        for i in range(followed_count):
+            author = User(username=f'author{i}', email=f'author{i}@example.com')
+            author.password_hash = 'x'
+            db.session.add(author)
+            db.session.flush()
+            category = Category(name=f'카테고리{i}', color='#123456', user_id=author.id)
+            db.session.add(category)
+            db.session.flush()
+            viewer.followed.append(author)
+
+            for j in range(todos_per_user):
+                db.session.add(Todo(
+                    title=f'할 일 {i}-{j}',
+                    date=base,
+                    is_public=True,
+                    user_id=author.id,
+                    category_id=category.id if j % 2 == 0 else None,
+                    created_at=base + datetime.timedelta(minutes=i * todos_per_user + j)
+                ))
+
+        db.session.commit()
+        rebuild_timeline()
+        return viewer.id
+
+
+def count_queries(app, func):
+    """func 실행 중 실행된 SQL 문 수"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        func()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return len(statements)
+
+
+def fetch_feed(app, followed_count):
+    viewer_id = seed_feed(app, followed_count)
+    client = app.test_client()
+    login(client, viewer_id)
+
+    responses = []
+    query_count = count_queries(app, lambda: responses.append(client.get('/api/explore/todos?limit=100')))
+    return responses[0], query_count
+
+
+def test_explore_todos_query_count_is_constant():
+    small_response, small_count = fetch_feed(create_test_app(), 2)
+    large_response, large_count = fetch_feed(create_test_app(), 30)
+
+    assert len(small_response.get_json()) == 6
+    assert len(large_response.get_json()) == 90
+    assert small_count == large_count
+
+
+def test_explore_todos_cursor_pagination(app):
+    viewer_id = seed_feed(app, 4)
+    client = app.test_client()
+    login(client, viewer_id)
+
+    seen = []
+    cursor = None
+    while True:
+        query = {'limit': 5}
+        if cursor:
+            query['before'] = cursor
+        response = client.get('/api/explore/todos', query_string=query)
+        page = response.get_json()
+        assert len(page) <= 5
+        seen.extend(todo['id'] for todo in page)
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+
+    assert len(seen) == 12
+    assert len(set(seen)) == 12
+
+    # 응답 형태는 explore.js가 기대하는 구조 유지
+    first = client.get('/api/explore/todos?limit=1').get_json()[0]
+    assert set(first) == {'id', 'title', 'description', 'date', 'completed', 'category',
+                          'category_color', 'created_at', 'user'}
+    assert set(first['user']) == {'id', 'username', 'nickname', 'profile_image'}
+    assert first['title'] == '할 일 3-2'
+
+
+def test_timeline_follows_todo_and_follow_changes(app):
+    with app.app_context():
+        viewer_id = create_user('viewer')
+        author_id = create_user('author')
+
+    viewer = app.test_client()
+    login(viewer, viewer_id)
+    author = app.test_client()
+    login(author, author_id)
+
+    # 팔로우 이전 공개 할 일은 팔로우 시 채워짐
+    old_id = author.post('/api/todos', json={'title': '이전 할 일', 'date': '2026-01-01', 'is_public': True}).get_json()['id']
+    author.post('/api/todos', json={'title': '비공개', 'date': '2026-01-01'})
+    viewer.post(f'/api/users/{author_id}/follow')
+    assert [todo['id'] for todo in viewer.get('/api/explore/todos').get_json()] == [old_id]
+
+    # 새 공개 할 일은 fan-out, 비공개 전환/삭제 시 제거
+    new_id = author.post('/api/todos', json={'title': '새 할 일', 'date': '2026-01-02', 'is_public': True}).get_json()['id']
+    assert [todo['id'] for todo in viewer.get('/api/explore/todos').get_json()] == [new_id, old_id]
+    author.put(f'/api/todos/{new_id}', json={'is_public': False})
+    author.delete(f'/api/todos/{old_id}')
+    assert viewer.get('/api/explore/todos').get_json() == []
+
+    author.put(f'/api/todos/{new_id}', json={'is_public': True})
+    assert [todo['id'] for todo in viewer.get('/api/explore/todos').get_json()] == [new_id]
+
+    # 언팔로우 시 타임라인 정리
+    viewer.post(f'/api/users/{author_id}/unfollow')
+    assert viewer.get('/api/explore/todos').get_json() == []
+
+
+def test_timeline_merges_fanout_disabled_authors(app):
+    app.config['TIMELINE_FANOUT_MAX_FOLLOWERS'] = 1
+    with app.app_context():
+        viewer_id = create_user('viewer')
+        author_id = create_user('author')
+
+    viewer = app.test_client()
+    login(viewer, viewer_id)
+    author = app.test_client()
+    login(author, author_id)
+
+    before_id = author.post('/api/todos', json={'title': '이전', 'date': '2026-01-01', 'is_public': True}).get_json()['id']
+    viewer.post(f'/api/users/{author_id}/follow')
+    after_id = author.post('/api/todos', json={'title': '이후', 'date': '2026-01-01', 'is_public': True}).get_json()['id']
+
+    with app.app_context():
+        assert User.query.get(author_id).fanout_disabled
+    assert [todo['id'] for todo in viewer.get('/api/explore/todos').get_json()] == [after_id, before_id]
+
+
+def test_follow_counts_are_maintained_and_reconciled(app):
+    with app.app_context():
+        viewer_id = create_user('viewer')
+        author_id = create_user('author')
+
+    viewer = app.test_client()
+    login(viewer, viewer_id)
+    author = app.test_client()
+    login(author, author_id)
+
+    viewer.post(f'/api/users/{author_id}/follow')
+    viewer.post(f'/api/users/{author_id}/follow')
+    author.post(f'/api/users/{viewer_id}/follow')
+    profile = author.get('/api/user/profile').get_json()
+    assert (profile['followers_count'], profile['following_count']) == (1, 1)
+
+    viewer.post(f'/api/users/{author_id}/unfollow')
+    profile = viewer.get('/api/user/profile').get_json()
+    assert (profile['followers_count'], profile['following_count']) == (1, 0)
+
+    with app.app_context():
+        db.session.execute(User.__table__.update().values(followers_count=7, following_count=7))
+        db.session.commit()
+        assert reconcile_follow_counts(batch_size=1) == User.query.count()
+        assert reconcile_follow_counts() == 0
+        counts = {user.id: (user.followers_count, user.following_count) for user in User.query}
+    assert counts[viewer_id] == (1, 0)
+    assert counts[author_id] == (0, 1)
+
+
+def test_recommendations_score_friends_of_friends(app):
+    with app.app_context():
+        ids = {name: create_user(name) for name in ('viewer', 'a', 'b', 'c', 'd', 'e')}
+    clients = {}
+    for name, user_id in ids.items():
+        clients[name] = app.test_client()
+        login(clients[name], user_id)
+
+    def recommended():
+        users = clients['viewer'].get('/api/explore/users').get_json()['recommended']
+        return [(user['username'], user['mutual_count']) for user in users]
+
+    # 계산 전에는 팔로우하지 않은 사용자로 대체
+    for follower, followed in [('viewer', 'a'), ('viewer', 'b'), ('a', 'c'), ('a', 'd'), ('b', 'c'), ('a', 'viewer')]:
+        clients[follower].post(f'/api/users/{ids[followed]}/follow')
+    assert recommended() == [('c', 0), ('d', 0), ('e', 0)]
+
+    # 함께 아는 사용자 수 순 (자신과 이미 팔로우한 사용자 제외)
+    with app.app_context():
+        assert refresh_stale_recommendations(batch_size=2) == 3
+        assert refresh_stale_recommendations() == 0
+    assert recommended() == [('c', 2), ('d', 1)]
+
+    # 최근 공개 활동이 많은 후보가 앞으로
+    for i in range(10):
+        clients['d'].post('/api/todos', json={'title': f'공개 {i}', 'date': '2026-01-01', 'is_public': True})
+    with app.app_context():
+        refresh_all_recommendations()
+    assert recommended() == [('d', 1), ('c', 2)]
+
+    # 팔로우하면 바로 제외되고, 팔로우한 사용자와 그 팔로워가 갱신 대상이 됨
+    clients['viewer'].post(f'/api/users/{ids["d"]}/follow')
+    assert recommended() == [('c', 2)]
+    with app.app_context():
+        stale = {user.username for user in User.query.filter(User.recommendations_stale_at != None)}
+    assert stale == {'viewer', 'a'}
+
+
+def user_statements(app, func):
+    """func 실행 중 user 테이블을 조회한 SQL 문"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT') and re.search(r'FROM user\b', statement):
+            statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        func()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return statements
+
+
+def test_authenticated_requests_reuse_cached_user(app):
+    with app.app_context():
+        viewer_id = create_user('viewer')
+    client = app.test_client()
+    login(client, viewer_id)
+
+    assert len(user_statements(app, lambda: client.get('/api/explore/todos'))) == 1
+    assert user_statements(app, lambda: client.get('/api/explore/todos')) == []
+    # 요청 사용자 확인은 캐시를 쓰고, 프로필 본문은 버전과 함께 한 번 조회
+    statements = user_statements(app, lambda: client.get('/api/user/profile'))
+    assert len(statements) == 1 and 'user_data_version' in statements[0]
+
+    # 프로필 수정 후에는 다시 조회해 변경 내용 반영
+    client.put('/api/user/profile', json={'nickname': '새 닉네임'})
+    profile = client.get('/api/user/profile').get_json()
+    assert profile['nickname'] == '새 닉네임'
+
+
+def test_profile_etag_never_pins_cached_counts(app):
+    with app.app_context():
+        viewer_id = create_user('viewer')
+    client = app.test_client()
+    login(client, viewer_id)
+
+    response = client.get('/api/user/profile')
+    assert response.get_json()['followers_count'] == 0
+
+    # 다른 워커에서 팔로우됨 (이 워커의 사용자 캐시는 무효화되지 않음)
+    with app.app_context():
+        table = User.__table__
+        db.session.execute(table.update().where(table.c.id == viewer_id)
+                                .values(followers_count=table.c.followers_count + 1))
+        versions.bump(viewer_id, versions.SCOPE_PROFILE)
+        db.session.commit()
+
+    response = client.get('/api/user/profile', headers={'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 200
+    assert response.get_json()['followers_count'] == 1
+    response = client.get('/api/user/profile', headers={'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
@@ -0,0 +1,102 @@
+import json
+
+from sqlalchemy.pool import QueuePool
+
+from app.metrics import MetricsRegistry
+from config import TestingConfig
+from conftest import login, create_user, create_test_app
+
+
+def test_health_and_ready(app):
+    client = app.test_client()
+    assert client.get('/health').get_json() == {'status': 'ok'}
+    assert client.get('/ready').get_json() == {'status': 'ok'}
+
+
+def test_metrics_report_route_latency_and_sql(app):
+    with app.app_context():
+        user_id = create_user('owner')
+    client = app.test_client()
+    login(client, user_id)
+    client.get('/api/todos')
+    client.get('/api/todos')
+    client.get('/missing')
+
+    response = client.get('/metrics')
+    assert response.mimetype == 'text/plain'
+    body = response.get_data(as_text=True)
+
+    labels = 'method="GET",route="/api/todos",status="200"'
+    assert f'app_http_request_duration_seconds_count{{{labels}}} 2' in body
+    assert f'app_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in body
+    assert 'app_http_request_duration_seconds_count{method="GET",route="unmatched",status="404"} 1' in body
+    assert 'app_request_sql_statements_count{route="/api/todos"} 2' in body
+
+    sql_total = next(line for line in body.splitlines()
+                     if line.startswith('app_sql_statements_total{route="/api/todos"}'))
+    assert int(sql_total.split()[-1]) > 0
+
+
+def test_metrics_merge_worker_files(tmp_path, monkeypatch):
+    # 다른 워커가 같은 디렉터리에 기록한 지표 파일
+    registry = MetricsRegistry()
+    registry.observe('app_http_request_duration_seconds', 0.02, ('GET', '/health', '200'))
+    registry.inc('app_sql_statements_total', 3, ('/health',))
+    (tmp_path / 'metrics_1.json').write_text(json.dumps(registry.snapshot()))
+
+    monkeypatch.setattr(TestingConfig, 'METRICS_MULTIPROC_DIR', str(tmp_path))
+    app = create_test_app()
+    client = app.test_client()
+    client.get('/health')
+
+    body = client.get('/metrics').get_data(as_text=True)
+    labels = 'method="GET",route="/health",status="200"'
+    assert f'app_http_request_duration_seconds_count{{{labels}}} 2' in body
+    assert 'app_sql_statements_total{route="/health"} 3' in body
+    assert len(list(tmp_path.glob('metrics_*.json'))) == 2
+
+
+def test_profile_on_header_and_slow_requests(app, tmp_path):
+    app.config.update(PROFILING_TOKEN='secret', PROFILING_DIR=str(tmp_path), PROFILING_MAX_FILES=2)
+    with app.app_context():
+        user_id = create_user('owner')
+    client = app.test_client()
+    login(client, user_id)
+
+    # 헤더 없이는 기록하지 않음, 목록 조회도 불가
+    assert 'X-Profile-Id' not in client.get('/api/todos').headers
+    assert client.get('/debug/profiles').status_code == 404
+
+    response = client.get('/api/todos', headers={'X-Profile': 'secret'})
+    profile_id = response.headers['X-Profile-Id']
+    record = client.get(f'/debug/profiles/{profile_id}', headers={'X-Profile': 'secret'}).get_json()
+    assert record['trigger'] == 'header'
+    assert record['path'] == '/api/todos'
+    assert record['sql_count'] == len(record['sql']) > 0
+    assert 'cumulative' in record['profile']
+
+    # 임계값을 넘은 요청은 자동 기록, 보관 개수를 넘으면 오래된 것부터 삭제
+    app.config['PROFILING_SLOW_THRESHOLD_MS'] = 0.001
+    client.get('/api/topics')
+    client.get('/health')
+    profiles = client.get('/debug/profiles', headers={'X-Profile': 'secret'}).get_json()
+    assert [profile['path'] for profile in profiles] == ['/health', '/api/topics']
+    assert {profile['trigger'] for profile in profiles} == {'slow'}
+    assert len(list(tmp_path.glob('*.json'))) == 2
+
+
+def test_metrics_report_connection_pool(tmp_path, monkeypatch):
+    # SQLite 파일 DB에 QueuePool을 지정해 운영(MySQL)과 같은 크기 제한 풀로 구성
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f'sqlite:///{tmp_path}/pool.db')
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_ENGINE_OPTIONS',
+                        {'poolclass': QueuePool, 'pool_size': 3, 'max_overflow': 2})
+    app = create_test_app()
+    client = app.test_client()
+    client.get('/ready')
+
+    body = client.get('/metrics').get_data(as_text=True)
+    assert 'app_db_pool_size{bind="default"} 3' in body
+    assert 'app_db_pool_max_overflow{bind="default"} 2' in body
+    assert 'app_db_pool_checked_out{bind="default"} 0' in body
+    assert 'app_db_pool_idle{bind="default"} 1' in body
+    assert '# TYPE app_db_pool_size gauge' in body
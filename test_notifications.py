@@ -0,0 +1,264 @@
+import os
+import json
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db, notification_broker, notification_dispatcher
+from app.models import Notification
+from app.utils import create_notification
+from config import TestingConfig
+from conftest import login, create_user, create_test_app
+
+
+def read_events(body):
+    """SSE 응답 본문에서 알림 이벤트 목록 추출"""
+    events = []
+    for block in body.decode('utf-8').split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.split('\n') if line and not line.startswith(':'))
+        if fields.get('event') == 'notification':
+            events.append((int(fields['id']), json.loads(fields['data'])))
+    return events
+
+
+def test_stream_resumes_from_last_event_id(app):
+    app.config['NOTIFICATION_STREAM_MAX_DURATION'] = 0.2
+    app.config['NOTIFICATION_STREAM_KEEPALIVE'] = 0.05
+    with app.app_context():
+        user_id = create_user('receiver')
+        sender_id = create_user('sender')
+        first = create_notification(user_id, '첫 번째', 'follow', sender_id).id
+        second = create_notification(user_id, '두 번째', 'follow', sender_id).id
+
+    client = app.test_client()
+    login(client, user_id)
+
+    response = client.get('/api/notifications/stream', headers={'Last-Event-ID': str(first)})
+    assert response.mimetype == 'text/event-stream'
+    events = read_events(response.data)
+    assert [event_id for event_id, _ in events] == [second]
+    assert events[0][1]['message'] == '두 번째'
+    assert events[0][1]['sender']['id'] == sender_id
+
+    # 스트림 종료 후 구독 해제
+    assert not notification_broker.has_subscribers(user_id)
+
+
+def test_stream_is_refused_when_worker_stream_limit_is_reached(app, monkeypatch):
+    app.config['NOTIFICATION_STREAM_MAX_DURATION'] = 0.05
+    monkeypatch.setattr(notification_broker, 'max_connections', 1)
+    with app.app_context():
+        user_id = create_user('receiver')
+    client = app.test_client()
+    login(client, user_id)
+
+    # 다른 탭의 스트림이 한도를 차지하고 있으면 요청 스레드를 쓰지 않도록 바로 503
+    held = notification_broker.subscribe(user_id)
+    try:
+        response = client.get('/api/notifications/stream')
+        assert response.status_code == 503
+        assert 'Retry-After' in response.headers
+    finally:
+        notification_broker.unsubscribe(held)
+
+    response = client.get('/api/notifications/stream')
+    assert response.mimetype == 'text/event-stream'
+    response.get_data()
+    assert not notification_broker.has_subscribers(user_id)
+
+
+def test_create_notification_publishes_to_subscribers(app):
+    with app.app_context():
+        user_id = create_user('receiver')
+        subscription = notification_broker.subscribe(user_id)
+        try:
+            notification = create_notification(user_id, '새 알림', 'follow')
+            event = subscription.get(timeout=1)
+        finally:
+            notification_broker.unsubscribe(subscription)
+
+        assert event['id'] == notification.id
+        assert event['data'] == Notification.query.get(notification.id).to_dict()
+
+
+@pytest.fixture
+def write_behind_app(tmp_path, monkeypatch):
+    """알림 지연 기록을 켠 앱 (기록 스레드가 별도 연결을 쓰도록 SQLite 파일 사용)"""
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f'sqlite:///{tmp_path}/app.db')
+    monkeypatch.setattr(TestingConfig, 'NOTIFICATION_WRITE_BEHIND', True)
+    monkeypatch.setattr(TestingConfig, 'NOTIFICATION_FLUSH_INTERVAL', 0.05)
+    monkeypatch.setattr(TestingConfig, 'NOTIFICATION_SPILL_DIR', str(tmp_path / 'spill'))
+    app = create_test_app()
+    yield app
+    notification_dispatcher.stop()
+    with app.app_context():
+        db.session.remove()
+        db.get_engine(app).dispose()
+
+
+def test_follow_commits_once_and_notification_is_written_later(write_behind_app):
+    app = write_behind_app
+    with app.app_context():
+        follower_id = create_user('follower')
+        followed_id = create_user('followed')
+        engine = db.engine
+    client = app.test_client()
+    login(client, follower_id)
+
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.post(f'/api/users/{followed_id}/follow')
+        request_inserts = [s for s in statements if s.startswith('INSERT INTO notification')]
+        assert notification_dispatcher.flush(timeout=5)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    assert response.get_json() == {'result': 'success'}
+    assert request_inserts == []
+    with app.app_context():
+        notification = Notification.query.filter_by(user_id=followed_id).one()
+        assert notification.sender_id == follower_id
+        assert notification.type == 'follow'
+
+
+def test_dispatcher_writes_batch_in_one_insert(write_behind_app):
+    app = write_behind_app
+    with app.app_context():
+        user_id = create_user('receiver')
+        engine = db.engine
+
+    # 5개가 모일 때까지 기다렸다가 기록
+    notification_dispatcher.batch_size = 5
+    notification_dispatcher.flush_interval = 5
+
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        for i in range(5):
+            assert notification_dispatcher.notify(user_id, f'알림 {i}', 'follow')
+        assert notification_dispatcher.flush(timeout=5)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    inserts = [s for s in statements if s.startswith('INSERT INTO notification')]
+    assert len(inserts) == 1
+    with app.app_context():
+        assert [n.message for n in Notification.query.order_by(Notification.id)] == [f'알림 {i}' for i in range(5)]
+    # 모두 기록되면 spill 파일을 비움
+    spill_dir = app.config['NOTIFICATION_SPILL_DIR']
+    assert [os.path.getsize(os.path.join(spill_dir, name)) for name in os.listdir(spill_dir)] == [0]
+
+
+def test_dispatcher_recovers_spill_file_of_dead_process(write_behind_app):
+    app = write_behind_app
+    with app.app_context():
+        user_id = create_user('receiver')
+
+    # 종료된 프로세스가 남긴 spill 파일: 1번은 기록 완료, 2~3번은 미기록, 마지막 줄은 쓰다 만 상태
+    dead = subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'],
+                          capture_output=True, text=True, check=True)
+    spill_dir = app.config['NOTIFICATION_SPILL_DIR']
+    os.makedirs(spill_dir, exist_ok=True)
+    lines = [{'seq': seq, 'user_id': user_id, 'message': f'남은 알림 {seq}', 'type': 'follow',
+              'sender_id': None, 'created_at': '2026-01-01T00:00:00'} for seq in (1, 2, 3)]
+    lines.insert(1, {'flushed': 1})
+    with open(os.path.join(spill_dir, f'notifications-{dead.stdout.strip()}.jsonl'), 'w') as f:
+        f.write(''.join(json.dumps(line) + '\n' for line in lines) + '{"seq": 4, "user_')
+
+    assert notification_dispatcher.notify(user_id, '새 알림', 'follow')
+    assert notification_dispatcher.flush(timeout=5)
+    notification_dispatcher.stop()
+
+    with app.app_context():
+        messages = sorted(n.message for n in Notification.query.filter_by(user_id=user_id))
+    assert messages == ['남은 알림 2', '남은 알림 3', '새 알림']
+    assert sorted(os.listdir(spill_dir)) == [f'notifications-{os.getpid()}.jsonl']
+
+
+def test_mark_read_by_ids_up_to_and_all(app):
+    with app.app_context():
+        user_id = create_user('receiver')
+        other_id = create_user('other')
+        ids = [create_notification(user_id, f'알림 {i}', 'follow').id for i in range(5)]
+        other_notification_id = create_notification(other_id, '다른 사용자 알림', 'follow').id
+    client = app.test_client()
+    login(client, user_id)
+
+    def unread_count():
+        return client.get('/api/notifications/unread-count').get_json()['count']
+
+    assert unread_count() == 5
+
+    # 다른 사용자의 알림 ID는 무시
+    response = client.post('/api/notifications/read', json={'ids': [ids[0], other_notification_id]})
+    assert response.get_json() == {'success': True, 'updated': 1}
+    assert client.post(f'/api/notifications/{ids[1]}/read').get_json()['updated'] == 1
+    assert client.post(f'/api/notifications/{ids[1]}/read').get_json()['updated'] == 0
+    assert unread_count() == 3
+
+    assert client.post('/api/notifications/read', json={'up_to': ids[3]}).get_json()['updated'] == 2
+    assert unread_count() == 1
+
+    assert client.post('/api/notifications/read').get_json()['updated'] == 1
+    assert unread_count() == 0
+    assert all(notification['is_read'] for notification in client.get('/api/notifications').get_json())
+
+    with app.app_context():
+        assert Notification.query.get(other_notification_id).is_read is False
+
+    assert client.post('/api/notifications/read', json={'ids': ['1']}).status_code == 400
+    assert client.post('/api/notifications/read', json={'up_to': 'x'}).status_code == 400
+
+
+def test_unread_count_uses_etag(app):
+    with app.app_context():
+        user_id = create_user('receiver')
+        create_notification(user_id, '알림', 'follow')
+    client = app.test_client()
+    login(client, user_id)
+
+    response = client.get('/api/notifications/unread-count')
+    etag = response.headers['ETag']
+    assert client.get('/api/notifications/unread-count', headers={'If-None-Match': etag}).status_code == 304
+
+    client.post('/api/notifications/read')
+    response = client.get('/api/notifications/unread-count', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json() == {'count': 0}
+
+
+def test_notifications_are_paginated_by_cursor(app):
+    with app.app_context():
+        user_id = create_user('receiver')
+        sender_id = create_user('sender')
+        ids = [create_notification(user_id, f'알림 {i}', 'follow', sender_id).id for i in range(5)]
+        # 같은 시각의 알림은 id로 순서를 정함
+        Notification.query.filter(Notification.id.in_(ids[1:4])).update(
+            {'created_at': Notification.query.get(ids[1]).created_at}, synchronize_session=False)
+        Notification.query.get(ids[2]).is_read = True
+        db.session.commit()
+    client = app.test_client()
+    login(client, user_id)
+
+    seen, cursor = [], None
+    while True:
+        query_string = {'limit': 2, 'before': cursor} if cursor else {'limit': 2}
+        response = client.get('/api/notifications', query_string=query_string)
+        seen.extend(notification['id'] for notification in response.get_json())
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+    assert seen == list(reversed(ids))
+    assert response.get_json()[0]['sender'] == {'id': sender_id, 'username': 'sender', 'nickname': None,
+                                                'profile_image': 'default.jpg'}
+
+    response = client.get('/api/notifications', query_string={'unread_only': 'true'})
+    assert [notification['id'] for notification in response.get_json()] == [ids[4], ids[3], ids[1], ids[0]]
+    assert client.get('/api/notifications', query_string={'before': 'x'}).status_code == 400
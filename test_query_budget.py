@@ -0,0 +1,142 @@
+import re
+import datetime
+from collections import Counter
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import User, Todo, Category, Notification, followers
+from app.timeline import rebuild_timeline
+from app.stats import rebuild as rebuild_todo_stats
+from app.follows import reconcile_follow_counts
+from app.recommendations import refresh_all_recommendations
+from conftest import login
+
+# 엔드포인트별 SQL 문 수 상한
+# 데이터 규모(SIZES)와 관계없이 같은 상한을 지켜야 함 (결과 수에 비례하는 조회 = N+1)
+BUDGETS = [
+    ('GET', '/api/todos', None, 2),
+    ('GET', '/api/topics', None, 2),
+    ('GET', '/api/user/profile', None, 1),
+    ('GET', '/api/user/todos/stats', None, 1),
+    ('GET', '/api/sync', None, 2),
+    ('GET', '/api/explore/todos', None, 2),
+    ('GET', '/api/explore/users', None, 2),
+    ('GET', '/api/notifications', None, 2),
+    ('GET', '/api/notifications/unread-count', None, 2),
+    ('POST', '/api/notifications/read', 'ids', 2),
+    ('GET', '/social/api/notifications', None, 1),
+    ('POST', '/social/api/notifications/read', 'notification_ids', 2),
+]
+
+SIZES = [1, 10, 40]
+
+
+def fingerprint(statement):
+    """리터럴과 IN 목록을 정규화한 SQL 문"""
+    statement = re.sub(r'\s+', ' ', statement).strip()
+    statement = re.sub(r"'(?:[^']|'')*'", '?', statement)
+    statement = re.sub(r'\b\d+(\.\d+)?\b', '?', statement)
+    statement = re.sub(r'\(\s*\?(\s*,\s*\?)*\s*\)', '(...)', statement)
+    statement = re.sub(r'\(\s*\[POSTCOMPILE_\w+\]\s*\)', '(...)', statement)
+    return statement
+
+
+class StatementRecorder:
+    """요청 중 실행된 SQL 문 기록"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def report(self):
+        """중복 실행된 문(지문 기준)을 많은 순으로"""
+        counts = Counter(fingerprint(statement) for statement in self.statements)
+        lines = [f'{count}x {statement}' for statement, count in counts.most_common() if count > 1]
+        return '\n'.join(lines) or '(중복 없음)'
+
+
+def seed(app, size):
+    """요청 사용자와 size개씩의 할 일/카테고리/팔로우/알림 생성 후 사용자 ID와 알림 ID 반환"""
+    base = datetime.datetime(2026, 1, 1)
+    with app.app_context():
+        viewer = User(username='viewer', email='viewer@example.com', password_hash='x')
+        # 작성자들이 팔로우하는 사용자 (요청 사용자의 추천 후보)
+        popular = User(username='popular', email='popular@example.com', password_hash='x')
+        db.session.add_all([viewer, popular])
+        db.session.flush()
+
+        for i in range(size):
+            # 작성자마다 다른 사용자로 만들어야 관계 조회가 식별자 맵에 가려지지 않음
+            author = User(username=f'author{i}', email=f'author{i}@example.com', password_hash='x')
+            db.session.add(author)
+            db.session.flush()
+            db.session.execute(followers.insert().values(follower_id=viewer.id, followed_id=author.id))
+            db.session.execute(followers.insert().values(follower_id=author.id, followed_id=popular.id))
+
+            category = Category(name=f'카테고리{i}', user_id=viewer.id)
+            author_category = Category(name=f'작성자 카테고리{i}', user_id=author.id)
+            db.session.add_all([category, author_category])
+            db.session.flush()
+
+            db.session.add_all([
+                Todo(title=f'할 일 {i}', date=base, user_id=viewer.id, category_id=category.id,
+                     completed=i % 2 == 0),
+                Todo(title=f'공개 할 일 {i}', date=base, user_id=author.id, is_public=True,
+                     category_id=author_category.id, created_at=base + datetime.timedelta(minutes=i)),
+                Notification(message=f'알림 {i}', type='follow', user_id=viewer.id, sender_id=author.id),
+            ])
+
+        db.session.commit()
+        rebuild_timeline()
+        rebuild_todo_stats()
+        reconcile_follow_counts()
+        refresh_all_recommendations()
+
+        notification_ids = [notification_id for notification_id, in
+                            db.session.query(Notification.id).filter_by(user_id=viewer.id)]
+        return viewer.id, notification_ids
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_endpoint_query_budgets(app, size):
+    viewer_id, notification_ids = seed(app, size)
+    client = app.test_client()
+    login(client, viewer_id)
+    with app.app_context():
+        engine = db.engine
+
+    # 로그인 사용자 캐시를 채운 상태에서 측정
+    client.get('/health')
+
+    failures = []
+    for method, url, payload, budget in BUDGETS:
+        json_body = {payload: notification_ids} if payload in ('ids', 'notification_ids') else None
+        with StatementRecorder(engine) as recorder:
+            response = client.open(url, method=method, json=json_body)
+
+        assert response.status_code < 400, f'{method} {url} -> {response.status_code}'
+        if len(recorder.statements) > budget:
+            failures.append(f'{method} {url}: SQL {len(recorder.statements)}개 (상한 {budget})\n'
+                            f'{recorder.report()}')
+
+    assert not failures, f'데이터 {size}개에서 쿼리 상한 초과\n\n' + '\n\n'.join(failures)
+
+
+def test_fingerprint_groups_statements_that_differ_only_in_literals():
+    first = fingerprint("SELECT * FROM user WHERE user.id = 1 AND name = 'a'")
+    second = fingerprint("SELECT *\n  FROM user WHERE user.id = 22 AND name = 'b''c'")
+    assert first == second
+    assert fingerprint('SELECT * FROM todo WHERE id IN (?, ?, ?)') == \
+        fingerprint('SELECT * FROM todo WHERE id IN (?)')
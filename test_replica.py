@@ -0,0 +1,67 @@
+import datetime
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models import User, Todo
+from config import TestingConfig
+from conftest import login
+
+
+@pytest.fixture
+def replica_app(tmp_path, monkeypatch):
+    """primary와 replica를 서로 다른 SQLite 파일로 구성한 앱"""
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f'sqlite:///{tmp_path}/primary.db')
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_BINDS', {'replica': f'sqlite:///{tmp_path}/replica.db'})
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        db.Model.metadata.create_all(db.get_engine(app, 'replica'))
+    yield app
+    with app.app_context():
+        db.session.remove()
+        for bind in (None, 'replica'):
+            db.get_engine(app, bind).dispose()
+
+
+def seed(app, bind, title):
+    """같은 사용자와 DB마다 다른 제목의 할 일 생성 (복제 지연으로 내용이 다른 상황)"""
+    engine = db.get_engine(app, bind)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert().values(id=1, username='owner', email='owner@example.com',
+                                                   password_hash='x'))
+        conn.execute(Todo.__table__.insert().values(title=title, date=datetime.datetime(2026, 1, 1), user_id=1))
+
+
+def titles(client):
+    return [todo['title'] for todo in client.get('/api/todos').get_json()]
+
+
+def test_reads_use_replica_until_client_writes(replica_app):
+    with replica_app.app_context():
+        seed(replica_app, None, 'primary')
+        seed(replica_app, 'replica', 'replica')
+    client = replica_app.test_client()
+    login(client, 1)
+
+    assert titles(client) == ['replica']
+
+    # 쓰기는 primary로, 이후 잠시 동안 이 클라이언트의 조회도 primary에서
+    response = client.post('/api/todos', json={'title': '새 할 일', 'date': '2026-01-02'})
+    assert response.status_code == 201
+    assert titles(client) == ['primary', '새 할 일']
+
+    with replica_app.app_context():
+        with db.get_engine(replica_app, 'replica').connect() as conn:
+            assert [row.title for row in conn.execute(Todo.__table__.select())] == ['replica']
+
+    # 다른 클라이언트는 계속 복제본에서 읽음
+    other = replica_app.test_client()
+    login(other, 1)
+    assert titles(other) == ['replica']
+
+    # 쓰기 후 유지 시간이 지나면 다시 복제본
+    replica_app.config['DB_REPLICA_READ_AFTER_WRITE_SECONDS'] = 0
+    client.post('/api/todos', json={'title': '또 다른 할 일', 'date': '2026-01-03'})
+    assert titles(client) == ['replica']
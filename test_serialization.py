@@ -0,0 +1,128 @@
+import datetime
+import tracemalloc
+
+import pytest
+from flask import jsonify
+
+from app import serializers
+from app.extensions import db
+from app.models import Todo, Category, Notification
+from conftest import login, create_user
+
+TEXTS = ['운동하기', 'emoji 😀 and "quotes" \\ slash /', 'control \x00\x1f\t\n\x7f', '']
+
+
+def seed(app):
+    """여러 문자와 NULL 값을 포함한 할 일, 카테고리, 알림 생성 후 사용자 ID 반환"""
+    with app.app_context():
+        user_id = create_user('owner')
+        sender_id = create_user('보낸사람')
+        category = Category(name='건강 💪', color='#00aa00', user_id=user_id)
+        db.session.add(category)
+        db.session.flush()
+
+        base = datetime.datetime(2026, 1, 1, 9, 30, 15, 123456)
+        for i, text in enumerate(TEXTS):
+            db.session.add(Todo(title=f'할 일 {text}', description=text if i % 2 else None,
+                                date=base + datetime.timedelta(days=i), completed=i % 2 == 0,
+                                pinned=i == 1, is_public=i == 2, user_id=user_id,
+                                category_id=category.id if i % 2 else None,
+                                created_at=base, updated_at=base + datetime.timedelta(seconds=i)))
+            db.session.add(Notification(message=text, type='follow', user_id=user_id,
+                                        sender_id=sender_id if i % 2 else None, is_read=i == 3,
+                                        created_at=base + datetime.timedelta(minutes=i)))
+        db.session.commit()
+        return user_id
+
+
+def expected(app, url, objects):
+    with app.test_request_context(url):
+        return jsonify([obj.to_dict() for obj in objects]).get_data()
+
+
+@pytest.mark.parametrize('fast_encoder', [True, False])
+def test_list_responses_match_to_dict_byte_for_byte(app, fast_encoder):
+    app.config['JSON_FAST_ENCODER'] = fast_encoder
+    user_id = seed(app)
+    client = app.test_client()
+    login(client, user_id)
+
+    with app.app_context():
+        todos = Todo.query.filter_by(user_id=user_id).order_by(Todo.date, Todo.id).all()
+        categories = Category.query.filter_by(user_id=user_id).all()
+        notifications = Notification.query.filter_by(user_id=user_id)\
+                                          .order_by(Notification.created_at.desc(), Notification.id.desc()).all()
+        searched = Todo.query.filter(Todo.user_id == user_id, Todo.title.like('%운동%')).all()
+
+        assert client.get('/api/todos').data == expected(app, '/api/todos', todos)
+        assert client.get('/api/topics').data == expected(app, '/api/topics', categories)
+        assert client.get('/api/notifications').data == expected(app, '/api/notifications', notifications)
+        assert client.get('/social/api/notifications').data == expected(app, '/social/api/notifications', notifications)
+        assert client.get('/api/todos/search?q=운동').data == expected(app, '/api/todos/search', searched)
+
+        with app.test_request_context():
+            fields = ['title', 'date', 'updated_at']
+            partial = jsonify([todo.to_dict(fields) for todo in todos]).get_data()
+        assert client.get('/api/todos?fields=title,date,updated_at').data == partial
+
+
+def test_format_dates_matches_strftime():
+    values = [datetime.datetime(2026, 1, 2, 3, 4, 5, 6), datetime.datetime(2026, 12, 31), None,
+              datetime.datetime(999, 1, 1, 0, 0, 1)]
+    for date_format in ('%Y-%m-%d', '%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S', '%d/%m/%Y'):
+        assert serializers.format_dates(values, date_format) == \
+            [value.strftime(date_format) if value else None for value in values]
+
+
+@pytest.mark.parametrize('as_ascii', [True, False])
+def test_json_response_matches_jsonify(app, as_ascii):
+    pytest.importorskip('orjson')
+    app.config['JSON_AS_ASCII'] = as_ascii
+    samples = [
+        [{'title': 'plain ascii', 'b': None, 'a': [1, True, False]}],
+        [{'title': 'del \x7f and control \x00\x1f\t\n "q" \\'}],
+        [{'title': '운동 😀', 'nested': {'z': 1, 'y': '한글'}}],
+    ]
+    with app.test_request_context():
+        for data in samples:
+            assert serializers.json_response(data).get_data() == jsonify(data).get_data()
+        # ASCII 출력이 아니면 orjson 결과를 그대로 사용
+        assert (serializers.encode(samples[2]) is not None) == (not as_ascii)
+        assert serializers.encode(samples[1]) is not None
+
+
+def test_large_todo_list_is_streamed_in_batches(app):
+    with app.app_context():
+        user_id = create_user('owner')
+        base = datetime.datetime(2026, 1, 1)
+        db.session.execute(Todo.__table__.insert(), [
+            {'title': f'할 일 {i}', 'description': f'설명 {i}' * 5, 'date': base + datetime.timedelta(days=i % 30),
+             'user_id': user_id, 'created_at': base, 'updated_at': base}
+            for i in range(3000)
+        ])
+        db.session.commit()
+    client = app.test_client()
+    login(client, user_id)
+
+    def peak_memory(**config):
+        app.config.update(config)
+        tracemalloc.start()
+        try:
+            response = client.get('/api/todos', buffered=False)
+            body = b''.join(response.response)
+            # 나눠 보내는 응답은 Content-Length 없이 chunked 전송
+            return 'Content-Length' not in response.headers, body, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    buffered, expected_body, buffered_peak = peak_memory(STREAM_RESPONSES=False)
+    streamed, body, streamed_peak = peak_memory(STREAM_RESPONSES=True, STREAM_BATCH_SIZE=100)
+
+    assert not buffered and streamed
+    assert body == expected_body
+    # 묶음 단위로 만들고 보내므로 전체 목록을 한 번에 만드는 것보다 최대 메모리가 훨씬 작음
+    assert streamed_peak < buffered_peak / 3
+
+    # 한 묶음 이하면 나누지 않고 한 번에 응답
+    app.config['STREAM_BATCH_SIZE'] = 5000
+    assert 'Content-Length' in client.get('/api/todos').headers
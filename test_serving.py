@@ -0,0 +1,45 @@
+import os
+import importlib.util
+
+import pytest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_gunicorn_config():
+    spec = importlib.util.spec_from_file_location('gunicorn_conf', os.path.join(ROOT, 'gunicorn.conf.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_worker_count_is_limited_by_database_connections():
+    conf = load_gunicorn_config()
+    assert conf.worker_count(4, 10, 20) == 9
+    # 워커마다 최대 30개 연결, DB 최대 100개 -> 3개
+    assert conf.worker_count(4, 10, 20, db_max_connections=100) == 3
+    assert conf.worker_count(4, 10, 20, db_max_connections=30) == 1
+    # 워커 하나의 연결 풀도 한도를 넘으면 조용히 넘기지 않고 시작 실패
+    with pytest.raises(ValueError):
+        conf.worker_count(4, 10, 20, db_max_connections=10)
+    with pytest.raises(ValueError):
+        conf.check_connection_limit(4, 10, 20, db_max_connections=100)
+
+
+def test_thread_count_follows_pool_size():
+    conf = load_gunicorn_config()
+    assert conf.thread_count(10, 20) == 10
+    assert conf.thread_count(10, 20, requested=16) == 16
+    assert conf.thread_count(10, 20, requested=100) == 30
+    # 알림 스트림용 스레드는 요청 스레드와 별도로 추가
+    assert conf.thread_count(10, 20, stream_threads=50) == 60
+
+
+def test_gunicorn_config_defaults(monkeypatch):
+    for name in ('GUNICORN_WORKERS', 'GUNICORN_THREADS', 'GUNICORN_WORKER_CLASS', 'GUNICORN_PRELOAD'):
+        monkeypatch.delenv(name, raising=False)
+    conf = load_gunicorn_config()
+    assert conf.worker_class == 'gthread'
+    assert conf.preload_app is True
+    assert conf.threads == 10 + conf._app_config().NOTIFICATION_STREAM_MAX_CONNECTIONS
+    assert conf.max_requests > 0 and conf.max_requests_jitter > 0
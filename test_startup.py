@@ -0,0 +1,40 @@
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+
+from app import create_app
+from app.extensions import db
+from app.models import User, Category
+
+
+def test_create_app_does_not_connect_to_database():
+    connections = []
+
+    def on_connect(dbapi_connection, connection_record):
+        connections.append(dbapi_connection)
+
+    event.listen(Pool, 'connect', on_connect)
+    try:
+        # 운영 설정(MySQL)도 DB 없이 생성 가능해야 함
+        create_app('production')
+        create_app('testing')
+    finally:
+        event.remove(Pool, 'connect', on_connect)
+    assert connections == []
+
+
+def test_init_db_command_creates_schema_once():
+    app = create_app('testing')
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=['init-db'])
+    assert result.exit_code == 0, result.output
+    assert '생성되었습니다' in result.output
+    with app.app_context():
+        assert User.query.filter_by(username='default_user').count() == 1
+        assert Category.query.count() == 3
+
+    result = runner.invoke(args=['init-db'])
+    assert result.exit_code == 0, result.output
+    assert '이미 존재합니다' in result.output
+    with app.app_context():
+        db.drop_all()
@@ -0,0 +1,425 @@
+from sqlalchemy import event
+from app.extensions import db
+from app.models import Todo, Category
+from app.stats import rebuild
+from conftest import login, create_user
+
+
+def create_todos(client, count, **fields):
+    return [client.post('/api/todos', json=dict({'title': f'할 일 {i}', 'date': '2026-01-01'}, **fields)).get_json()['id']
+            for i in range(count)]
+
+
+def test_batch_applies_operations_in_one_transaction(app):
+    with app.app_context():
+        user_id = create_user('owner')
+    client = app.test_client()
+    login(client, user_id)
+    first, second, third = create_todos(client, 3)
+
+    response = client.post('/api/todos/batch', json={'operations': [
+        {'op': 'update', 'id': first, 'data': {'completed': True}},
+        {'op': 'update', 'id': second, 'data': {'completed': True, 'date': '2026-01-02'}},
+        {'op': 'toggle_pin', 'id': third},
+        {'op': 'create', 'data': {'title': '새 할 일', 'date': '2026-01-03'}},
+    ]})
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [result['index'] for result in results] == [0, 1, 2, 3]
+    assert results[0]['todo']['completed'] is True
+    assert results[1]['todo']['date'] == '2026-01-02'
+    assert results[2]['todo']['pinned'] is True
+    assert results[3]['status'] == 201
+
+    response = client.post('/api/todos/batch', json={'operations': [
+        {'op': 'delete', 'id': first},
+        {'op': 'delete', 'id': second},
+    ]})
+    assert response.status_code == 200
+
+    todos = {todo['id']: todo for todo in client.get('/api/todos').get_json()}
+    assert set(todos) == {third, results[3]['todo']['id']}
+    assert todos[third]['pinned'] is True
+
+
+def test_batch_rejects_whole_batch_on_invalid_operation(app):
+    with app.app_context():
+        user_id = create_user('owner')
+        other_id = create_user('other')
+    client = app.test_client()
+    login(client, user_id)
+    todo_id, = create_todos(client, 1)
+
+    other = app.test_client()
+    login(other, other_id)
+    other_todo_id, = create_todos(other, 1)
+
+    response = client.post('/api/todos/batch', json={'operations': [
+        {'op': 'update', 'id': todo_id, 'data': {'completed': True}},
+        {'op': 'create', 'data': {'title': ''}},
+        {'op': 'delete', 'id': other_todo_id},
+        {'op': 'update', 'id': todo_id, 'data': {'date': '2026/01/01'}},
+    ]})
+    assert response.status_code == 400
+    assert [(result['index'], result['status']) for result in response.get_json()['results']] == [
+        (1, 400), (2, 404), (3, 400)
+    ]
+
+    with app.app_context():
+        assert Todo.query.get(todo_id).completed is False
+        assert Todo.query.get(other_todo_id) is not None
+
+
+def test_batch_statement_count_does_not_grow_with_rows(app):
+    with app.app_context():
+        user_id = create_user('owner')
+        follower_id = create_user('follower')
+    client = app.test_client()
+    login(client, user_id)
+    follower = app.test_client()
+    login(follower, follower_id)
+    follower.post(f'/api/users/{user_id}/follow')
+
+    def count_statements(operations):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            response = client.post('/api/todos/batch', json={'operations': operations})
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+        assert response.status_code == 200
+        return len(statements), response.get_json()['results']
+
+    def creates(count):
+        return [{'op': 'create', 'data': {'title': f'공개 {i}', 'date': '2026-01-01', 'is_public': True}}
+                for i in range(count)]
+
+    count_statements(creates(1))  # 요청 사용자 캐시 채우기
+    small, _ = count_statements(creates(2))
+    large, results = count_statements(creates(20))
+    assert large == small
+    assert [result['todo']['title'] for result in results] == [f'공개 {i}' for i in range(20)]
+    ids = [result['todo']['id'] for result in results]
+    assert len(set(ids)) == 20
+
+    small, _ = count_statements([{'op': 'update', 'id': todo_id, 'data': {'completed': True}} for todo_id in ids[:2]])
+    large, results = count_statements([{'op': 'update', 'id': todo_id, 'data': {'completed': True}}
+                                       for todo_id in ids[2:]])
+    assert large == small
+    assert all(result['todo']['completed'] is True for result in results)
+
+    # 새 공개 할 일은 팔로워 타임라인에 기록
+    feed = follower.get('/api/explore/todos', query_string={'limit': 50}).get_json()
+    assert {todo['id'] for todo in feed} >= set(ids)
+
+
+def test_batch_rejects_wrong_value_types(app):
+    with app.app_context():
+        user_id = create_user('owner')
+    client = app.test_client()
+    login(client, user_id)
+    todo_id, = create_todos(client, 1)
+
+    for data in ({'title': ['목록']}, {'date': None}, {'completed': {'a': 1}}, {'category_id': '1'},
+                 {'is_public': 'true'}):
+        response = client.post('/api/todos/batch', json={'operations': [
+            {'op': 'update', 'id': todo_id, 'data': data}]})
+        assert response.status_code == 400, data
+        assert client.put(f'/api/todos/{todo_id}', json=data).status_code == 400, data
+    response = client.post('/api/todos/batch', json={'operations': [
+        {'op': 'create', 'data': {'title': '할 일', 'date': None}}]})
+    assert response.status_code == 400
+
+
+def test_sync_returns_changes_and_tombstones_since_token(app):
+    app.config['SYNC_TOKEN_SAFETY_SECONDS'] = 0
+    with app.app_context():
+        user_id = create_user('owner')
+    client = app.test_client()
+    login(client, user_id)
+    kept, changed, removed = create_todos(client, 3)
+
+    full = client.get('/api/sync').get_json()
+    assert full['full'] is True
+    assert {todo['id'] for todo in full['todos']} == {kept, changed, removed}
+
+    client.put(f'/api/todos/{changed}', json={'completed': True})
+    client.delete(f'/api/todos/{removed}')
+    created = client.post('/api/todos', json={'title': '새 할 일', 'date': '2026-01-02'}).get_json()['id']
+
+    delta = client.get('/api/sync', query_string={'since': full['sync_token']}).get_json()
+    assert delta['full'] is False
+    assert {todo['id'] for todo in delta['todos']} == {changed, created}
+    assert delta['deleted'] == {'todos': [removed], 'categories': []}
+
+    # 다른 사용자의 토큰은 전체 동기화로 처리
+    with app.app_context():
+        other_id = create_user('other')
+    other = app.test_client()
+    login(other, other_id)
+    assert other.get('/api/sync', query_string={'since': delta['sync_token']}).get_json()['full'] is True
+
+
+def test_list_endpoints_answer_not_modified_until_data_changes(app):
+    with app.app_context():
+        user_id = create_user('owner')
+    client = app.test_client()
+    login(client, user_id)
+    todo_id, = create_todos(client, 1)
+
+    for url in ('/api/todos', '/api/topics', '/api/user/profile', '/api/notifications'):
+        response = client.get(url)
+        etag = response.headers['ETag']
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    first = client.get('/api/todos')
+    filtered = client.get('/api/todos?fields=id')
+    assert filtered.headers['ETag'] != first.headers['ETag']
+
+    client.put(f'/api/todos/{todo_id}', json={'completed': True})
+    response = client.get('/api/todos', headers={'If-None-Match': first.headers['ETag']})
+    assert response.status_code == 200
+    assert response.get_json()[0]['completed'] is True
+
+
+def test_todo_list_filters_pages_and_projects_fields(app):
+    with app.app_context():
+        user_id = create_user('owner')
+    client = app.test_client()
+    login(client, user_id)
+
+    # 같은 날짜(같은 정렬 시각)의 할 일이 여러 개 있어도 페이지 경계에서 빠지거나 겹치지 않아야 함
+    ids = []
+    for date in ('2026-01-01', '2026-01-02', '2026-01-03'):
+        ids += create_todos(client, 4, date=date)
+
+    # 날짜 범위 (양 끝 포함)
+    response = client.get('/api/todos', query_string={'from': '2026-01-02', 'to': '2026-01-02'})
+    assert [todo['id'] for todo in response.get_json()] == ids[4:8]
+    response = client.get('/api/todos', query_string={'from': '2026-01-02'})
+    assert [todo['id'] for todo in response.get_json()] == ids[4:]
+
+    # 커서로 끝까지 넘기면 모든 할 일이 정확히 한 번씩
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {'limit': 5}
+        if cursor:
+            params['cursor'] = cursor
+        response = client.get('/api/todos', query_string=params)
+        assert response.status_code == 200
+        page = response.get_json()
+        assert len(page) <= 5
+        seen += [todo['id'] for todo in page]
+        pages += 1
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+    assert seen == ids
+    assert pages == 3
+
+    # 마지막 페이지가 정확히 limit개여도 다음 커서 없음
+    response = client.get('/api/todos', query_string={'limit': 12})
+    assert len(response.get_json()) == 12
+    assert 'X-Next-Cursor' not in response.headers
+
+    # 필드 선택
+    response = client.get('/api/todos', query_string={'fields': 'id,title', 'limit': 1})
+    assert response.get_json() == [{'id': ids[0], 'title': '할 일 0'}]
+
+    # 잘못된 파라미터는 400과 한국어 메시지
+    for params in ({'cursor': 'not-a-cursor'}, {'from': '2026-13-01'}, {'to': '20260101'},
+                   {'fields': 'id,secret'}, {'limit': 'abc'}, {'limit': '0'}):
+        response = client.get('/api/todos', query_string=params)
+        assert response.status_code == 400, params
+        assert 'invalid literal' not in response.get_json()['error']
+    assert client.get('/api/todos', query_string={'limit': 'abc'}).get_json() == \
+        {'error': '페이지 크기는 정수여야 합니다.'}
+
+
+def test_todo_stats_follow_writes_and_match_rebuild(app):
+    with app.app_context():
+        user_id = create_user('owner')
+    client = app.test_client()
+    login(client, user_id)
+
+    work = client.post('/api/topics', json={'name': '업무', 'color': '#111111'}).get_json()['id']
+    home = client.post('/api/topics', json={'name': '집', 'color': '#222222'}).get_json()['id']
+    first, second = create_todos(client, 2, category_id=work)
+    third, = create_todos(client, 1)
+
+    client.put(f'/api/todos/{first}', json={'completed': True})
+    client.put(f'/api/todos/{second}', json={'category_id': home})
+    client.post('/api/todos/batch', json={'operations': [
+        {'op': 'update', 'id': third, 'data': {'completed': True, 'category_id': home}},
+        {'op': 'create', 'data': {'title': '새 할 일', 'date': '2026-01-03', 'category_id': work}},
+    ]})
+    client.delete(f'/api/todos/{second}')
+    client.delete(f'/api/topics/{work}')
+
+    expected = {
+        'total_todos': 3,
+        'completed_todos': 2,
+        'completion_rate': 66.7,
+        'category_stats': {
+            '카테고리 없음': {'total': 2, 'completed': 1},
+            '집': {'total': 1, 'completed': 1},
+        }
+    }
+    assert client.get('/api/user/todos/stats').get_json() == expected
+
+    with app.app_context():
+        rebuild()
+    assert client.get('/api/user/todos/stats').get_json() == expected
+    assert client.get('/mypage').status_code == 200
+
+
+def test_search_ranks_filters_and_follows_writes(app):
+    with app.app_context():
+        user_id = create_user('owner')
+        other_id = create_user('other')
+    client = app.test_client()
+    login(client, user_id)
+    other = app.test_client()
+    login(other, other_id)
+
+    with app.app_context():
+        category = Category(name='건강', user_id=user_id)
+        db.session.add(category)
+        db.session.commit()
+        category_id = category.id
+    running = client.post('/api/todos', json={'title': '아침 달리기 운동', 'date': '2026-01-01',
+                                              'category_id': category_id}).get_json()['id']
+    gym = client.post('/api/todos', json={'title': '헬스장', 'description': '하체 운동 운동 운동',
+                                          'date': '2026-01-02'}).get_json()['id']
+    client.post('/api/todos', json={'title': '장보기', 'date': '2026-01-03'})
+    other.post('/api/todos', json={'title': '달리기 운동', 'date': '2026-01-01'})
+
+    def search(**params):
+        response = client.get('/api/todos/search', query_string=params)
+        assert response.status_code == 200
+        return [todo['id'] for todo in response.get_json()]
+
+    # 2글자 단어(색인 단위보다 짧음)와 3글자 이상 단어, 다른 사용자의 할 일은 제외
+    assert sorted(search(q='운동')) == sorted([running, gym])
+    assert search(q='달리기') == [running]
+    assert search(q='아침 운동') == [running]
+    assert search(q='하체 운동', completed='false') == [gym]
+    assert search(q='운동', category_id=category_id) == [running]
+    assert search(q='운동', category_id='none') == [gym]
+    assert search(q='운동', **{'from': '2026-01-02'}) == [gym]
+
+    # 관련도 순 (단어가 더 많이 나오는 할 일 먼저)
+    light = client.post('/api/todos', json={'title': '스트레칭', 'date': '2026-01-05'}).get_json()['id']
+    heavy = client.post('/api/todos', json={'title': '스트레칭', 'description': '스트레칭 스트레칭 스트레칭',
+                                            'date': '2026-01-04'}).get_json()['id']
+    assert search(q='스트레칭') == [heavy, light]
+
+    # 페이지네이션
+    response = client.get('/api/todos/search', query_string={'q': '운동', 'limit': 1})
+    assert len(response.get_json()) == 1
+    assert response.headers['X-Next-Offset'] == '1'
+    assert len(search(q='운동', limit=1, offset=1)) == 1
+
+    # 수정/삭제가 색인에 반영됨
+    client.put(f'/api/todos/{running}', json={'title': '저녁 산책'})
+    assert search(q='달리기') == []
+    assert search(q='저녁 산책') == [running]
+    client.delete(f'/api/todos/{running}')
+    assert search(q='산책') == []
+
+    assert client.get('/api/todos/search').status_code == 400
+    assert client.get('/api/todos/search', query_string={'q': '운동', 'completed': 'x'}).status_code == 400
+    for params in ({'offset': 'x'}, {'category_id': 'x'}):
+        response = client.get('/api/todos/search', query_string=dict(params, q='운동'))
+        assert response.status_code == 400
+        assert 'invalid literal' not in response.get_json()['error']
+
+
+def test_category_delete_merge_and_recategorize_are_set_based(app):
+    with app.app_context():
+        user_id = create_user('owner')
+        other_id = create_user('other')
+    client = app.test_client()
+    login(client, user_id)
+
+    def topic(name):
+        return client.post('/api/topics', json={'name': name, 'color': '#111111'}).get_json()['id']
+
+    work, home, study, hobby = topic('업무'), topic('집'), topic('공부'), topic('취미')
+    work_todos = create_todos(client, 3, category_id=work)
+    client.put(f'/api/todos/{work_todos[0]}', json={'completed': True})
+    home_todos = create_todos(client, 2, category_id=home)
+    loose, = create_todos(client, 1)
+    other = app.test_client()
+    login(other, other_id)
+    foreign, = create_todos(other, 1)
+
+    def todo_categories():
+        return {todo['id']: todo['category_id'] for todo in client.get('/api/todos').get_json()}
+
+    # 삭제 + 재배정: 카테고리 크기와 관계없이 todo UPDATE 한 번
+    todo_updates = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('UPDATE TODO '):
+            todo_updates.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.delete(f'/api/topics/{work}', query_string={'reassign_to': study})
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    assert response.get_json() == {'success': True, 'moved': 3}
+    assert len(todo_updates) == 1
+    assert all(todo_categories()[todo_id] == study for todo_id in work_todos)
+
+    # 병합: 할 일을 옮기고 원래 카테고리 삭제
+    response = client.post(f'/api/topics/{home}/merge', json={'into': study})
+    assert response.get_json()['moved'] == 2
+    assert response.get_json()['category']['id'] == study
+    assert {category['id'] for category in client.get('/api/topics').get_json()} == {study, hobby}
+
+    # 선택한 할 일만 변경 (다른 사용자의 할 일, 이미 같은 카테고리인 할 일은 제외)
+    response = client.post('/api/todos/recategorize', json={
+        'ids': [work_todos[0], home_todos[0], loose, foreign], 'category_id': hobby})
+    assert response.get_json() == {'success': True, 'updated': 3}
+    response = client.post('/api/todos/recategorize', json={'ids': [loose], 'category_id': hobby})
+    assert response.get_json()['updated'] == 0
+    client.post('/api/todos/recategorize', json={'ids': [home_todos[1]], 'category_id': None})
+    assert todo_categories() == {work_todos[0]: hobby, work_todos[1]: study, work_todos[2]: study,
+                                 home_todos[0]: hobby, home_todos[1]: None, loose: hobby}
+
+    # 잘못된 요청
+    assert client.delete(f'/api/topics/{study}', query_string={'reassign_to': work}).status_code == 404
+    assert client.delete(f'/api/topics/{study}', query_string={'reassign_to': 'x'}).status_code == 400
+    assert client.post(f'/api/topics/{study}/merge', json={'into': study}).status_code == 400
+    assert client.post('/api/todos/recategorize', json={'ids': [loose], 'category_id': work}).status_code == 404
+    assert client.post('/api/todos/recategorize', json={'ids': [], 'category_id': None}).status_code == 400
+
+    expected = {
+        'total_todos': 6,
+        'completed_todos': 1,
+        'completion_rate': 16.7,
+        'category_stats': {
+            '공부': {'total': 2, 'completed': 0},
+            '취미': {'total': 3, 'completed': 1},
+            '카테고리 없음': {'total': 1, 'completed': 0},
+        }
+    }
+    assert client.get('/api/user/todos/stats').get_json() == expected
+    with app.app_context():
+        rebuild()
+    assert client.get('/api/user/todos/stats').get_json() == expected
+
+    # 옮긴 할 일과 삭제한 카테고리는 증분 동기화에 포함
+    sync = client.get('/api/sync').get_json()
+    changes = client.get('/api/sync', query_string={'since': sync['sync_token']}).get_json()
+    assert set(changes['deleted']['categories']) >= {work, home}
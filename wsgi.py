@@ -0,0 +1,8 @@
+# wsgi.py
+import os
+from app import create_app
+
+# 운영 WSGI 진입점 (gunicorn wsgi:app, 설정은 gunicorn.conf.py)
+# 환경 변수에서 설정 모드를 가져오거나, 기본값으로 'production' 사용
+config_name = os.environ.get('FLASK_ENV', 'production')
+app = create_app(config_name)